@@ -0,0 +1,42 @@
+"""
+Reusable helpers for CLI programs: input validation, menus and async I/O.
+
+Nothing is imported up front. The names below load their module on first
+access (PEP 562), so short-lived tools only pay for what they use:
+
+    from MyLibrary import validate_number   # imports MyLibrary.input_validators only
+"""
+import importlib
+
+_LAZY = {
+    "validate_number": "input_validators",
+    "validate_choice": "input_validators",
+    "NumberValidator": "input_validators",
+    "ChoiceValidator": "input_validators",
+    "ValidationResult": "input_validators",
+    "ChoiceMatcher": "choice_matcher",
+    "Menu": "menu",
+    "NestedMenu": "menu_tree",
+    "MenuNavigator": "menu_tree",
+    "AsyncConsole": "async_io",
+    "StreamSession": "async_io",
+}
+
+_SUBMODULES = {"input_validators", "choice_matcher", "menu", "menu_tree", "async_io", "instrumentation"}
+
+__all__ = sorted(_LAZY)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | _SUBMODULES)
@@ -0,0 +1,62 @@
+import asyncio
+import sys
+
+
+class AsyncConsole:
+    """Async prompt/print backend for a local terminal.
+
+    `input()` blocks, so it runs in the default thread pool executor; the
+    event loop stays free for other sessions while the user types.
+
+    Every async backend provides the same two coroutines:
+        ask(prompt) -> str   Show prompt (no newline) and return one line of input.
+        say(text)            Show text followed by a newline, like print().
+    """
+
+    async def ask(self, prompt: str = "") -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, input, prompt)
+
+    async def say(self, text: str = "") -> None:
+        sys.stdout.write(f"{text}\n")
+
+
+class StreamSession:
+    """Async prompt/print backend over an asyncio stream (e.g. a TCP connection).
+
+    Each prompt is sent and flushed, then one line is read back. Text is
+    UTF-8 and lines may end in "\\n" or "\\r\\n".
+
+    Attributes:
+        reader (asyncio.StreamReader): The client's input stream.
+        writer (asyncio.StreamWriter): The client's output stream.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+
+    async def ask(self, prompt: str = "") -> str:
+        """Send a prompt and wait for one line.
+
+        Raises:
+            EOFError: If the client closed the connection, like input() at end of file.
+        """
+        self.writer.write(prompt.encode())
+        await self.writer.drain()
+        line = await self.reader.readline()
+        if not line:
+            raise EOFError("Client disconnected.")
+        return line.decode(errors="replace").rstrip("\r\n")
+
+    async def say(self, text: str = "") -> None:
+        self.writer.write(f"{text}\n".encode())
+        await self.writer.drain()
+
+    async def close(self) -> None:
+        """Close the connection, ignoring errors from clients that already left."""
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
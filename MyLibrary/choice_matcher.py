@@ -0,0 +1,178 @@
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+
+class MatchResult(NamedTuple):
+    """
+    The outcome of looking up one input in a ChoiceMatcher.
+
+    Attributes:
+        option: The matched option (original spelling), or None.
+        how: "exact", "prefix" or "abbreviation" when matched, otherwise None.
+        candidates: Options the input could refer to when it is ambiguous or unknown.
+    """
+    option: Optional[str]
+    how: Optional[str] = None
+    candidates: tuple = ()
+
+
+class _TrieNode:
+    __slots__ = ("children", "count", "option")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.count = 0        # number of options at or below this node
+        self.option = None    # the option ending exactly here, if any
+
+
+class ChoiceMatcher:
+    """
+    Case-insensitive option lookup that also accepts unique prefixes and abbreviations.
+
+    The options are indexed once: a hash map of case-folded options for exact
+    matches, a prefix trie that counts the options below every node, and a map
+    of word initials ("United Arab Emirates" -> "UAE"). A lookup therefore
+    costs O(length of the input), however many options there are.
+
+    Example:
+        >>> countries = ChoiceMatcher(["Pakistan", "Panama", "Peru", "United Arab Emirates"])
+        >>> countries.match("pak").option
+        'Pakistan'
+        >>> countries.match("pa").candidates
+        ('Pakistan', 'Panama')
+        >>> countries.match("uae").option
+        'United Arab Emirates'
+    """
+
+    def __init__(self, options: Iterable[str], allow_prefix: bool = True,
+                 allow_abbreviation: bool = True) -> None:
+        """
+        Index the options.
+
+        Args:
+            options: The acceptable options. Duplicates (ignoring case) are dropped.
+            allow_prefix: Accept any prefix that matches exactly one option. Defaults to True.
+            allow_abbreviation: Accept the initials of multi-word options. Defaults to True.
+
+        Raises:
+            ValueError: If there are no options.
+        """
+        self.allow_prefix = allow_prefix
+        self.allow_abbreviation = allow_abbreviation
+        self._exact: Dict[str, str] = {}
+        self._root = _TrieNode()
+        self._abbreviations: Dict[str, List[str]] = {}
+
+        for option in options:
+            key = option.casefold()
+            if key in self._exact:
+                continue
+            self._exact[key] = option
+            self._insert(key, option)
+            words = key.split()
+            if len(words) > 1:
+                initials = "".join(word[0] for word in words)
+                self._abbreviations.setdefault(initials, []).append(option)
+
+        if not self._exact:
+            raise ValueError("Options list cannot be empty.")
+
+    def _insert(self, key, option):
+        node = self._root
+        node.count += 1
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _TrieNode()
+            node = child
+            node.count += 1
+        node.option = option
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    def __contains__(self, text: str) -> bool:
+        return text.strip().casefold() in self._exact
+
+    def _walk(self, key):
+        """Follow key down the trie; return the deepest node reached and whether the whole key matched."""
+        node = self._root
+        for char in key:
+            child = node.children.get(char)
+            if child is None:
+                return node, False
+            node = child
+        return node, True
+
+    def _collect(self, node, limit):
+        """Return up to `limit` options at or below node, in alphabetical order."""
+        found = []
+        stack = [node]
+        while stack and len(found) < limit:
+            current = stack.pop()
+            if current.option is not None:
+                found.append(current.option)
+            stack.extend(current.children[char] for char in sorted(current.children, reverse=True))
+        return found
+
+    def match(self, text: str, suggestions: int = 5) -> MatchResult:
+        """
+        Resolve an input to one option.
+
+        Args:
+            text: The raw input; case and surrounding whitespace are ignored.
+            suggestions: Maximum number of candidates to return when there is no unique match.
+
+        Returns:
+            A MatchResult with the option, or with candidates if the input is
+            ambiguous (several options share the prefix) or unknown (nearest options).
+        """
+        key = text.strip().casefold()
+        option = self._exact.get(key)
+        if option is not None:
+            return MatchResult(option, "exact")
+        if not key:
+            return MatchResult(None)
+
+        node, complete = self._walk(key)
+        if complete and self.allow_prefix and node.count == 1:
+            return MatchResult(self._collect(node, 1)[0], "prefix")
+
+        if self.allow_abbreviation:
+            expansions = self._abbreviations.get(key.replace(" ", ""), ())
+            if len(expansions) == 1:
+                return MatchResult(expansions[0], "abbreviation")
+
+        return MatchResult(None, None, tuple(self._suggest(key, suggestions, node, complete)))
+
+    def resolve(self, text: str) -> Optional[str]:
+        """Return the option the input refers to, or None if there is no unique match."""
+        return self.match(text, 0).option
+
+    def suggest(self, text: str, limit: int = 5) -> List[str]:
+        """
+        Return the options closest to an input that did not match.
+
+        Options sharing the longest prefix with the input come first; if the
+        input shares no prefix with any option, fuzzy matching is used instead.
+
+        Args:
+            text: The raw input.
+            limit: Maximum number of suggestions.
+
+        Returns:
+            Up to `limit` option strings.
+        """
+        key = text.strip().casefold()
+        return self._suggest(key, limit, *self._walk(key))
+
+    def _suggest(self, key, limit, node, complete):
+        if limit <= 0:
+            return []
+        if node is not self._root and (complete or node.count <= limit):
+            return self._collect(node, limit)
+        from difflib import get_close_matches  # only needed for unknown input
+
+        close = get_close_matches(key, list(self._exact), n=limit, cutoff=0.6)
+        if close:
+            return [self._exact[match] for match in close]
+        return self._collect(node, limit) if node is not self._root else []
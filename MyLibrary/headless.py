@@ -0,0 +1,250 @@
+import builtins
+import io
+import sys
+import time
+from array import array
+from typing import Any, Callable, Iterable, List, NamedTuple, Optional, Sequence
+
+
+class ScriptExhausted(EOFError):
+    """Raised by input() when a session asks for more lines than its script has."""
+
+
+class _NullWriter:
+    """A write-only text stream that throws everything away."""
+
+    encoding = "utf-8"
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+    def isatty(self) -> bool:
+        return False
+
+
+class _CaptureWriter(io.StringIO):
+    """A StringIO that reports an encoding, like a real sys.stdout."""
+
+    encoding = "utf-8"
+
+
+class ScriptedIO:
+    """
+    Replaces input() and sys.stdout so CLI code runs without a terminal.
+
+    Every input() call returns the next line of the script, and everything
+    printed is discarded or, with capture=True, collected. The time the
+    program spends between one input() and the next is recorded as one step,
+    so `step_times` shows how long each screen took to process and render.
+
+    Example:
+        >>> with ScriptedIO(["abc", "42"], capture=True) as script:
+        ...     validate_number("Enter a number: ")
+        42
+        >>> script.consumed, "Error" in script.output
+        (2, True)
+    """
+
+    def __init__(self, lines: Sequence[str], capture: bool = False) -> None:
+        """
+        Args:
+            lines: The inputs, in the order the program asks for them.
+            capture (bool): Keep the printed output in `output`. Defaults to False.
+        """
+        self.lines = lines
+        self.capture = capture
+        self.step_times = array("d")
+        self.output: Optional[str] = None
+        self._position = 0
+        self._stream = _CaptureWriter() if capture else _NullWriter()
+        self._last = 0.0
+        self._saved = None  # the real input and stdout while active
+
+    def _input(self, prompt: str = "") -> str:
+        now = time.perf_counter()
+        self.step_times.append(now - self._last)
+        if self._position >= len(self.lines):
+            raise ScriptExhausted(f"Script ended after {len(self.lines)} inputs.")
+        if prompt:
+            self._stream.write(str(prompt))
+        line = self.lines[self._position]
+        self._position += 1
+        self._last = time.perf_counter()
+        return line
+
+    @property
+    def consumed(self) -> int:
+        """Number of script lines used so far."""
+        return self._position
+
+    def __enter__(self) -> "ScriptedIO":
+        self._saved = builtins.input, sys.stdout
+        builtins.input, sys.stdout = self._input, self._stream
+        self._last = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._saved is None:
+            return  # never entered
+        self.step_times.append(time.perf_counter() - self._last)  # after the last input
+        builtins.input, sys.stdout = self._saved
+        self._saved = None
+        if self.capture:
+            self.output = self._stream.getvalue()
+
+
+class SessionResult(NamedTuple):
+    """
+    The outcome of replaying one script.
+
+    Attributes:
+        value: What the flow returned (None if it raised).
+        error (str or None): "ExceptionType: message" if the flow raised.
+        step_times (array): Seconds spent processing each step.
+        output (str or None): Printed output, when captured.
+    """
+    value: Any
+    error: Optional[str]
+    step_times: array
+    output: Optional[str]
+
+
+def run_session(flow: Callable[[], Any], lines: Sequence[str], capture: bool = False) -> SessionResult:
+    """
+    Run one CLI flow with scripted input.
+
+    Args:
+        flow: A function with no arguments, e.g. functools.partial(quiz, questions, False).
+        lines: The inputs for this session.
+        capture (bool): Keep the printed output. Defaults to False.
+
+    Returns:
+        SessionResult: The return value or error, step timings and output.
+    """
+    script = ScriptedIO(lines, capture)
+    value, error = None, None
+    with script:
+        try:
+            value = flow()
+        except Exception as e:  # a failing session is reported, not fatal
+            error = f"{type(e).__name__}: {e}"
+    return SessionResult(value, error, script.step_times, script.output)
+
+
+class LoadReport(NamedTuple):
+    """
+    Throughput and latency for a batch of replayed sessions.
+
+    Attributes:
+        sessions (int): Sessions replayed.
+        failures (int): Sessions whose flow raised (including running out of script).
+        seconds (float): Wall-clock time for the whole batch.
+        steps (int): Steps (input() calls plus the final step of each session).
+        step_percentiles (dict): Step latency in seconds at the 50th, 90th, 99th
+                                 and 100th percentiles.
+        errors (list): Up to 10 example error messages.
+    """
+    sessions: int
+    failures: int
+    seconds: float
+    steps: int
+    step_percentiles: dict
+    errors: List[str]
+
+    @property
+    def sessions_per_second(self) -> float:
+        return self.sessions / self.seconds if self.seconds else 0.0
+
+    def summary(self) -> str:
+        """Return the report as a few readable lines."""
+        latency = ", ".join(f"p{p}={value * 1e6:.0f}us" for p, value in self.step_percentiles.items())
+        return (f"{self.sessions} sessions in {self.seconds:.3f}s "
+                f"({self.sessions_per_second:.0f}/s), {self.failures} failed\n"
+                f"{self.steps} steps: {latency}")
+
+
+def _replay_batch(flow, scripts):
+    """Replay scripts in this process; returns (failures, all step times, example errors)."""
+    failures = 0
+    times = array("d")
+    errors = []
+    for lines in scripts:
+        result = run_session(flow, lines)
+        times.extend(result.step_times)
+        if result.error is not None:
+            failures += 1
+            if len(errors) < 10:
+                errors.append(result.error)
+    return failures, times, errors
+
+
+def _percentiles(times, points=(50, 90, 99, 100)):
+    if not times:
+        return {p: 0.0 for p in points}
+    ordered = sorted(times)
+    return {p: ordered[min(len(ordered) - 1, len(ordered) * p // 100)] for p in points}
+
+
+def replay_sessions(flow: Callable[[], Any], scripts: Iterable[Sequence[str]],
+                    processes: Optional[int] = None, batch_size: int = 100) -> LoadReport:
+    """
+    Replay many recorded sessions back to back and measure throughput.
+
+    Args:
+        flow: A function with no arguments that runs one session. With processes,
+              it must be picklable (a module-level function or a functools.partial of one).
+        scripts: One list of input lines per session.
+        processes (int, optional): Spread sessions over this many worker processes.
+                                   Defaults to None (run in this process).
+        batch_size (int): Sessions sent to a worker at a time. Defaults to 100.
+
+    Returns:
+        LoadReport: Sessions per second, failures and per-step latency percentiles.
+    """
+    scripts = [list(lines) for lines in scripts]
+    start = time.perf_counter()
+    if processes and processes > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        batches = [scripts[i:i + batch_size] for i in range(0, len(scripts), batch_size)]
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            parts = list(executor.map(_replay_batch, [flow] * len(batches), batches))
+    else:
+        parts = [_replay_batch(flow, scripts)]
+    seconds = time.perf_counter() - start
+
+    times = array("d")
+    failures, errors = 0, []
+    for part_failures, part_times, part_errors in parts:
+        failures += part_failures
+        times.extend(part_times)
+        errors.extend(part_errors[:10 - len(errors)])
+    return LoadReport(len(scripts), failures, seconds, len(times), _percentiles(times), errors)
+
+
+def load_scripts(path: str, separator: str = "---") -> List[List[str]]:
+    """
+    Read recorded sessions from a text file.
+
+    The file holds one input per line; sessions are separated by a line
+    containing only the separator. Empty lines are kept, since pressing
+    Enter is a valid input.
+
+    Returns:
+        list: One list of input lines per session.
+    """
+    scripts, current = [], []
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            line = line.rstrip("\r\n")
+            if line == separator:
+                scripts.append(current)
+                current = []
+            else:
+                current.append(line)
+    if current:
+        scripts.append(current)
+    return scripts
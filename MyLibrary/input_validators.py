@@ -1,13 +1,287 @@
-from typing import List, Union, Optional
+from time import perf_counter
+from typing import Any, Iterable, List, NamedTuple, Union, Optional
+from MyLibrary import instrumentation
+from MyLibrary.choice_matcher import ChoiceMatcher
 
+# Error codes reported by the validators in ValidationResult.code
+NOT_A_NUMBER = "not_a_number"
+NOT_WHOLE_NUMBER = "not_whole_number"
+WRONG_LENGTH = "wrong_length"
+TOO_SHORT = "too_short"
+TOO_LONG = "too_long"
+OUT_OF_RANGE = "out_of_range"
+INVALID_CHOICE = "invalid_choice"
 
-def validate_choice(prompt: str, options: List[str]) -> str:
+
+class ValidationResult(NamedTuple):
+    """
+    The outcome of validating one input string.
+
+    Attributes:
+        ok: True if the input passed every check.
+        value: The converted value if ok, otherwise None.
+        code: One of the module's error codes if not ok, otherwise None.
+        message: A user-facing explanation if not ok, otherwise None.
+    """
+    ok: bool
+    value: Any = None
+    code: Optional[str] = None
+    message: Optional[str] = None
+
+
+def _failure(code: str, message: str) -> ValidationResult:
+    return ValidationResult(False, None, code, message)
+
+
+class NumberValidator:
+    """
+    The rules of `validate_number`, checked without prompting.
+
+    All constraint arguments are checked and turned into a list of check
+    functions once, in the constructor, so validating a value only runs the
+    checks that actually apply. Use it to validate CSV columns, API payloads
+    or any other strings; `validate_number` is a thin interactive wrapper.
+
+    Example:
+        >>> year = NumberValidator(exact_length=4)
+        >>> year.validate("2024")
+        ValidationResult(ok=True, value=2024, code=None, message=None)
+        >>> year.validate("99").code
+        'wrong_length'
+    """
+
+    def __init__(
+        self,
+        min_val: Optional[Union[float, int]] = None,
+        max_val: Optional[Union[float, int]] = None,
+        num_type: Optional[type] = None,
+        allow_equal: bool = True,
+        exact_length: Optional[int] = None,
+        min_length: Optional[int] = None,
+        max_length: Optional[int] = None
+    ) -> None:
+        """
+        Compile the constraints. The arguments are the same as for `validate_number`.
+
+        Raises:
+            ValueError: If conflicting constraints are provided.
+        """
+        if exact_length is not None and (min_length is not None or max_length is not None):
+            raise ValueError("Cannot specify exact_length together with min_length or max_length.")
+
+        if min_length is not None and max_length is not None and min_length > max_length:
+            raise ValueError("min_length cannot be greater than max_length.")
+
+        self.num_type = num_type
+        self._length_checks = self._compile_length_checks(exact_length, min_length, max_length)
+        self._range_check = self._compile_range_check(min_val, max_val, allow_equal)
+
+    @staticmethod
+    def _compile_length_checks(exact_length, min_length, max_length):
+        checks = []
+        if exact_length is not None:
+            checks.append((lambda n: n == exact_length, WRONG_LENGTH,
+                           f"Your number must be exactly {exact_length} digits long."))
+        if min_length is not None:
+            checks.append((lambda n: n >= min_length, TOO_SHORT,
+                           f"Your number must have at least {min_length} digits."))
+        if max_length is not None:
+            checks.append((lambda n: n <= max_length, TOO_LONG,
+                           f"Your number can have at most {max_length} digits."))
+        return checks
+
+    @staticmethod
+    def _compile_range_check(min_val, max_val, allow_equal):
+        if min_val is not None and max_val is not None:
+            if allow_equal:
+                return (lambda x: min_val <= x <= max_val,
+                        f"Please enter a number between {min_val} and {max_val}.")
+            return (lambda x: min_val < x < max_val,
+                    f"Please enter a number between {min_val} and {max_val}, not including those exact values.")
+        if min_val is not None:
+            if allow_equal:
+                return lambda x: x >= min_val, f"Please enter a number greater than or equal to {min_val}."
+            return lambda x: x > min_val, f"Please enter a number greater than {min_val}."
+        if max_val is not None:
+            if allow_equal:
+                return lambda x: x <= max_val, f"Please enter a number less than or equal to {max_val}."
+            return lambda x: x < max_val, f"Please enter a number less than {max_val}."
+        return None
+
+    def _convert(self, text: str):
+        """Convert the text to int or float, returning a ValidationResult on failure."""
+        num_type = self.num_type
+        try:
+            # Try int first if there's no decimal point
+            if '.' not in text:
+                try:
+                    number = int(text)
+                    return float(number) if num_type == float else number
+                except ValueError:
+                    if num_type == int:
+                        return _failure(NOT_WHOLE_NUMBER, "Please enter a whole number (like 42).")
+                    return float(text)
+            number = float(text)
+        except ValueError:
+            return _failure(NOT_A_NUMBER, "Invalid input! Please enter a valid number.")
+        if num_type == int:
+            if not number.is_integer():
+                return _failure(NOT_WHOLE_NUMBER, "Please enter a whole number without decimals.")
+            number = int(number)
+        return number
+
+    def validate(self, text: str) -> ValidationResult:
+        """
+        Validate and convert one input string.
+
+        Args:
+            text: The raw input; surrounding whitespace is ignored.
+
+        Returns:
+            A ValidationResult holding the number, or the error code and message.
+        """
+        text = text.strip()
+
+        # Digit counting (remove dot and sign)
+        digits_only = text.replace('.', '').lstrip('+-')
+        if not digits_only.isdigit():
+            return _failure(NOT_A_NUMBER, "Invalid input! Please enter a valid number.")
+
+        number = self._convert(text)
+        if isinstance(number, ValidationResult):
+            return number
+
+        digit_count = len(digits_only)
+        for check, code, message in self._length_checks:
+            if not check(digit_count):
+                return _failure(code, message)
+
+        if self._range_check is not None:
+            in_range, message = self._range_check
+            if not in_range(number):
+                return _failure(OUT_OF_RANGE, message)
+
+        return ValidationResult(True, number)
+
+    def validate_many(self, texts: Iterable[str]) -> List[ValidationResult]:
+        """
+        Validate a batch of input strings, e.g. one column of a CSV file.
+
+        Args:
+            texts: The raw inputs.
+
+        Returns:
+            One ValidationResult per input, in order.
+        """
+        validate = self.validate
+        return [validate(text) for text in texts]
+
+    def is_valid(self, text: str) -> bool:
+        """Return True if the text passes every check."""
+        return self.validate(text).ok
+
+
+class ChoiceValidator:
+    """
+    The rules of `validate_choice`, checked without prompting.
+
+    The case-folded option set and the prompt text are built once in the
+    constructor; `validate_choice` is a thin interactive wrapper. With
+    allow_prefix, lookups go through a `ChoiceMatcher` instead, which also
+    resolves unique prefixes and abbreviations and suggests near misses.
+
+    Example:
+        >>> colors = ChoiceValidator(["red", "green", "blue"])
+        >>> colors.validate(" Red ")
+        ValidationResult(ok=True, value='RED', code=None, message=None)
+    """
+
+    def __init__(self, options: List[str], allow_prefix: bool = False) -> None:
+        """
+        Index the options.
+
+        Args:
+            options: A list of acceptable string options (case-insensitive).
+            allow_prefix: Accept unique prefixes and initials of options. Defaults to False.
+
+        Raises:
+            ValueError: If the options list is empty.
+        """
+        if len(options) == 0:
+            raise ValueError("Options list cannot be empty.")
+        elif len(options) == 1:
+            options_str = options[0]
+        elif len(options) == 2:
+            options_str = f"{options[0]} or {options[1]}"
+        else:
+            options_str = ', '.join(options[:-1]) + f", or {options[-1]}"
+
+        self.options = list(options)
+        self.options_str = options_str
+        self._folded = {option.upper() for option in options}
+        self._matcher = ChoiceMatcher(options) if allow_prefix else None
+
+    def format_prompt(self, prompt: str) -> str:
+        """Return the prompt followed by the list of options."""
+        return f"{prompt} ({self.options_str}): "
+
+    def validate(self, text: str) -> ValidationResult:
+        """
+        Validate one input string.
+
+        Args:
+            text: The raw input; case and surrounding whitespace are ignored.
+
+        Returns:
+            A ValidationResult holding the option in uppercase, or the error code and message.
+        """
+        choice = text.strip().upper()
+        if choice in self._folded:
+            return ValidationResult(True, choice)
+        if self._matcher is None:
+            return _failure(INVALID_CHOICE, "Please select one of the available options.")
+
+        match = self._matcher.match(text)
+        if match.option is not None:
+            return ValidationResult(True, match.option.upper())
+        message = "Please select one of the available options."
+        if match.candidates:
+            message += f" Did you mean: {', '.join(match.candidates)}?"
+        return _failure(INVALID_CHOICE, message)
+
+    def validate_many(self, texts: Iterable[str]) -> List[ValidationResult]:
+        """Validate a batch of input strings, returning one ValidationResult per input."""
+        validate = self.validate
+        return [validate(text) for text in texts]
+
+    def is_valid(self, text: str) -> bool:
+        """Return True if the text is one of the options."""
+        return self.validate(text).ok
+
+
+def _prompt_instrumented(metrics, validator, prompt: str, error_prefix: str) -> Any:
+    """The prompt loop of validate_number/validate_choice, recording attempts, errors and latency."""
+    label = metrics.prompt_label(prompt)
+    start = perf_counter()
+    while True:
+        result = validator.validate(input(prompt))
+        metrics.inc("prompt_attempts_total", prompt=label)
+        if result.ok:
+            metrics.observe("prompt_seconds", perf_counter() - start, prompt=label)
+            return result.value
+        metrics.inc("prompt_invalid_total", prompt=label, code=result.code)
+        print(f"\n{error_prefix}{result.message}")
+
+
+def validate_choice(prompt: str, options: List[str], allow_prefix: bool = False) -> str:
     """
     Validate user input against a list of acceptable string options.
 
     Args:
         prompt: The message displayed to the user for input.
         options: A list of acceptable string options (case-insensitive).
+        allow_prefix: Also accept unique prefixes and initials of options, and
+                      suggest the closest options after a miss. Defaults to False.
 
     Returns:
         The validated user input, matched to one of the options (in uppercase).
@@ -16,21 +290,37 @@ def validate_choice(prompt: str, options: List[str]) -> str:
         >>> validate_choice("Choose a color", ["red", "green", "blue"])
         Choose a color (red, green, blue): 
     """
-    if len(options) == 0:
-        raise ValueError("Options list cannot be empty.")
-    elif len(options) == 1:
-        options_str = options[0]
-    elif len(options) == 2:
-        options_str = f"{options[0]} or {options[1]}"
-    else:
-        options_str = ', '.join(options[:-1]) + f", or {options[-1]}"
-
-    full_prompt = f"{prompt} ({options_str}): "
+    validator = ChoiceValidator(options, allow_prefix)
+    full_prompt = validator.format_prompt(prompt)
+    metrics = instrumentation.metrics
+    if metrics is not None:
+        return _prompt_instrumented(metrics, validator, full_prompt, "")
     while True:
-        user_input = input(full_prompt).strip().upper()
-        if user_input in [x.upper() for x in options]:
-            return user_input
-        print("\nPlease select one of the available options.")
+        result = validator.validate(input(full_prompt))
+        if result.ok:
+            return result.value
+        print(f"\n{result.message}")
+
+
+async def validate_choice_async(io, prompt: str, options: List[str], allow_prefix: bool = False) -> str:
+    """
+    Async variant of `validate_choice` that talks to an async I/O backend.
+
+    Args:
+        io: An object with `ask(prompt)` and `say(text)` coroutines, such as
+            `MyLibrary.async_io.AsyncConsole` or `StreamSession`.
+        prompt, options, allow_prefix: Same as for `validate_choice`.
+
+    Returns:
+        The validated option (in uppercase).
+    """
+    validator = ChoiceValidator(options, allow_prefix)
+    full_prompt = validator.format_prompt(prompt)
+    while True:
+        result = validator.validate(await io.ask(full_prompt))
+        if result.ok:
+            return result.value
+        await io.say(f"\n{result.message}")
 
 
 def validate_number(
@@ -77,76 +367,34 @@ def validate_number(
         >>> validate_number("Enter the year: ", exact_length=4)
     """
 
-    # Validate length constraints
-    if exact_length is not None and (min_length is not None or max_length is not None):
-        raise ValueError("Cannot specify exact_length together with min_length or max_length.")
-    
-    if min_length is not None and max_length is not None and min_length > max_length:
-        raise ValueError("min_length cannot be greater than max_length.")
-
+    validator = NumberValidator(min_val, max_val, num_type, allow_equal,
+                                exact_length, min_length, max_length)
+    metrics = instrumentation.metrics
+    if metrics is not None:
+        return _prompt_instrumented(metrics, validator, prompt, "Error: ")
     while True:
-        try:
-            user_input = input(prompt).strip()
-            
-            # Digit counting (remove dot and sign)
-            digits_only = user_input.replace('.', '').lstrip('+-')
-            if not digits_only.isdigit():
-                raise ValueError("Invalid input! Please enter a valid number.")    
+        result = validator.validate(input(prompt))
+        if result.ok:
+            return result.value
+        print(f"\nError: {result.message}")
 
-            # Try int first if there's no decimal point
-            if '.' not in user_input:
-                try:
-                    number = int(user_input)
-                    if num_type == float:
-                        number = float(number)
-                except ValueError:
-                    if num_type == int:
-                        raise ValueError("Please enter a whole number (like 42).")
-                    number = float(user_input)
-            else:
-                number = float(user_input)
-                if num_type == int:
-                    if not number.is_integer():
-                        raise ValueError("Please enter a whole number without decimals.")
-                    number = int(number)
-                        
-            # Length checks
-            if exact_length is not None:
-                if len(digits_only) != exact_length:
-                    raise ValueError(f"Your number must be exactly {exact_length} digits long.")
-            
-            if min_length is not None:
-                if len(digits_only) < min_length:
-                    raise ValueError(f"Your number must have at least {min_length} digits.")
-            
-            if max_length is not None:
-                if len(digits_only) > max_length:
-                    raise ValueError(f"Your number can have at most {max_length} digits.")
-            
-            # Value checks
-            if min_val is not None and max_val is not None:
-                if allow_equal:
-                    if not (min_val <= number <= max_val):
-                        raise ValueError(f"Please enter a number between {min_val} and {max_val}.")
-                else:
-                    if not (min_val < number < max_val):
-                        raise ValueError(f"Please enter a number between {min_val} and {max_val}, not including those exact values.")
-            elif min_val is not None:
-                if allow_equal:
-                    if number < min_val:
-                        raise ValueError(f"Please enter a number greater than or equal to {min_val}.")
-                else:
-                    if number <= min_val:
-                        raise ValueError(f"Please enter a number greater than {min_val}.")
-            elif max_val is not None:
-                if allow_equal:
-                    if number > max_val:
-                        raise ValueError(f"Please enter a number less than or equal to {max_val}.")
-                else:
-                    if number >= max_val:
-                        raise ValueError(f"Please enter a number less than {max_val}.")
-            
-            return number
-            
-        except ValueError as e:
-            print(f"\nError: {e}" if str(e) else "\nInvalid input! Please enter a valid number.")
\ No newline at end of file
+
+async def validate_number_async(io, prompt: str, *args, **kwargs) -> Union[float, int]:
+    """
+    Async variant of `validate_number` that talks to an async I/O backend.
+
+    Args:
+        io: An object with `ask(prompt)` and `say(text)` coroutines, such as
+            `MyLibrary.async_io.AsyncConsole` or `StreamSession`.
+        prompt: The message displayed to the user when requesting input.
+        *args, **kwargs: The constraints accepted by `validate_number`.
+
+    Returns:
+        int or float: The validated number entered by the user.
+    """
+    validator = NumberValidator(*args, **kwargs)
+    while True:
+        result = validator.validate(await io.ask(prompt))
+        if result.ok:
+            return result.value
+        await io.say(f"\nError: {result.message}")
@@ -0,0 +1,205 @@
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+# Upper bounds, in seconds, of the latency histogram buckets. People take
+# anything from a fraction of a second to minutes to answer a prompt.
+DEFAULT_BUCKETS = (0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0, 300.0)
+
+HELP = {
+    "prompt_attempts_total": "Inputs entered at a prompt, valid or not.",
+    "prompt_invalid_total": "Invalid inputs at a prompt, by validation error code.",
+    "prompt_seconds": "Time from showing a prompt to receiving a valid answer.",
+    "menu_choices_total": "Menu selections, by option number.",
+    "menu_choice_seconds": "Time taken to choose a menu option.",
+    "question_answers_total": "Answers to a question, by result.",
+    "question_answer_seconds": "Time taken to answer a question.",
+}
+
+# The active Metrics, or None when instrumentation is disabled. Instrumented
+# code checks this once per call and skips all bookkeeping when it is None.
+metrics: Optional["Metrics"] = None
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """Counts observations into fixed buckets and keeps their sum."""
+
+    __slots__ = ("bounds", "counts", "total", "count")
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)  # the last bucket is +Inf
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def cumulative(self) -> Iterator[Tuple[str, int]]:
+        """Yield (upper bound, observations at or below it), ending with "+Inf"."""
+        running = 0
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            running += count
+            yield ("+Inf" if bound == float("inf") else repr(bound)), running
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: LabelKey, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class Metrics:
+    """
+    Counters and latency histograms keyed by metric name and labels.
+
+    Example:
+        >>> metrics = Metrics()
+        >>> metrics.inc("prompt_invalid_total", prompt="Age", code="out_of_range")
+        >>> metrics.observe("prompt_seconds", 1.7, prompt="Age")
+        >>> print(metrics.to_prometheus())
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """
+        Args:
+            buckets: Upper bounds, in seconds, of the histogram buckets.
+        """
+        self.buckets = tuple(buckets)
+        self.counters: Dict[str, Dict[LabelKey, int]] = {}
+        self.histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self._prompt_id: Optional[str] = None
+
+    def inc(self, name: str, amount: int = 1, **labels: str) -> None:
+        """Add to a counter."""
+        series = self.counters.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        series[key] = series.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Record one value (usually seconds) in a histogram."""
+        series = self.histograms.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = Histogram(self.buckets)
+        histogram.observe(value)
+
+    def counter(self, name: str, **labels: str) -> int:
+        """Return a counter's current value (0 if never incremented)."""
+        return self.counters.get(name, {}).get(tuple(sorted(labels.items())), 0)
+
+    @contextmanager
+    def prompt_id(self, label: str):
+        """
+        Label the prompts shown inside the block with `label` instead of their text,
+        e.g. so every question's answer prompt is counted separately.
+        """
+        previous, self._prompt_id = self._prompt_id, label
+        try:
+            yield
+        finally:
+            self._prompt_id = previous
+
+    def prompt_label(self, prompt: str) -> str:
+        """Return the label for a prompt: the enclosing prompt_id, or the prompt text."""
+        return self._prompt_id if self._prompt_id is not None else prompt.strip()
+
+    def clear(self) -> None:
+        self.counters.clear()
+        self.histograms.clear()
+
+    def to_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines = []
+        for name, series in sorted(self.counters.items()):
+            if name in HELP:
+                lines.append(f"# HELP {name} {HELP[name]}")
+            lines.append(f"# TYPE {name} counter")
+            for labels, value in series.items():
+                lines.append(f"{name}{_format_labels(labels)} {value}")
+        for name, series in sorted(self.histograms.items()):
+            if name in HELP:
+                lines.append(f"# HELP {name} {HELP[name]}")
+            lines.append(f"# TYPE {name} histogram")
+            for labels, histogram in series.items():
+                for bound, count in histogram.cumulative():
+                    le = f'le="{bound}"'
+                    lines.append(f"{name}_bucket{_format_labels(labels, le)} {count}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {histogram.total!r}")
+                lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def to_dict(self) -> dict:
+        """Return all metrics as plain data (label sets become dicts)."""
+        return {
+            "counters": {name: [{"labels": dict(labels), "value": value}
+                                for labels, value in series.items()]
+                         for name, series in self.counters.items()},
+            "histograms": {name: [{"labels": dict(labels), "count": h.count, "sum": h.total,
+                                   "buckets": dict(h.cumulative())}
+                                  for labels, h in series.items()]
+                           for name, series in self.histograms.items()},
+        }
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        import json  # deferred so CLI tools that never export do not pay for it
+
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def write(self, path: str) -> None:
+        """Write the metrics to a file: JSON if path ends in ".json", Prometheus text otherwise."""
+        text = self.to_json() if path.endswith(".json") else self.to_prometheus()
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(text)
+
+
+def enable(registry: Optional[Metrics] = None) -> Metrics:
+    """
+    Turn instrumentation on.
+
+    Args:
+        registry (Metrics, optional): Where to record. Defaults to a new Metrics.
+
+    Returns:
+        Metrics: The active registry.
+    """
+    global metrics
+    metrics = registry if registry is not None else Metrics()
+    return metrics
+
+
+def disable() -> Optional[Metrics]:
+    """Turn instrumentation off and return the registry that was active, if any."""
+    global metrics
+    registry, metrics = metrics, None
+    return registry
+
+
+@contextmanager
+def instrumented(registry: Optional[Metrics] = None):
+    """
+    Enable instrumentation for the duration of a with-block.
+
+    Example:
+        >>> with instrumented() as metrics:
+        ...     quiz(questions)
+        >>> metrics.write("quiz_metrics.prom")
+    """
+    previous = metrics
+    try:
+        yield enable(registry)
+    finally:
+        if previous is None:
+            disable()
+        else:
+            enable(previous)
@@ -1,5 +1,112 @@
-from typing import List, Optional, Tuple, Union
-from MyLibrary.input_validators import validate_number
+import sys
+from time import perf_counter
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from MyLibrary import instrumentation
+from MyLibrary.input_validators import NumberValidator, validate_number, validate_number_async
+
+
+class OptionStore:
+    """An insertion-ordered set of menu options.
+
+    Options live in a dict (which keeps insertion order), so membership
+    checks, adding and removing are O(1). A positional list is built lazily
+    the first time an option is looked up by number after a change, so
+    rendering a page of a large menu does not rescan it every time.
+    """
+
+    __slots__ = ("_index", "_ordered")
+
+    def __init__(self, options: Iterable[str] = ()) -> None:
+        self._index = dict.fromkeys(options)
+        self._ordered: Optional[List[str]] = None
+
+    def add(self, option: str) -> None:
+        """Append an option (callers check for duplicates)."""
+        self._index[option] = None
+        self._ordered = None
+
+    def remove(self, option: str) -> bool:
+        """Remove an option, returning False if it was not present."""
+        if option in self._index:
+            del self._index[option]
+            self._ordered = None
+            return True
+        return False
+
+    def clear(self) -> None:
+        """Remove all options."""
+        self._index.clear()
+        self._ordered = None
+
+    def as_list(self) -> List[str]:
+        """Return the options in order (shared list; do not modify)."""
+        if self._ordered is None:
+            self._ordered = list(self._index)
+        return self._ordered
+
+    def window(self, start: int, count: int) -> List[str]:
+        """Return up to `count` options starting at 0-based position `start`."""
+        return self.as_list()[start:start + count]
+
+    def __getitem__(self, position: int) -> str:
+        return self.as_list()[position]
+
+    def __contains__(self, option: str) -> bool:
+        return option in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+class TypeAhead:
+    """Incremental, case-insensitive search over menu options.
+
+    Each query is remembered together with its matches. When the user types
+    more characters, only the previous matches are searched again; when they
+    delete characters, an earlier result is reused.
+
+    Example:
+        >>> search = TypeAhead(["Lahore", "Karachi", "Larkana"])
+        >>> search.set_query("la")
+        [(1, 'Lahore'), (3, 'Larkana')]
+        >>> search.set_query("lar")
+        [(3, 'Larkana')]
+    """
+
+    def __init__(self, options: Iterable[str]) -> None:
+        """Start with an empty query that matches every option.
+
+        Args:
+            options: The options to search, e.g. an OptionStore.
+        """
+        all_matches = list(enumerate(options, 1))
+        self._history: List[Tuple[str, List[Tuple[int, str]]]] = [("", all_matches)]
+
+    @property
+    def query(self) -> str:
+        """The current (case-folded) search text."""
+        return self._history[-1][0]
+
+    @property
+    def matches(self) -> List[Tuple[int, str]]:
+        """The (menu number, option) pairs matching the current query."""
+        return self._history[-1][1]
+
+    def set_query(self, query: str) -> List[Tuple[int, str]]:
+        """Change the search text and return the matching (number, option) pairs."""
+        folded = query.casefold()
+        history = self._history
+        while len(history) > 1 and not folded.startswith(history[-1][0]):
+            history.pop()
+        previous_query, previous_matches = history[-1]
+        if folded != previous_query:
+            matches = [(num, opt) for num, opt in previous_matches if folded in opt.casefold()]
+            history.append((folded, matches))
+        return self.matches
+
 
 class Menu:
     """A customizable menu system for console applications.
@@ -18,8 +125,10 @@ class Menu:
         Example:
             >>> menu = Menu(["Start Game", "Settings"], "Game Menu")
         """
-        self.__options = options.copy() if options else []
+        self.__options = OptionStore(options or ())
         self.menu_name = menu_name
+        # Rendered screens keyed by their display settings; see render()
+        self._render_cache: Dict[tuple, str] = {}
 
     def add_option(self, option: str) -> None:
         """Add a new option to the menu if valid and unique.
@@ -37,7 +146,8 @@ class Menu:
             raise ValueError("Option must be a non-empty string")
         if option in self.__options:
             raise ValueError(f"Option '{option}' already exists")
-        self.__options.append(option)
+        self.__options.add(option)
+        self._render_cache.clear()
 
     def remove_option(self, option: str) -> bool:
         """Remove an option from the menu if it exists.
@@ -52,8 +162,8 @@ class Menu:
             >>> menu.remove_option("Settings")
             True
         """
-        if option in self.__options:
-            self.__options.remove(option)
+        if self.__options.remove(option):
+            self._render_cache.clear()
             return True
         return False
 
@@ -64,6 +174,7 @@ class Menu:
             >>> menu.clear_options()
         """
         self.__options.clear()
+        self._render_cache.clear()
 
     @property
     def option_count(self) -> int:
@@ -78,12 +189,88 @@ class Menu:
         """
         return len(self.__options)
 
+    def page_count(self, page_size: int) -> int:
+        """Get the number of pages needed to show every option.
+        
+        Args:
+            page_size: Number of options per page
+            
+        Returns:
+            Number of pages (at least 1)
+        """
+        return max(1, -(-len(self.__options) // page_size))
+
+    def option_at(self, number: int) -> str:
+        """Get the option shown with the given menu number.
+        
+        Args:
+            number: 1-based menu number
+            
+        Returns:
+            The option text
+            
+        Raises:
+            IndexError: If no option has that number
+        """
+        if not 1 <= number <= len(self.__options):
+            raise IndexError(f"No option number {number}")
+        return self.__options[number - 1]
+
+    def render(
+        self,
+        show_menu_name: bool = True,
+        show_exit: bool = True,
+        exit_label: str = "Exit",
+        page: int = 1,
+        page_size: Optional[int] = None
+    ) -> str:
+        """Build the text that display_menu prints, as one string.
+        
+        Screens are cached per combination of arguments (and menu name), so
+        redisplaying an unchanged menu costs a dict lookup. The cache is
+        cleared by add_option, remove_option and clear_options.
+        
+        Args:
+            Same as the display arguments of display_menu
+            
+        Returns:
+            The full screen, ending with a newline
+        """
+        if page_size is not None:
+            page = min(max(page, 1), self.page_count(page_size))
+        key = (self.menu_name, show_menu_name, show_exit, exit_label, page, page_size)
+        screen = self._render_cache.get(key)
+        if screen is not None:
+            return screen
+
+        lines = []
+        if show_menu_name:
+            border = "=" * ((54 - len(self.menu_name)) // 2)
+            lines.append(f"\n{border} {self.menu_name} {border}\n")
+
+        if page_size is None:
+            start, window = 0, self.__options
+        else:
+            start = (page - 1) * page_size
+            window = self.__options.window(start, page_size)
+            lines.append(f"Page {page} of {self.page_count(page_size)}")
+
+        lines.extend(f"{i}. {option}" for i, option in enumerate(window, start + 1))
+
+        if show_exit:
+            lines.append(f"{len(self.__options) + 1}. {exit_label}")
+
+        screen = self._render_cache[key] = "\n".join(lines) + "\n" if lines else ""
+        return screen
+
     def display_menu(
         self, 
         get_user_choice: bool = True, 
         show_menu_name: bool = True, 
         show_exit: bool = True, 
-        exit_label: str = "Exit"
+        exit_label: str = "Exit",
+        page: int = 1,
+        page_size: Optional[int] = None
     ) -> Union[None, int, Tuple[int, int]]:
         """Display the menu and optionally collect user choice.
         
@@ -92,6 +279,9 @@ class Menu:
             show_menu_name: If True, displays the menu name. Defaults to True.
             show_exit: If True, shows exit option. Defaults to True.
             exit_label: Custom text for exit option. Defaults to "Exit".
+            page: Which page to show when page_size is set. Defaults to 1.
+            page_size: If set, only this many options are printed. Option
+                numbers stay the same as in the full menu. Defaults to None.
             
         Returns:
             If get_user_choice is True:
@@ -102,15 +292,7 @@ class Menu:
         Example:
             >>> choice = menu.display_menu(get_user_choice=True)
         """
-        if show_menu_name:
-            border = "=" * ((54 - len(self.menu_name)) // 2)
-            print(f"\n{border} {self.menu_name} {border}\n")
-        
-        for i, option in enumerate(self.__options, 1):
-            print(f"{i}. {option}")
-            
-        if show_exit:
-            print(f"{len(self.__options) + 1}. {exit_label}")
+        sys.stdout.write(self.render(show_menu_name, show_exit, exit_label, page, page_size))
         
         if not get_user_choice:
             return None
@@ -132,7 +314,115 @@ class Menu:
             >>> choice = menu.get_user_choice()
         """
         last_option = len(self.__options) + 1 if show_exit else len(self.__options)
-        return int(validate_number("\nEnter your choice: ", 1, last_option))
+        metrics = instrumentation.metrics
+        if metrics is None:
+            return int(validate_number("\nEnter your choice: ", 1, last_option))
+
+        start = perf_counter()
+        with metrics.prompt_id(f"menu:{self.menu_name}"):
+            choice = int(validate_number("\nEnter your choice: ", 1, last_option))
+        metrics.observe("menu_choice_seconds", perf_counter() - start, menu=self.menu_name)
+        metrics.inc("menu_choices_total", menu=self.menu_name, choice=str(choice))
+        return choice
+
+    async def display_menu_async(
+        self,
+        io,
+        get_user_choice: bool = True,
+        show_menu_name: bool = True,
+        show_exit: bool = True,
+        exit_label: str = "Exit"
+    ) -> Union[None, int, Tuple[int, int]]:
+        """Async variant of display_menu for an async I/O backend.
+        
+        Args:
+            io: An object with ask(prompt) and say(text) coroutines
+            Other arguments and the return value are as for display_menu.
+        """
+        screen = self.render(show_menu_name, show_exit, exit_label)
+        await io.say(screen[:-1])  # say() adds the final newline back
+        if not get_user_choice:
+            return None
+        choice = await self.get_user_choice_async(io, show_exit)
+        return (choice, len(self.__options)+1) if show_exit else choice
+
+    async def get_user_choice_async(self, io, show_exit: bool) -> int:
+        """Async variant of get_user_choice for an async I/O backend.
+        
+        Args:
+            io: An object with ask(prompt) and say(text) coroutines
+            show_exit: Whether the exit option is one of the choices
+            
+        Returns:
+            Validated integer choice from the user
+        """
+        last_option = len(self.__options) + 1 if show_exit else len(self.__options)
+        return int(await validate_number_async(io, "\nEnter your choice: ", 1, last_option))
+
+    def type_ahead(self) -> TypeAhead:
+        """Start an incremental search over the current options.
+        
+        Returns:
+            A TypeAhead whose matches carry the options' menu numbers
+            
+        Example:
+            >>> search = menu.type_ahead()
+            >>> search.set_query("set")
+            [(2, 'Settings')]
+        """
+        return TypeAhead(self.__options)
+
+    def browse(
+        self,
+        page_size: int = 20,
+        show_exit: bool = True,
+        exit_label: str = "Exit"
+    ) -> int:
+        """Let the user page through and search the menu before choosing.
+        
+        Only one page of (filtered) options is printed at a time. Commands:
+        a number selects that option, "n"/"p" go to the next/previous page,
+        "/text" narrows the list to options containing text, "/" clears it.
+        
+        Args:
+            page_size: Number of options per page. Defaults to 20.
+            show_exit: If True, offers an exit option. Defaults to True.
+            exit_label: Custom text for exit option. Defaults to "Exit".
+            
+        Returns:
+            The chosen option's number in the full menu (the exit option
+            is len(options) + 1)
+        """
+        last_option = len(self.__options) + 1 if show_exit else len(self.__options)
+        validator = NumberValidator(1, last_option, int)
+        search = self.type_ahead()
+        page = 1
+        while True:
+            matches = search.matches
+            pages = max(1, -(-len(matches) // page_size))
+            page = min(max(page, 1), pages)
+            title = f"{self.menu_name} - page {page} of {pages}"
+            if search.query:
+                title += f" - matching '{search.query}'"
+            print(f"\n{title}\n")
+            for i, option in matches[(page - 1) * page_size:page * page_size]:
+                print(f"{i}. {option}")
+            if show_exit:
+                print(f"{len(self.__options) + 1}. {exit_label}")
+
+            command = input("\nEnter your choice (n/p: page, /text: search): ").strip()
+            if command.lower() == "n":
+                page += 1
+            elif command.lower() == "p":
+                page -= 1
+            elif command.startswith("/"):
+                search.set_query(command[1:])
+                page = 1
+            else:
+                result = validator.validate(command)
+                if result.ok:
+                    return result.value
+                print(f"\nError: {result.message}")
 
     def __repr__(self) -> str:
         """Official string representation of the Menu object.
@@ -144,7 +434,7 @@ class Menu:
             >>> repr(menu)
             'Menu(options=["Start", "Quit"], menu_name="Game Menu")'
         """
-        return f'Menu(options={self.__options}, menu_name="{self.menu_name}")'
+        return f'Menu(options={self.__options.as_list()}, menu_name="{self.menu_name}")'
 
     def __str__(self) -> str:
         """User-friendly string representation of the menu.
@@ -158,5 +448,9 @@ class Menu:
               1. Start
               2. Quit
         """
-        options_str = "\n".join(f"  {i}. {opt}" for i, opt in enumerate(self.__options, 1))
-        return f"{self.menu_name}:\n{options_str}"
\ No newline at end of file
+        key = ("__str__", self.menu_name)
+        text = self._render_cache.get(key)
+        if text is None:
+            options_str = "\n".join(f"  {i}. {opt}" for i, opt in enumerate(self.__options, 1))
+            text = self._render_cache[key] = f"{self.menu_name}:\n{options_str}"
+        return text
\ No newline at end of file
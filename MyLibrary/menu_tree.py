@@ -0,0 +1,163 @@
+import sys
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from MyLibrary.menu import Menu
+
+Action = Callable[[], None]
+
+
+class NestedMenu(Menu):
+    """A Menu whose options can open submenus or run actions.
+
+    Options without a submenu or action are leaves: choosing one ends
+    navigation and reports the path to it (see MenuNavigator.run).
+
+    Example:
+        >>> settings = NestedMenu(["Audio", "Video"], "Settings")
+        >>> main = NestedMenu(["Start"], "Main Menu")
+        >>> main.add_submenu("Settings", settings)
+        >>> main.add_action("Help", lambda: print("Use the numbers to choose."))
+    """
+
+    def __init__(self, options: List[str], menu_name: str = "Main Menu") -> None:
+        """Initialize the menu with plain (leaf) options and a title.
+
+        Args:
+            options: List of menu option strings
+            menu_name: Title for the menu. Defaults to "Main Menu".
+        """
+        super().__init__(options, menu_name)
+        self._targets: Dict[str, Union["NestedMenu", Action]] = {}
+
+    def add_submenu(self, option: str, submenu: "NestedMenu") -> None:
+        """Add an option that opens another menu.
+
+        Args:
+            option: The option text shown in this menu
+            submenu: The menu to open when the option is chosen
+
+        Raises:
+            ValueError: If option is empty or already exists
+        """
+        self.add_option(option)
+        self._targets[option] = submenu
+
+    def add_action(self, option: str, action: Action) -> None:
+        """Add an option that calls a function and then shows this menu again.
+
+        Args:
+            option: The option text shown in this menu
+            action: Function called with no arguments
+
+        Raises:
+            ValueError: If option is empty or already exists
+        """
+        self.add_option(option)
+        self._targets[option] = action
+
+    def target(self, option: str) -> Union["NestedMenu", Action, None]:
+        """Get the submenu or action behind an option (None for leaves)."""
+        return self._targets.get(option)
+
+    def remove_option(self, option: str) -> bool:
+        """Remove an option together with its submenu or action."""
+        self._targets.pop(option, None)
+        return super().remove_option(option)
+
+    def clear_options(self) -> None:
+        """Remove all options, submenus and actions."""
+        self._targets.clear()
+        super().clear_options()
+
+
+class MenuNavigator:
+    """Walks a tree of NestedMenu objects with back navigation and breadcrumbs.
+
+    The root menu offers "Exit"; every submenu offers "Back". Each screen
+    (breadcrumbs plus the cached menu rendering) is written in one call.
+
+    Example:
+        >>> navigator = MenuNavigator(main)
+        >>> path = navigator.run()
+        >>> path
+        ('Main Menu', 'Settings', 'Audio')
+    """
+
+    def __init__(self, root: NestedMenu, separator: str = " > ", output=None) -> None:
+        """Start navigation at the root menu.
+
+        Args:
+            root: The top-level menu
+            separator: Text placed between breadcrumb entries. Defaults to " > ".
+            output: Stream the screens are written to. Defaults to sys.stdout.
+        """
+        self.root = root
+        self.separator = separator
+        self.output = output
+        self._stack: List[NestedMenu] = [root]
+
+    @property
+    def current(self) -> NestedMenu:
+        """The menu currently shown."""
+        return self._stack[-1]
+
+    @property
+    def depth(self) -> int:
+        """How many submenus deep the navigator is (0 at the root)."""
+        return len(self._stack) - 1
+
+    def breadcrumbs(self) -> str:
+        """Get the path to the current menu, e.g. "Main Menu > Settings"."""
+        return self.separator.join(menu.menu_name for menu in self._stack)
+
+    def back(self) -> bool:
+        """Return to the parent menu. Returns False if already at the root."""
+        if len(self._stack) > 1:
+            self._stack.pop()
+            return True
+        return False
+
+    def render(self) -> str:
+        """Build the current screen: breadcrumbs (below the root) and the menu."""
+        exit_label = "Back" if self.depth else "Exit"
+        screen = self.current.render(exit_label=exit_label)
+        if self.depth:
+            screen = f"\n{self.breadcrumbs()}" + screen
+        return screen
+
+    def select(self, number: int) -> Optional[Tuple[str, ...]]:
+        """Act on a menu number as if the user had entered it.
+
+        Args:
+            number: 1-based choice; option_count + 1 means Exit/Back
+
+        Returns:
+            The path (menu names plus option) if a leaf option was chosen,
+            an empty tuple if the root menu was exited, otherwise None
+        """
+        menu = self.current
+        if number == menu.option_count + 1:
+            return None if self.back() else ()
+
+        option = menu.option_at(number)
+        target = menu.target(option)
+        if isinstance(target, NestedMenu):
+            self._stack.append(target)
+        elif target is not None:
+            target()
+        else:
+            return tuple(m.menu_name for m in self._stack) + (option,)
+        return None
+
+    def run(self) -> Tuple[str, ...]:
+        """Show menus and follow the user's choices until a leaf or Exit is chosen.
+
+        Returns:
+            The path to the chosen leaf option, or an empty tuple if the
+            user exited the root menu
+        """
+        output = self.output or sys.stdout
+        while True:
+            output.write(self.render())
+            result = self.select(self.current.get_user_choice(True))
+            if result is not None:
+                return result
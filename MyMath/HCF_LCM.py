@@ -1,15 +1,26 @@
+import math
+from functools import reduce
+from MyMath.streaming import CHUNK_SIZE, is_ndarray, iter_chunks
+
+
 def gcd(a, b):
     """
     Calculate the Greatest Common Divisor (GCD) of two integers using the Euclidean algorithm.
 
+    Plain ints are handed to `math.gcd`, which switches to Lehmer's algorithm
+    for multi-word integers. Other integer-like types use the Euclidean loop.
+
     Args:
         a (int): The first integer.
         b (int): The second integer.
 
     Returns:
-        int: The GCD of the two integers.
+        int: The GCD of the two integers (always non-negative).
     """
-    while b > 0:
+    if type(a) is int and type(b) is int:
+        return math.gcd(a, b)
+    a, b = abs(a), abs(b)
+    while b:
         a, b = b, a % b
     return a
 
@@ -23,6 +34,89 @@ def lcm(a, b):
         b (int): The second integer.
 
     Returns:
-        int: The LCM of the two integers.
+        int: The LCM of the two integers. Returns 0 if either integer is 0.
     """
+    if a == 0 or b == 0:
+        return 0
     return abs(a * b) // gcd(a, b)
+
+
+def _gcd_chunk(g, chunk):
+    if is_ndarray(chunk):
+        if chunk.dtype.kind in "iu":
+            import numpy as np
+            return math.gcd(g, int(np.gcd.reduce(chunk)))
+        chunk = chunk.tolist()
+    return reduce(math.gcd, chunk, g)
+
+
+def gcd_many(values, chunk_size=CHUNK_SIZE):
+    """
+    Calculate the GCD of every integer in an iterable.
+
+    The running GCD can only shrink, so the values are folded chunk by chunk
+    and the scan stops as soon as the GCD reaches 1. NumPy integer arrays are
+    reduced with `numpy.gcd.reduce`; everything else goes through `math.gcd`.
+
+    Args:
+        values (iterable): Integers, an array.array, or a NumPy integer array.
+        chunk_size (int): Number of values reduced between early-exit checks.
+
+    Returns:
+        int: The GCD of all values. Returns 0 if there are no values.
+
+    Example:
+        >>> gcd_many([12, 18, 30])
+        6
+    """
+    g = 0
+    for chunk in iter_chunks(values, chunk_size):
+        g = _gcd_chunk(g, chunk)
+        if g == 1:
+            break
+    return g
+
+
+def _lcm_pair(a, b):
+    if a == 0 or b == 0:
+        return 0
+    return a // math.gcd(a, b) * b
+
+
+def lcm_many(values, chunk_size=CHUNK_SIZE):
+    """
+    Calculate the LCM of every integer in an iterable.
+
+    Each chunk is folded into one LCM, and the chunk results are combined in a
+    balanced tree so that the large intermediate values stay similar in size.
+    The scan stops early if a 0 is found, since the LCM is then 0.
+
+    Args:
+        values (iterable): Integers, an array.array, or a NumPy integer array.
+        chunk_size (int): Number of values folded into each leaf of the tree.
+
+    Returns:
+        int: The (non-negative) LCM of all values. Returns 1 if there are no values.
+
+    Example:
+        >>> lcm_many([4, 6, 10])
+        60
+    """
+    partial_lcms = []
+    for chunk in iter_chunks(values, chunk_size):
+        if is_ndarray(chunk):
+            chunk = chunk.tolist()  # LCMs overflow int64 quickly
+        partial = reduce(_lcm_pair, map(abs, chunk), 1)
+        if partial == 0:
+            return 0
+        partial_lcms.append(partial)
+
+    if not partial_lcms:
+        return 1
+    while len(partial_lcms) > 1:
+        paired = [_lcm_pair(partial_lcms[i], partial_lcms[i + 1])
+                  for i in range(0, len(partial_lcms) - 1, 2)]
+        if len(partial_lcms) % 2:
+            paired.append(partial_lcms[-1])
+        partial_lcms = paired
+    return partial_lcms[0]
@@ -0,0 +1,45 @@
+"""
+Number utilities: list reductions, HCF/LCM, fractions and decimals.
+
+Functions are loaded from their submodule the first time they are
+accessed (PEP 562); `import MyMath` itself imports nothing else.
+"""
+import importlib
+
+_LAZY = {
+    "list_sum": "calculate",
+    "list_product": "calculate",
+    "tree_product": "calculate",
+    "list_subtraction": "calculate",
+    "list_divide": "calculate",
+    "gcd": "HCF_LCM",
+    "lcm": "HCF_LCM",
+    "gcd_many": "HCF_LCM",
+    "lcm_many": "HCF_LCM",
+    "simplify_fraction": "fractions",
+    "Rational": "fractions",
+    "fraction_sum": "fractions",
+    "DecimalArray": "decimal",
+    "PrimeSieve": "factorization",
+    "stream_sum": "streaming",
+    "stream_product": "streaming",
+}
+
+_SUBMODULES = {"calculate", "HCF_LCM", "fractions", "decimal", "factorization", "streaming"}
+
+__all__ = sorted(_LAZY)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | _SUBMODULES)
@@ -1,20 +1,78 @@
-def list_product(iterable):
+# Sentinel used to detect an empty iterable without slicing or copying it
+_EMPTY = object()
+
+
+def list_product(iterable, big_int=False, processes=None):
     """
     Calculate the product of all numbers in an iterable.
 
     Args:
         iterable (iterable): An iterable containing numbers to be multiplied.
+        big_int (bool): If True, multiply in a balanced product tree (see `tree_product`).
+                        Much faster when the product grows into a very large integer.
+        processes (int, optional): Worker processes for the product tree. Only used with big_int.
 
     Returns:
         int or float: The product of the numbers in the iterable. 
                       Returns 1 if the iterable is empty.
     """
+    if big_int:
+        return tree_product(iterable, processes)
+
     result = 1
     for num in iterable:
         result *= num
     return result
 
 
+def _pairwise_product(nums):
+    """Multiply a list of numbers by repeatedly pairing neighbours."""
+    if not nums:
+        return 1
+    while len(nums) > 1:
+        paired = [nums[i] * nums[i + 1] for i in range(0, len(nums) - 1, 2)]
+        if len(nums) % 2:
+            paired.append(nums[-1])
+        nums = paired
+    return nums[0]
+
+
+def tree_product(iterable, processes=None):
+    """
+    Calculate the product of all numbers in an iterable using a balanced product tree.
+
+    Multiplying left to right makes the running product grow with every step,
+    so big-integer products (factorials, binomials) cost roughly quadratic time.
+    A product tree keeps both operands of each multiplication about the same
+    size, which lets Python's Karatsuba multiplication do the heavy lifting.
+
+    Args:
+        iterable (iterable): An iterable containing numbers to be multiplied.
+        processes (int, optional): If greater than 1, the input is split into that many
+                                   subtrees which are multiplied in a ProcessPoolExecutor.
+                                   Defaults to None (single process).
+
+    Returns:
+        int or float: The product of the numbers in the iterable.
+                      Returns 1 if the iterable is empty.
+
+    Example:
+        >>> tree_product(range(1, 6))
+        120
+    """
+    nums = list(iterable)
+    if processes is None or processes < 2 or len(nums) < 2 * processes:
+        return _pairwise_product(nums)
+
+    step = -(-len(nums) // processes)  # ceiling division
+    parts = [nums[i:i + step] for i in range(0, len(nums), step)]
+    from concurrent.futures import ProcessPoolExecutor  # only needed here; slow to import
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        partial_products = list(executor.map(_pairwise_product, parts))
+    return _pairwise_product(partial_products)
+
+
 def list_sum(iterable):
     """
     Calculate the sum of all numbers in an iterable.
@@ -43,11 +101,12 @@ def list_subtraction(iterable):
         int or float: The result of the subtraction. 
                       Returns 0 if the iterable is empty.
     """
-    if not iterable:
+    iterator = iter(iterable)
+    result = next(iterator, _EMPTY)
+    if result is _EMPTY:
         return 0  # Return 0 if the iterable is empty
 
-    result = iterable[0]
-    for num in iterable[1:]:
+    for num in iterator:
         result -= num
     return result
 
@@ -64,11 +123,12 @@ def list_divide(iterable):
                 Returns None if the iterable is empty or the first number is 0.
                 Raises a ZeroDivisionError if any subsequent number is 0.
     """
-    if not iterable:
+    iterator = iter(iterable)
+    result = next(iterator, _EMPTY)
+    if result is _EMPTY:
         return None  # Return None if the iterable is empty
 
-    result = iterable[0]
-    for num in iterable[1:]:
+    for num in iterator:
         if num == 0:
             raise ZeroDivisionError("Cannot divide by zero.")
         result /= num
@@ -1,3 +1,18 @@
+import decimal
+import operator
+import re
+from array import array
+from typing import Iterable, Union
+from MyMath.streaming import load_numpy, stream_sum
+
+ROUND_HALF_EVEN = decimal.ROUND_HALF_EVEN
+ROUND_HALF_UP = decimal.ROUND_HALF_UP
+
+# Optional sign, digits, optional fraction; at least one digit overall
+_DECIMAL_PATTERN = re.compile(r"\s*([+-]?)(\d*)(?:\.(\d*))?\s*$", re.ASCII)
+_INT64_MAX = 2 ** 63 - 1
+
+
 def isValid_decimal(prompt: str):
     """
     Validate user input as a decimal number.
@@ -15,3 +30,294 @@ def isValid_decimal(prompt: str):
             return number
         except ValueError:
             print("\nPlease enter a valid decimal number.\n")
+
+
+def _round_div(n, d, rounding):
+    """Divide the integer n by the positive integer d, rounding to the nearest integer."""
+    q, r = divmod(n, d)
+    twice = 2 * r
+    if twice > d or (twice == d and (q & 1 if rounding == ROUND_HALF_EVEN else n >= 0)):
+        q += 1
+    return q
+
+
+def _round_div_numpy(n, d, rounding):
+    """Vectorized `_round_div` for an int64 NumPy array."""
+    q, r = divmod(n, d)
+    twice = 2 * r
+    tie = twice == d
+    up = (twice > d) | (tie & ((q & 1) == 1 if rounding == ROUND_HALF_EVEN else n >= 0))
+    return q + up
+
+
+def _format_scaled(value, places):
+    """Format an integer scaled by 10**places as a decimal string."""
+    if places == 0:
+        return str(value)
+    digits = str(abs(value)).rjust(places + 1, "0")
+    sign = "-" if value < 0 else ""
+    return f"{sign}{digits[:-places]}.{digits[-places:]}"
+
+
+def parse_scaled(text: str, places: int, rounding: str = ROUND_HALF_EVEN) -> int:
+    """
+    Parse a decimal string into an integer scaled by 10**places, without going through float.
+
+    Args:
+        text (str): A decimal number such as "-12.345".
+        places (int): The number of decimal places to keep.
+        rounding (str): ROUND_HALF_EVEN (default) or ROUND_HALF_UP for extra digits.
+
+    Returns:
+        int: The value multiplied by 10**places and rounded.
+
+    Raises:
+        ValueError: If the text is not a plain decimal number.
+
+    Example:
+        >>> parse_scaled("12.345", 2)
+        1234
+    """
+    match = _DECIMAL_PATTERN.match(text)
+    if match is None:
+        raise ValueError(f"Invalid decimal number: {text!r}")
+    sign, whole, fraction = match.groups()
+    fraction = fraction or ""
+    if not whole and not fraction:
+        raise ValueError(f"Invalid decimal number: {text!r}")
+
+    value = int(whole + fraction or "0")
+    if sign == "-":
+        value = -value
+    extra = len(fraction) - places
+    if extra > 0:
+        return _round_div(value, 10 ** extra, rounding)
+    return value * 10 ** -extra
+
+
+class DecimalArray:
+    """
+    A column of fixed-point decimals stored as scaled 64-bit integers.
+
+    Each value is kept as value * 10**places in an `array('q')`, or in an int64
+    NumPy array when NumPy is installed. Arithmetic is exact integer arithmetic,
+    so currency data never picks up binary floating-point error.
+
+    Attributes:
+        places (int): The number of decimal places stored.
+
+    Example:
+        >>> prices = DecimalArray.from_strings(["19.99", "5.01", "0.10"])
+        >>> prices.sum()
+        Decimal('25.10')
+        >>> prices.scale("1.2").to_strings()
+        ['23.99', '6.01', '0.12']
+    """
+
+    __slots__ = ("places", "_values")
+
+    def __init__(self, scaled_values: Iterable[int] = (), places: int = 2, use_numpy: bool = None):
+        """
+        Create an array from integers that are already scaled by 10**places.
+
+        Args:
+            scaled_values (iterable): The scaled integers (e.g. cents for places=2).
+            places (int): The number of decimal places. Defaults to 2.
+            use_numpy (bool, optional): Force or disable the NumPy backend.
+                                        Defaults to None (use NumPy if installed).
+
+        Raises:
+            OverflowError: If a value does not fit in a signed 64-bit integer.
+        """
+        if places < 0:
+            raise ValueError("places cannot be negative.")
+        np = load_numpy() if use_numpy is None or use_numpy else None
+        if use_numpy and np is None:
+            raise ImportError("NumPy is not installed.")
+        self.places = places
+        values = array("q", scaled_values)
+        self._values = np.frombuffer(values, dtype=np.int64).copy() if np is not None else values
+
+    @classmethod
+    def from_strings(cls, strings: Iterable[str], places: int = 2,
+                     rounding: str = ROUND_HALF_EVEN, use_numpy: bool = None) -> "DecimalArray":
+        """
+        Parse many decimal strings at once, without converting through float.
+
+        Args:
+            strings (iterable): Decimal strings such as "12.30" or "-0.5".
+            places (int): The number of decimal places to keep. Defaults to 2.
+            rounding (str): How to round extra digits. Defaults to ROUND_HALF_EVEN.
+            use_numpy (bool, optional): Force or disable the NumPy backend.
+
+        Returns:
+            DecimalArray: The parsed values.
+
+        Raises:
+            ValueError: If a string is not a plain decimal number.
+            OverflowError: If a value does not fit in a signed 64-bit integer.
+        """
+        return cls((parse_scaled(text, places, rounding) for text in strings), places, use_numpy)
+
+    def _wrap(self, values):
+        result = object.__new__(DecimalArray)
+        result.places = self.places
+        result._values = values
+        return result
+
+    @property
+    def uses_numpy(self) -> bool:
+        """True if the values are stored in a NumPy array."""
+        return not isinstance(self._values, array)
+
+    @property
+    def scaled_values(self):
+        """The underlying storage of scaled integers (array('q') or NumPy int64 array)."""
+        return self._values
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, index: int) -> decimal.Decimal:
+        return decimal.Decimal(int(self._values[index])).scaleb(-self.places)
+
+    def __iter__(self):
+        for value in self.to_list():
+            yield decimal.Decimal(value).scaleb(-self.places)
+
+    def to_list(self) -> list:
+        """Return the scaled values as a list of Python ints."""
+        return self._values.tolist()
+
+    def to_strings(self) -> list:
+        """Return the values as decimal strings with exactly `places` decimals."""
+        return [_format_scaled(value, self.places) for value in self.to_list()]
+
+    def _other_values(self, other):
+        """Return the other operand as scaled values compatible with this array."""
+        if isinstance(other, DecimalArray):
+            if other.places != self.places:
+                raise ValueError("Cannot combine arrays with different decimal places.")
+            if len(other) != len(self):
+                raise ValueError("Arrays must have the same length.")
+            return other._values, False
+        if isinstance(other, bool):
+            return None, False
+        if isinstance(other, int):
+            return other * 10 ** self.places, True
+        if isinstance(other, decimal.Decimal):
+            # Scale the exact value, so exponent forms such as Decimal("1E+2") work too
+            numerator, denominator = other.as_integer_ratio()
+            return _round_div(numerator * 10 ** self.places, denominator, ROUND_HALF_EVEN), True
+        if isinstance(other, str):
+            return parse_scaled(other, self.places), True
+        return None, False
+
+    def _combine(self, other, op, reflected=False):
+        values, scalar = self._other_values(other)
+        if values is None:
+            return NotImplemented
+        if self.uses_numpy:
+            np = load_numpy()
+            a = self._values
+            b = np.int64(values) if scalar else np.asarray(values, dtype=np.int64)
+            if reflected:
+                a, b = b, a
+            with np.errstate(over="ignore"):
+                result = op(a, b)
+            # Two's complement overflow check: the sign of the result is impossible
+            if op is operator.add:
+                overflowed = ((a ^ result) & (b ^ result)) < 0
+            else:
+                overflowed = ((a ^ b) & (a ^ result)) < 0
+            if np.any(overflowed):
+                raise OverflowError("Result does not fit in a signed 64-bit integer.")
+            return self._wrap(result)
+        if scalar:
+            if reflected:
+                return self._wrap(array("q", [op(values, value) for value in self._values]))
+            return self._wrap(array("q", [op(value, values) for value in self._values]))
+        return self._wrap(array("q", map(op, self._values, values)))
+
+    def __add__(self, other):
+        return self._combine(other, operator.add)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self._combine(other, operator.sub)
+
+    def __rsub__(self, other):
+        return self._combine(other, operator.sub, reflected=True)
+
+    def __neg__(self):
+        if self.uses_numpy:
+            return self._wrap(-self._values)
+        return self._wrap(array("q", [-value for value in self._values]))
+
+    def sum(self) -> decimal.Decimal:
+        """
+        Add up all values exactly.
+
+        Returns:
+            Decimal: The exact total (the total itself may exceed 64 bits).
+        """
+        return decimal.Decimal(stream_sum(self._values)).scaleb(-self.places)
+
+    def scale(self, factor: Union[int, str, decimal.Decimal], rounding: str = ROUND_HALF_EVEN) -> "DecimalArray":
+        """
+        Multiply every value by an exact factor, rounding back to `places` decimals.
+
+        Args:
+            factor (int, str or Decimal): The multiplier, e.g. "1.175" for a 17.5% markup.
+                                          Floats are rejected to keep the result exact.
+            rounding (str): How to round the result. Defaults to ROUND_HALF_EVEN.
+
+        Returns:
+            DecimalArray: A new array with the scaled values.
+        """
+        if isinstance(factor, float):
+            raise TypeError("Use a str or Decimal factor; floats are not exact.")
+        numerator, denominator = decimal.Decimal(factor).as_integer_ratio()
+        values = self._values
+        if self.uses_numpy and values.size and max(abs(numerator), denominator) <= _INT64_MAX:
+            if int(abs(values).max()) * abs(numerator) <= _INT64_MAX:
+                return self._wrap(_round_div_numpy(values * numerator, denominator, rounding))
+        result = [_round_div(value * numerator, denominator, rounding) for value in self.to_list()]
+        return self._wrap(self._store(result))
+
+    def round(self, digits: int, rounding: str = ROUND_HALF_EVEN) -> "DecimalArray":
+        """
+        Round every value to fewer decimal digits, keeping the same `places`.
+
+        Args:
+            digits (int): The number of decimal digits to keep (0 <= digits <= places).
+            rounding (str): How to round. Defaults to ROUND_HALF_EVEN.
+
+        Returns:
+            DecimalArray: A new array whose values have at most `digits` decimals.
+        """
+        if not 0 <= digits <= self.places:
+            raise ValueError(f"digits must be between 0 and {self.places}.")
+        step = 10 ** (self.places - digits)
+        if self.uses_numpy:
+            return self._wrap(_round_div_numpy(self._values, step, rounding) * step)
+        return self._wrap(array("q", [_round_div(value, step, rounding) * step for value in self._values]))
+
+    def _store(self, values):
+        stored = array("q", values)
+        if self.uses_numpy:
+            np = load_numpy()
+            return np.frombuffer(stored, dtype=np.int64).copy()
+        return stored
+
+    def __eq__(self, other):
+        if not isinstance(other, DecimalArray):
+            return NotImplemented
+        return self.places == other.places and self.to_list() == other.to_list()
+
+    def __repr__(self) -> str:
+        preview = ", ".join(_format_scaled(int(value), self.places) for value in self._values[:5])
+        if len(self) > 5:
+            preview += ", ..."
+        return f"DecimalArray([{preview}], places={self.places})"
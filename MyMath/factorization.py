@@ -0,0 +1,228 @@
+from array import array
+from collections import OrderedDict
+from typing import Dict, Iterable
+from MyMath.HCF_LCM import gcd, gcd_many, lcm_many
+
+
+class PrimeSieve:
+    """
+    A smallest-prime-factor (SPF) sieve for fast factorization of bounded integers.
+
+    The sieve stores, for every n up to `limit`, the smallest prime dividing n
+    in a compact `array('I')` (4 bytes per entry). Factorizing any n <= limit
+    then takes O(log n) steps: divide by spf[n] until n becomes 1.
+
+    Attributes:
+        limit (int): The largest integer the sieve can factorize.
+
+    Example:
+        >>> sieve = PrimeSieve(1000)
+        >>> sieve.factorize(360)
+        {2: 3, 3: 2, 5: 1}
+        >>> sieve.lcm([4, 6, 10])
+        60
+    """
+
+    def __init__(self, limit: int = 1_000_000):
+        """
+        Build the sieve.
+
+        Args:
+            limit (int): The largest integer to support. Defaults to 1,000,000.
+
+        Raises:
+            ValueError: If limit is less than 2.
+        """
+        if limit < 2:
+            raise ValueError("limit must be at least 2.")
+
+        self.limit = limit
+        spf = array("I", range(limit + 1))
+        for i in range(4, limit + 1, 2):
+            spf[i] = 2
+        i = 3
+        while i * i <= limit:
+            if spf[i] == i:  # i is prime
+                for multiple in range(i * i, limit + 1, 2 * i):
+                    if spf[multiple] == multiple:
+                        spf[multiple] = i
+            i += 2
+        self._spf = spf
+
+    def __contains__(self, n: int) -> bool:
+        """Return True if n is an int the sieve can factorize (1 <= n <= limit)."""
+        return isinstance(n, int) and 1 <= n <= self.limit
+
+    def is_prime(self, n: int) -> bool:
+        """Return True if n (<= limit) is prime."""
+        self._check_range(n)
+        return n > 1 and self._spf[n] == n
+
+    def smallest_prime_factor(self, n: int) -> int:
+        """Return the smallest prime factor of n (<= limit). Returns 1 for n == 1."""
+        self._check_range(n)
+        return self._spf[n]
+
+    def factorize(self, n: int) -> Dict[int, int]:
+        """
+        Factorize n into primes.
+
+        Args:
+            n (int): A positive integer no larger than `limit`.
+
+        Returns:
+            dict: Prime factors mapped to their exponents. Empty for n == 1.
+
+        Raises:
+            ValueError: If n is outside 1..limit.
+        """
+        self._check_range(n)
+        spf = self._spf
+        factors = {}
+        while n > 1:
+            p = spf[n]
+            count = 0
+            while n % p == 0:
+                n //= p
+                count += 1
+            factors[p] = count
+        return factors
+
+    def hcf(self, numbers: Iterable[int]) -> int:
+        """
+        Calculate the HCF of many integers by taking the minimum exponent of each prime.
+
+        Values that are 0, negative or above `limit` cannot be factorized by the
+        sieve, so such inputs are handled by `gcd_many` instead.
+
+        Args:
+            numbers (iterable): The integers.
+
+        Returns:
+            int: The HCF of the numbers. Returns 0 if there are none.
+        """
+        numbers = list(numbers)
+        if not numbers or not all(n in self for n in numbers):
+            return gcd_many(numbers)
+
+        common = self.factorize(numbers[0])
+        for n in numbers[1:]:
+            if not common:
+                break  # HCF is already 1
+            factors = self.factorize(n)
+            common = {p: min(e, factors[p]) for p, e in common.items() if p in factors}
+        return _from_exponents(common)
+
+    def lcm(self, numbers: Iterable[int]) -> int:
+        """
+        Calculate the LCM of many integers by taking the maximum exponent of each prime.
+
+        Values that are 0, negative or above `limit` are handled by `lcm_many` instead.
+
+        Args:
+            numbers (iterable): The integers.
+
+        Returns:
+            int: The LCM of the numbers. Returns 1 if there are none.
+        """
+        numbers = list(numbers)
+        if not all(n in self for n in numbers):
+            return lcm_many(numbers)
+
+        exponents = {}
+        for n in numbers:
+            for p, e in self.factorize(n).items():
+                if e > exponents.get(p, 0):
+                    exponents[p] = e
+        return _from_exponents(exponents)
+
+    def _check_range(self, n):
+        if not isinstance(n, int):
+            raise TypeError(f"n must be an int, not {type(n).__name__}.")
+        if not 1 <= n <= self.limit:
+            raise ValueError(f"n must be between 1 and {self.limit}.")
+
+
+def _from_exponents(exponents):
+    result = 1
+    for p, e in exponents.items():
+        result *= p ** e
+    return result
+
+
+class PairCache:
+    """
+    A size-bounded LRU cache for repeated `gcd` / `lcm` calls on the same pairs.
+
+    Pairs are stored in a canonical order, so gcd(a, b) and gcd(b, a) share an
+    entry. `lcm` is derived from the cached GCD.
+
+    Attributes:
+        maxsize (int): The maximum number of cached pairs.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that had to compute the GCD.
+
+    Example:
+        >>> cache = PairCache(maxsize=1024)
+        >>> cache.gcd(12, 18), cache.gcd(18, 12)
+        (6, 6)
+        >>> cache.hits, cache.misses
+        (1, 1)
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        """
+        Create an empty cache.
+
+        Args:
+            maxsize (int): The maximum number of cached pairs. Defaults to 4096.
+
+        Raises:
+            ValueError: If maxsize is less than 1.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def gcd(self, a: int, b: int) -> int:
+        """Return gcd(a, b), using the cached value if available."""
+        key = (a, b) if a <= b else (b, a)
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+            self.hits += 1
+            return entries[key]
+
+        self.misses += 1
+        result = entries[key] = gcd(a, b)
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+        return result
+
+    def lcm(self, a: int, b: int) -> int:
+        """Return lcm(a, b), using the cached GCD if available."""
+        if a == 0 or b == 0:
+            return 0
+        return abs(a * b) // self.gcd(a, b)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        """
+        Report cache statistics.
+
+        Returns:
+            dict: The hit and miss counters, current size and maximum size.
+        """
+        return {"hits": self.hits, "misses": self.misses,
+                "size": len(self._entries), "maxsize": self.maxsize}
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,5 +1,11 @@
+import math
+import mmap
+import operator
 import re
-from MyMath.hcf_lcm import gcd
+import sys
+from numbers import Rational as _RationalABC
+from typing import Iterable, Iterator, List, Optional, Tuple
+from MyMath.HCF_LCM import gcd
 
 # Improved pattern for matching fractions
 # Explanation of the new pattern:
@@ -10,6 +16,11 @@ from MyMath.hcf_lcm import gcd
 # -?             : Match an optional negative sign for the denominator
 # \d+           : Match one or more digits (denominator)
 # \s*$          : Match optional trailing whitespace and the end of the string
+# The numerator and denominator are captured as groups 1 and 2.
+# Compiled once at import time; a bytes twin is used for binary files and mmaps.
+FRACTION_PATTERN = re.compile(r"^\s*(-?\d+)\s*/\s*(-?\d+)\s*$")
+_FRACTION_PATTERN_BYTES = re.compile(FRACTION_PATTERN.pattern.encode())
+
 
 def isValid_fraction(prompt):
     """
@@ -21,11 +32,11 @@ def isValid_fraction(prompt):
     Returns:
         tuple: A tuple containing the numerator and denominator as integers.
     """
-    PATTERN = re.compile(r"^\s*-?\d+\s*/\s*-?\d+\s*$")
     while True:
         user_input = input(prompt)
-        if PATTERN.match(user_input):
-            numerator, denominator = map(str.strip, user_input.split("/"))
+        match = FRACTION_PATTERN.match(user_input)
+        if match:
+            numerator, denominator = match.groups()
             if int(denominator) == 0:
                 print("The denominator cannot be zero. Please enter a valid fraction.")
                 continue
@@ -34,6 +45,100 @@ def isValid_fraction(prompt):
             print("\nPlease enter a valid fraction (Pattern: numerator/denominator)\n")
 
 
+class ParseReport:
+    """
+    Collects malformed lines found by `parse_fractions` instead of raising.
+
+    Attributes:
+        parsed (int): Number of fractions successfully parsed.
+        malformed (int): Number of lines that could not be parsed.
+        errors (list): Up to `max_errors` (line_number, line, reason) tuples.
+        max_errors (int): Maximum number of error details to keep (all are counted).
+    """
+
+    def __init__(self, max_errors: int = 1000):
+        """
+        Create an empty report.
+
+        Args:
+            max_errors (int): Maximum number of error details to keep. Defaults to 1000.
+        """
+        self.parsed = 0
+        self.malformed = 0
+        self.errors: List[Tuple[int, str, str]] = []
+        self.max_errors = max_errors
+
+    def add_error(self, line_number: int, line, reason: str) -> None:
+        """Record a malformed line."""
+        self.malformed += 1
+        if len(self.errors) < self.max_errors:
+            if isinstance(line, bytes):
+                line = line.decode(errors="replace")
+            self.errors.append((line_number, line.rstrip("\r\n"), reason))
+
+    def __repr__(self) -> str:
+        return f"ParseReport(parsed={self.parsed}, malformed={self.malformed})"
+
+
+def parse_fractions(source, report: Optional[ParseReport] = None) -> Iterator[Tuple[int, int]]:
+    """
+    Parse one "numerator/denominator" fraction per line, without prompting.
+
+    Lines are read lazily, so files of any size can be processed in constant
+    memory. Blank lines are skipped. Lines that do not match the pattern or
+    have a zero denominator are recorded in `report` and skipped.
+
+    Args:
+        source: A text or binary file object, an mmap, or any iterable of lines.
+        report (ParseReport, optional): Receives the counts and malformed lines.
+
+    Yields:
+        tuple: (numerator, denominator) pairs with a positive denominator.
+
+    Example:
+        >>> report = ParseReport()
+        >>> list(parse_fractions(["3/4", "6/-8", "oops"], report))
+        [(3, 4), (-6, 8)]
+        >>> report.errors
+        [(3, 'oops', 'not a fraction')]
+    """
+    if report is None:
+        report = ParseReport()
+    lines = iter(source.readline, b"") if isinstance(source, mmap.mmap) else source
+
+    for line_number, line in enumerate(lines, 1):
+        pattern = _FRACTION_PATTERN_BYTES if isinstance(line, bytes) else FRACTION_PATTERN
+        match = pattern.match(line)
+        if match is None:
+            if line.strip():
+                report.add_error(line_number, line, "not a fraction")
+            continue
+        numerator, denominator = int(match.group(1)), int(match.group(2))
+        if denominator == 0:
+            report.add_error(line_number, line, "zero denominator")
+            continue
+        report.parsed += 1
+        yield handle_negative_denominator(numerator, denominator)
+
+
+def parse_fraction_file(path: str, report: Optional[ParseReport] = None) -> Iterator[Tuple[int, int]]:
+    """
+    Parse a file of fractions through a read-only memory map.
+
+    Args:
+        path (str): Path to a file with one "numerator/denominator" fraction per line.
+        report (ParseReport, optional): Receives the counts and malformed lines.
+
+    Yields:
+        tuple: (numerator, denominator) pairs with a positive denominator.
+    """
+    with open(path, "rb") as file:
+        if file.seek(0, 2) == 0:
+            return  # empty files cannot be memory-mapped
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield from parse_fractions(mapped, report)
+
+
 def handle_negative_denominator(numerator, denominator):
     """
     Ensure the denominator of the fraction is positive.
@@ -67,3 +172,450 @@ def simplify_fraction(num, den):
     """
     divisor = gcd(num, den)
     return f"{num // divisor}/{den // divisor}" if den > 1 else f"{num // divisor}"
+
+
+# Unreduced results are normalized once their denominator grows beyond this
+# many bits, so long add/mul chains do not drag huge integers around.
+REDUCE_THRESHOLD_BITS = 512
+
+_HASH_MODULUS = sys.hash_info.modulus
+_HASH_INF = sys.hash_info.inf
+
+
+class Rational:
+    """
+    A compact exact fraction with lazy normalization.
+
+    Unlike `simplify_fraction`, which returns a string, Rational supports
+    arithmetic directly. New values and sums over a shared denominator are
+    kept unreduced (only the sign is normalized with
+    `handle_negative_denominator`); `gcd` runs only when the value is hashed,
+    printed, its numerator or denominator is read, it is combined with a
+    different denominator, or its denominator exceeds REDUCE_THRESHOLD_BITS.
+    Comparisons use cross-multiplication and need no reduction at all.
+
+    Works with ints and any `numbers.Rational` (such as `fractions.Fraction`).
+
+    Example:
+        >>> x = Rational(6, -8)
+        >>> x + Rational(1, 4)
+        Rational(-1, 2)
+        >>> print(x * 2)
+        -3/2
+    """
+
+    __slots__ = ("_num", "_den", "_reduced")
+
+    def __init__(self, numerator: int = 0, denominator: int = 1):
+        """
+        Create a fraction numerator/denominator.
+
+        Args:
+            numerator (int): The numerator of the fraction.
+            denominator (int): The denominator of the fraction.
+
+        Raises:
+            ZeroDivisionError: If the denominator is 0.
+            TypeError: If numerator or denominator is not an integer.
+        """
+        if not isinstance(numerator, int) or not isinstance(denominator, int):
+            raise TypeError("Numerator and denominator must be integers.")
+        if denominator == 0:
+            raise ZeroDivisionError("The denominator cannot be zero.")
+        self._num, self._den = handle_negative_denominator(numerator, denominator)
+        self._reduced = False
+
+    @classmethod
+    def _make(cls, num, den, reduced=False):
+        """Build a result from a numerator and a positive denominator without checks."""
+        result = object.__new__(cls)
+        result._num = num
+        result._den = den
+        result._reduced = reduced or den == 1
+        if not result._reduced and den.bit_length() > REDUCE_THRESHOLD_BITS:
+            result._reduce()
+        return result
+
+    def _reduce(self):
+        if not self._reduced:
+            divisor = gcd(self._num, self._den)
+            if divisor > 1:
+                self._num //= divisor
+                self._den //= divisor
+            self._reduced = True
+
+    @property
+    def numerator(self) -> int:
+        """The numerator in lowest terms."""
+        self._reduce()
+        return self._num
+
+    @property
+    def denominator(self) -> int:
+        """The (positive) denominator in lowest terms."""
+        self._reduce()
+        return self._den
+
+    def as_tuple(self):
+        """Return (numerator, denominator) in lowest terms."""
+        self._reduce()
+        return self._num, self._den
+
+    # Arithmetic
+
+    @staticmethod
+    def _parts(other):
+        if isinstance(other, Rational):
+            return other._num, other._den
+        if isinstance(other, int):
+            return other, 1
+        if isinstance(other, _RationalABC):
+            return other.numerator, other.denominator
+        return None
+
+    @staticmethod
+    def _reduced_parts(other):
+        if isinstance(other, Rational):
+            other._reduce()
+        return Rational._parts(other)
+
+    def _add(self, other, sign):
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        num, den = parts
+        if den == self._den:
+            # Same denominator: no gcd needed, the result stays lazy
+            return Rational._make(self._num + sign * num, den)
+
+        # Different denominators: reduce both operands and combine them with
+        # Henrici's method, so every gcd works on the smaller numbers and the
+        # result is already in lowest terms.
+        self._reduce()
+        na, da = self._num, self._den
+        nb, db = self._reduced_parts(other)
+        nb *= sign
+        g = gcd(da, db)
+        if g == 1:
+            return Rational._make(na * db + da * nb, da * db, True)
+        s = da // g
+        t = na * (db // g) + nb * s
+        g2 = gcd(t, g)
+        if g2 == 1:
+            return Rational._make(t, s * db, True)
+        return Rational._make(t // g2, s * (db // g2), True)
+
+    def __add__(self, other):
+        return self._add(other, 1)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self._add(other, -1)
+
+    def __rsub__(self, other):
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        return Rational._make(*parts) - self
+
+    def _mul(self, num, den):
+        """Multiply by num/den (den > 0), cancelling common factors crosswise."""
+        self._reduce()
+        na, da = self._num, self._den
+        g1 = gcd(na, den)
+        if g1 > 1:
+            na //= g1
+            den //= g1
+        g2 = gcd(num, da)
+        if g2 > 1:
+            num //= g2
+            da //= g2
+        return Rational._make(na * num, da * den, True)
+
+    def __mul__(self, other):
+        parts = self._reduced_parts(other)
+        if parts is None:
+            return NotImplemented
+        return self._mul(*parts)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        parts = self._reduced_parts(other)
+        if parts is None:
+            return NotImplemented
+        num, den = parts
+        if num == 0:
+            raise ZeroDivisionError("Cannot divide by zero.")
+        return self._mul(*handle_negative_denominator(den, num))
+
+    def __rtruediv__(self, other):
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        return Rational._make(*parts) / self
+
+    def __floordiv__(self, other):
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        num, den = parts
+        return (self._num * den) // (self._den * num)
+
+    def __rfloordiv__(self, other):
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        return Rational._make(*parts) // self
+
+    def __mod__(self, other):
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        num, den = parts
+        return Rational._make((self._num * den) % (self._den * num), self._den * den)
+
+    def __rmod__(self, other):
+        parts = self._parts(other)
+        if parts is None:
+            return NotImplemented
+        return Rational._make(*parts) % self
+
+    def __divmod__(self, other):
+        return self // other, self % other
+
+    def __rdivmod__(self, other):
+        return other // self, other % self
+
+    def __pow__(self, exponent):
+        if isinstance(exponent, (Rational, _RationalABC)) and exponent.denominator == 1:
+            exponent = int(exponent.numerator)  # e.g. Rational(4, 2): the result stays exact
+        if isinstance(exponent, int):
+            self._reduce()  # powers of a reduced fraction stay reduced
+            if exponent >= 0:
+                return Rational._make(self._num ** exponent, self._den ** exponent, True)
+            if self._num == 0:
+                raise ZeroDivisionError("Cannot raise zero to a negative power.")
+            num, den = handle_negative_denominator(self._den ** -exponent, self._num ** -exponent)
+            return Rational._make(num, den, True)
+        return float(self) ** exponent
+
+    def __rpow__(self, base):
+        if self._den == 1:
+            return base ** self._num
+        return base ** float(self)
+
+    def __neg__(self):
+        return Rational._make(-self._num, self._den, self._reduced)
+
+    def __pos__(self):
+        return Rational._make(self._num, self._den, self._reduced)
+
+    def __abs__(self):
+        return Rational._make(abs(self._num), self._den, self._reduced)
+
+    # Comparison and conversion
+
+    def _compare(self, other, op):
+        parts = self._parts(other)
+        if parts is None:
+            if not isinstance(other, float):
+                return NotImplemented
+            if math.isnan(other) or math.isinf(other):
+                return op(0.0, other)
+            parts = other.as_integer_ratio()  # exact, like fractions.Fraction
+        num, den = parts
+        return op(self._num * den, num * self._den)
+
+    def __eq__(self, other):
+        return self._compare(other, operator.eq)
+
+    def __lt__(self, other):
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other):
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other):
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other):
+        return self._compare(other, operator.ge)
+
+    def __hash__(self):
+        # Same scheme as int and fractions.Fraction, so equal values hash equally
+        self._reduce()
+        dinv = pow(self._den, _HASH_MODULUS - 2, _HASH_MODULUS)
+        if not dinv:
+            hash_ = _HASH_INF
+        else:
+            hash_ = hash(hash(abs(self._num)) * dinv)
+        result = hash_ if self._num >= 0 else -hash_
+        return -2 if result == -1 else result
+
+    def __bool__(self):
+        return self._num != 0
+
+    def __float__(self):
+        return self._num / self._den
+
+    def __int__(self):
+        if self._num < 0:
+            return -(-self._num // self._den)
+        return self._num // self._den
+
+    __trunc__ = __int__
+
+    def __floor__(self):
+        return self._num // self._den
+
+    def __ceil__(self):
+        return -(-self._num // self._den)
+
+    def __round__(self, ndigits=None):
+        """Round half to even, like fractions.Fraction; returns an int if ndigits is None."""
+        if ndigits is None:
+            floor, remainder = divmod(self._num, self._den)
+            if remainder * 2 < self._den or (remainder * 2 == self._den and floor % 2 == 0):
+                return floor
+            return floor + 1
+        shift = 10 ** abs(ndigits)
+        if ndigits > 0:
+            return Rational._make(round(self * shift), shift)
+        return Rational._make(round(self / shift) * shift, 1)
+
+    def __repr__(self):
+        self._reduce()
+        return f"Rational({self._num}, {self._den})"
+
+    def __str__(self):
+        self._reduce()
+        return f"{self._num}/{self._den}" if self._den != 1 else f"{self._num}"
+
+
+def _as_pair(value):
+    """Convert a (num, den) tuple, int or rational number into a (num, den) pair."""
+    if isinstance(value, tuple):
+        numerator, denominator = value
+        if denominator == 0:
+            raise ZeroDivisionError("The denominator cannot be zero.")
+        return handle_negative_denominator(numerator, denominator)
+    parts = Rational._parts(value)
+    if parts is None:
+        raise TypeError(f"Expected a fraction, got {type(value).__name__}.")
+    return parts
+
+
+def _tree_sum(pairs, reduce_bits):
+    """Add (num, den) pairs in a balanced tree, without gcd unless reduce_bits is exceeded."""
+    if not pairs:
+        return 0, 1
+    while len(pairs) > 1:
+        combined = []
+        for i in range(0, len(pairs) - 1, 2):
+            (a, b), (c, d) = pairs[i], pairs[i + 1]
+            num, den = a * d + c * b, b * d
+            if reduce_bits is not None and den.bit_length() > reduce_bits:
+                divisor = gcd(num, den)
+                num, den = num // divisor, den // divisor
+            combined.append((num, den))
+        if len(pairs) % 2:
+            combined.append(pairs[-1])
+        pairs = combined
+    return pairs[0]
+
+
+def fraction_sum(fractions: Iterable, reduce_bits: Optional[int] = None) -> Rational:
+    """
+    Add many fractions at once, with far fewer gcd calls than adding them pairwise.
+
+    Terms that share a denominator are added first by summing their numerators.
+    The per-denominator totals are then combined in a balanced tree, so both
+    operands of each big-integer multiplication stay about the same size, and
+    the result is reduced with `gcd` once at the end.
+
+    Args:
+        fractions (iterable): (numerator, denominator) tuples, ints, or rational numbers
+                              such as Rational or fractions.Fraction.
+        reduce_bits (int, optional): Also reduce intermediate results whose denominator
+                                     grows beyond this many bits. Defaults to None (only at the end).
+
+    Returns:
+        Rational: The sum in lowest terms. Rational(0) if there are no fractions.
+
+    Raises:
+        ZeroDivisionError: If a tuple has a zero denominator.
+
+    Example:
+        >>> fraction_sum([(1, 2), (1, 3), (1, 6)])
+        Rational(1, 1)
+    """
+    by_denominator = {}
+    for value in fractions:
+        numerator, denominator = _as_pair(value)
+        by_denominator[denominator] = by_denominator.get(denominator, 0) + numerator
+
+    numerator, denominator = _tree_sum(
+        [(num, den) for den, num in by_denominator.items()], reduce_bits)
+    result = Rational._make(numerator, denominator)
+    result._reduce()
+    return result
+
+
+def fraction_mean(fractions: Iterable, reduce_bits: Optional[int] = None) -> Rational:
+    """
+    Calculate the exact mean of many fractions using `fraction_sum`.
+
+    Args:
+        fractions (iterable): (numerator, denominator) tuples, ints, or rational numbers.
+        reduce_bits (int, optional): Passed on to `fraction_sum`.
+
+    Returns:
+        Rational: The mean in lowest terms.
+
+    Raises:
+        ValueError: If there are no fractions.
+    """
+    count = 0
+
+    def counted(values):
+        nonlocal count
+        for value in values:
+            count += 1
+            yield value
+
+    total = fraction_sum(counted(fractions), reduce_bits)
+    if count == 0:
+        raise ValueError("Cannot take the mean of no fractions.")
+    return total / count
+
+
+def fraction_dot(left: Iterable, right: Iterable, reduce_bits: Optional[int] = None) -> Rational:
+    """
+    Calculate the exact dot product of two fraction vectors using `fraction_sum`.
+
+    Args:
+        left (iterable): The first vector of fractions.
+        right (iterable): The second vector of fractions, of the same length.
+        reduce_bits (int, optional): Passed on to `fraction_sum`.
+
+    Returns:
+        Rational: The dot product in lowest terms.
+
+    Raises:
+        ValueError: If the vectors have different lengths.
+    """
+    def products():
+        sentinel = object()
+        right_iter = iter(right)
+        for x in left:
+            y = next(right_iter, sentinel)
+            if y is sentinel:
+                raise ValueError("Vectors must have the same length.")
+            (a, b), (c, d) = _as_pair(x), _as_pair(y)
+            yield a * c, b * d
+        if next(right_iter, sentinel) is not sentinel:
+            raise ValueError("Vectors must have the same length.")
+
+    return fraction_sum(products(), reduce_bits)
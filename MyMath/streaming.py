@@ -0,0 +1,271 @@
+import math
+import operator
+import sys
+from array import array
+from functools import lru_cache, reduce
+from itertools import islice
+from MyMath.calculate import list_sum, list_product
+
+# Number of elements reduced at a time. Large enough to amortize per-chunk
+# overhead, small enough to keep a chunk of Python objects in cache.
+CHUNK_SIZE = 65536
+
+_FLOAT_CODES = ("f", "d", "e")
+_INT_TYPES = (int, bool)
+_REAL_TYPES = (int, bool, float)
+
+
+@lru_cache(maxsize=None)
+def load_numpy():
+    """
+    Import NumPy on first use, so importing MyMath does not pay for it.
+
+    Returns:
+        module or None: The numpy module, or None if NumPy is not installed.
+    """
+    try:
+        import numpy
+    except ImportError:  # NumPy is optional; buffers and iterables still work without it
+        return None
+    return numpy
+
+
+def is_ndarray(values):
+    """Return True if values is a NumPy array, without importing NumPy."""
+    # An ndarray can only exist once NumPy was imported by someone else
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(values, np.ndarray)
+
+
+def iter_chunks(values, chunk_size=CHUNK_SIZE):
+    """
+    Split numbers into fixed-size chunks without copying buffer-backed inputs.
+
+    NumPy arrays are split into views, `array.array` objects and memoryviews
+    into memoryview slices. Any other iterable (including generators) is
+    consumed lazily, `chunk_size` items at a time.
+
+    Args:
+        values (iterable): NumPy array, array.array, memoryview or any iterable of numbers.
+        chunk_size (int): Maximum number of elements per chunk.
+
+    Yields:
+        A view or list holding the next run of elements.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+
+    if is_ndarray(values):
+        flat = values.reshape(-1)  # a view for contiguous arrays
+        for start in range(0, flat.shape[0], chunk_size):
+            yield flat[start:start + chunk_size]
+    elif isinstance(values, (array, memoryview)):
+        view = memoryview(values)
+        if view.ndim != 1:
+            view = view.cast("B").cast(view.format)
+        for start in range(0, len(view), chunk_size):
+            yield view[start:start + chunk_size]
+    else:
+        iterator = iter(values)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+
+class _SumAccumulator:
+    """Keeps exact integer, compensated float and generic partial sums apart."""
+
+    __slots__ = ("integer", "floats", "other", "has_other")
+
+    def __init__(self):
+        self.integer = 0
+        self.floats = []
+        self.other = 0
+        self.has_other = False
+
+    def add_chunk(self, chunk):
+        if is_ndarray(chunk):
+            self._add_numpy(chunk)
+        elif isinstance(chunk, memoryview):
+            if chunk.format in _FLOAT_CODES:
+                self.floats.append(math.fsum(chunk))
+            else:
+                self.integer += sum(chunk)
+        else:
+            kinds = set(map(type, chunk))
+            if kinds.issubset(_INT_TYPES):
+                self.integer += sum(chunk)
+            elif kinds.issubset(_REAL_TYPES):
+                self.floats.append(math.fsum(chunk))
+            else:
+                # Fractions, Decimals and friends use the pure-Python reduction
+                self.other = self.other + list_sum(chunk)
+                self.has_other = True
+
+    def _add_numpy(self, chunk):
+        if chunk.dtype.kind == "f":
+            # NumPy's pairwise sum is accurate within a chunk; chunk totals
+            # are combined with fsum so the error does not grow with length.
+            self.floats.append(float(chunk.sum()))
+        elif chunk.dtype.kind in "iub":
+            if chunk.size and chunk.dtype.kind != "b":
+                bound = max(abs(int(chunk.min())), abs(int(chunk.max()))) * chunk.size
+            else:
+                bound = chunk.size
+            if bound < 2 ** 63:
+                self.integer += int(chunk.sum(dtype="int64"))
+            else:
+                self.integer += sum(chunk.tolist())
+        else:
+            self.other = self.other + list_sum(chunk.tolist())
+            self.has_other = True
+
+    def result(self):
+        total = self.integer
+        if self.floats:
+            total = math.fsum(self.floats + [total])
+        if self.has_other:
+            total = self.other + total
+        return total
+
+
+def stream_sum(values, chunk_size=CHUNK_SIZE):
+    """
+    Sum numbers chunk by chunk, using compensated summation for floats.
+
+    Integers are summed exactly and floats with `math.fsum`, so the result
+    does not drift on long columns. Items that are neither int nor float
+    (e.g. Fraction or Decimal) fall back to `calculate.list_sum`.
+
+    Args:
+        values (iterable): NumPy array, array.array, memoryview or any iterable of numbers.
+        chunk_size (int): Number of elements reduced at a time.
+
+    Returns:
+        int or float: The sum of the numbers. Returns 0 if there are none.
+    """
+    accumulator = _SumAccumulator()
+    for chunk in iter_chunks(values, chunk_size):
+        accumulator.add_chunk(chunk)
+    return accumulator.result()
+
+
+def _product_chunk(chunk):
+    if is_ndarray(chunk):
+        if chunk.dtype.kind == "f":
+            return float(chunk.prod())
+        # Integer products overflow int64 almost immediately, so use Python ints
+        return list_product(chunk.tolist())
+    if isinstance(chunk, memoryview):
+        return reduce(operator.mul, chunk, 1.0 if chunk.format in _FLOAT_CODES else 1)
+    return list_product(chunk)
+
+
+def stream_product(values, chunk_size=CHUNK_SIZE):
+    """
+    Multiply numbers chunk by chunk without copying buffer-backed inputs.
+
+    Args:
+        values (iterable): NumPy array, array.array, memoryview or any iterable of numbers.
+        chunk_size (int): Number of elements reduced at a time.
+
+    Returns:
+        int or float: The product of the numbers. Returns 1 if there are none.
+    """
+    result = 1
+    for chunk in iter_chunks(values, chunk_size):
+        result *= _product_chunk(chunk)
+    return result
+
+
+def _split_first(values, chunk_size):
+    """Return the first element and a chunk iterator over the rest."""
+    chunks = iter_chunks(values, chunk_size)
+    for chunk in chunks:
+        if len(chunk):
+            first = chunk[0]
+            if is_ndarray(chunk):
+                first = first.item()
+            return first, _chain_rest(chunk[1:], chunks)
+    return None, None
+
+
+def _chain_rest(rest_of_first, chunks):
+    if len(rest_of_first):
+        yield rest_of_first
+    yield from chunks
+
+
+def stream_subtraction(values, chunk_size=CHUNK_SIZE):
+    """
+    Subtract all following numbers from the first one, chunk by chunk.
+
+    The subtrahends are reduced with `stream_sum`, so float results are
+    compensated rather than accumulated left to right.
+
+    Args:
+        values (iterable): NumPy array, array.array, memoryview or any iterable of numbers.
+        chunk_size (int): Number of elements reduced at a time.
+
+    Returns:
+        int or float: The result of the subtraction. Returns 0 if there are no numbers.
+    """
+    first, rest = _split_first(values, chunk_size)
+    if rest is None:
+        return 0
+
+    accumulator = _SumAccumulator()
+    for chunk in rest:
+        accumulator.add_chunk(chunk)
+    return first - accumulator.result()
+
+
+def _has_zero(chunk):
+    if is_ndarray(chunk):
+        return not chunk.all()
+    return any(num == 0 for num in chunk)
+
+
+def _divide_each(result, chunk):
+    for num in (chunk.tolist() if is_ndarray(chunk) else chunk):
+        result /= num
+    return result
+
+
+def stream_divide(values, chunk_size=CHUNK_SIZE):
+    """
+    Divide the first number by all following numbers, chunk by chunk.
+
+    Each chunk is reduced to its product first; if that product overflows or
+    underflows a float, or is an int too large to convert to one, the chunk
+    is divided element by element instead.
+
+    Args:
+        values (iterable): NumPy array, array.array, memoryview or any iterable of numbers.
+        chunk_size (int): Number of elements reduced at a time.
+
+    Returns:
+        float: The result of the division. Returns None if there are no numbers.
+
+    Raises:
+        ZeroDivisionError: If any of the divisors is 0.
+    """
+    first, rest = _split_first(values, chunk_size)
+    if rest is None:
+        return None
+
+    result = first
+    for chunk in rest:
+        if _has_zero(chunk):
+            raise ZeroDivisionError("Cannot divide by zero.")
+        divisor = _product_chunk(chunk)
+        if isinstance(divisor, float) and (divisor == 0 or math.isinf(divisor)):
+            result = _divide_each(result, chunk)
+            continue
+        try:
+            result /= divisor
+        except OverflowError:  # float / int converts the int, which fails past ~1.8e308
+            result = _divide_each(result, chunk)
+    return result
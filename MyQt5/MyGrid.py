@@ -0,0 +1,162 @@
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, QSize, Qt, pyqtSignal
+from PyQt5.QtWidgets import QAbstractItemView, QHeaderView, QStyle, QStyledItemDelegate, QTableView
+
+
+class ClickableGridModel(QAbstractTableModel):
+    """
+    A flat list of item texts laid out in a fixed number of columns.
+
+    Item i sits at row i // columns, column i % columns. The model holds
+    only the strings, so a grid of 100,000 items costs about as much memory
+    as the list itself.
+    """
+
+    def __init__(self, items=(), columns=1, parent=None):
+        super().__init__(parent)
+        if columns < 1:
+            raise ValueError("columns must be at least 1.")
+        self._items = list(items)
+        self._columns = columns
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return -(-len(self._items) // self._columns)  # ceiling division
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._columns
+
+    def item_number(self, index):
+        """Return the flat item number of a model index, or -1 for an empty trailing cell."""
+        if not index.isValid():
+            return -1
+        number = index.row() * self._columns + index.column()
+        return number if number < len(self._items) else -1
+
+    def index_of(self, number):
+        """Return the model index of item number `number`."""
+        return self.index(number // self._columns, number % self._columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        number = self.item_number(index)
+        if number < 0:
+            return None
+        if role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return self._items[number]
+        return None
+
+    def flags(self, index):
+        if self.item_number(index) < 0:
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def item(self, number):
+        return self._items[number]
+
+    def item_count(self):
+        return len(self._items)
+
+    def set_items(self, items):
+        self.beginResetModel()
+        self._items = list(items)
+        self.endResetModel()
+
+    def set_item(self, number, text):
+        self._items[number] = text
+        index = self.index_of(number)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    def columns(self):
+        return self._columns
+
+    def set_columns(self, columns):
+        if columns < 1:
+            raise ValueError("columns must be at least 1.")
+        self.beginResetModel()
+        self._columns = columns
+        self.endResetModel()
+
+
+class ClickableCellDelegate(QStyledItemDelegate):
+    """Paints each cell like a flat button: centred text, highlighted under the mouse."""
+
+    def __init__(self, cell_size=QSize(80, 28), parent=None):
+        super().__init__(parent)
+        self.cell_size = cell_size
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        option.displayAlignment = Qt.AlignCenter
+
+    def paint(self, painter, option, index):
+        if option.state & QStyle.State_MouseOver and index.flags() & Qt.ItemIsEnabled:
+            painter.fillRect(option.rect, option.palette.midlight())
+        super().paint(painter, option, index)
+
+    def sizeHint(self, option, index):
+        return self.cell_size
+
+
+class ClickableGrid(QTableView):
+    """
+    A virtualized grid of clickable cells, for when thousands of ClickableLabels are too many.
+
+    No widget is created per item: the view paints only the cells that are
+    visible, through ClickableCellDelegate. Rows and columns have fixed sizes,
+    so layout does not depend on the number of items.
+
+    Like ClickableLabel, clicks are reported by mouse button, with the item's
+    number (its position in the items list):
+
+        grid = ClickableGrid([f"Seat {n}" for n in range(10000)], columns=20)
+        grid.leftClicked.connect(lambda n: print("booked", grid.item(n)))
+        grid.rightClicked.connect(lambda n: print("details for", n))
+    """
+
+    leftClicked = pyqtSignal(int)
+    rightClicked = pyqtSignal(int)
+
+    def __init__(self, items=(), columns=1, cell_size=QSize(80, 28), parent=None):
+        super().__init__(parent)
+        self.setModel(ClickableGridModel(items, columns, self))
+        self.setItemDelegate(ClickableCellDelegate(cell_size, self))
+        self.setCursor(Qt.PointingHandCursor)
+        self.setMouseTracking(True)  # hover highlight
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.horizontalHeader().hide()
+        self.verticalHeader().hide()
+        self.set_cell_size(cell_size)
+
+    def set_cell_size(self, size):
+        """Give every row and column the same fixed size."""
+        self.itemDelegate().cell_size = size
+        for header, length in ((self.horizontalHeader(), size.width()),
+                               (self.verticalHeader(), size.height())):
+            header.setMinimumSectionSize(1)
+            header.setDefaultSectionSize(length)
+            header.setSectionResizeMode(QHeaderView.Fixed)
+
+    def item(self, number):
+        return self.model().item(number)
+
+    def set_items(self, items):
+        self.model().set_items(items)
+
+    def item_at(self, pos):
+        """Return the number of the item under a viewport position, or -1."""
+        return self.model().item_number(self.indexAt(pos))
+
+    def scroll_to_item(self, number):
+        self.scrollTo(self.model().index_of(number))
+
+    def mousePressEvent(self, event):
+        number = self.item_at(event.pos())
+        if number >= 0:
+            if event.button() == Qt.LeftButton:
+                self.leftClicked.emit(number)
+            elif event.button() == Qt.RightButton:
+                self.rightClicked.emit(number)
+        super().mousePressEvent(event)
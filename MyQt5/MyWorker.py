@@ -0,0 +1,226 @@
+import multiprocessing
+import threading
+import traceback
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+THREAD = "thread"
+PROCESS = "process"
+
+
+class JobQueueFull(RuntimeError):
+    """Raised by WorkerPool.submit when max_pending jobs are already waiting or running."""
+
+
+class _ThreadJob(QRunnable):
+
+    def __init__(self, pool, job_id, fn, args, kwargs, with_progress):
+        super().__init__()
+        self.setAutoDelete(False)  # the pool keeps it until it finishes
+        self.pool = pool
+        self.job_id = job_id
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.with_progress = with_progress
+        self.cancel_requested = threading.Event()
+
+    def run(self):
+        pool, job_id = self.pool, self.job_id
+        if self.cancel_requested.is_set():
+            pool._finish(job_id, cancelled=True)
+            return
+        pool.started.emit(job_id)
+        kwargs = self.kwargs
+        if self.with_progress:
+            kwargs = dict(kwargs, progress=lambda value: pool.progress.emit(job_id, value),
+                          cancelled=self.cancel_requested.is_set)
+        try:
+            value = self.fn(*self.args, **kwargs)
+        except Exception:
+            pool._finish(job_id, error=traceback.format_exc())
+        else:
+            pool._finish(job_id, value=value, cancelled=self.cancel_requested.is_set())
+
+
+class WorkerPool(QObject):
+    """
+    Runs slow work off the GUI thread and reports back through Qt signals.
+
+    I/O-bound jobs (kind="thread") run on a QThreadPool. CPU-bound jobs
+    (kind="process", e.g. MyMath.calculate.list_product over huge integers)
+    run in a process pool, so they do not hold the GIL while the GUI paints.
+    Signals are emitted from worker threads and delivered to slots in the
+    GUI thread, so slots can update widgets directly.
+
+    Process jobs start worker processes with the "spawn" method, which
+    re-imports the main script in every worker. A script that submits
+    process jobs must therefore create its application and pool inside an
+    `if __name__ == "__main__":` block, or multiprocessing fails with a
+    RuntimeError about the bootstrapping phase.
+
+    Signals (all carry the job id returned by submit):
+        started(job_id)            A thread job began running.
+        progress(job_id, value)    A thread job submitted with_progress reported progress.
+        result(job_id, value)      The job returned value.
+        error(job_id, message)     The job raised; message is the traceback text.
+        cancelled(job_id)          The job was cancelled; its result, if any, was discarded.
+        finished(job_id)           Always emitted last, whatever the outcome.
+
+    Example (inside the main guard):
+        >>> pool = WorkerPool(max_pending=8)
+        >>> pool.result.connect(lambda job, value: label.setText(str(value)))
+        >>> button.clicked.connect(lambda: pool.submit(lcm_many, numbers, kind="process"))
+    """
+
+    started = pyqtSignal(int)
+    progress = pyqtSignal(int, object)
+    result = pyqtSignal(int, object)
+    error = pyqtSignal(int, str)
+    cancelled = pyqtSignal(int)
+    finished = pyqtSignal(int)
+
+    def __init__(self, max_threads=None, max_processes=None, max_pending=64, parent=None):
+        """
+        Args:
+            max_threads (int, optional): Threads for thread jobs. Defaults to Qt's ideal thread count.
+            max_processes (int, optional): Processes for process jobs. Defaults to the CPU count.
+            max_pending (int): Most jobs allowed to be queued or running at once; submit
+                               raises JobQueueFull beyond that. Defaults to 64.
+        """
+        super().__init__(parent)
+        self.thread_pool = QThreadPool(self)
+        if max_threads:
+            self.thread_pool.setMaxThreadCount(max_threads)
+        self.max_processes = max_processes
+        self.max_pending = max_pending
+        self._executor = None
+        self._jobs = {}  # job id -> _ThreadJob or concurrent.futures.Future
+        self._lock = threading.Lock()
+        self._next_id = 1
+
+    def pending(self):
+        """Return the number of jobs queued or running."""
+        with self._lock:
+            return len(self._jobs)
+
+    def submit(self, fn, *args, kind=THREAD, with_progress=False, **kwargs):
+        """
+        Queue fn(*args, **kwargs) and return its job id.
+
+        Args:
+            fn: The function to run. Process jobs need a picklable, module-level function.
+            kind (str): "thread" for I/O-bound work, "process" for CPU-bound work.
+            with_progress (bool): Thread jobs only. Call fn with two extra keyword
+                arguments: progress(value), which emits the progress signal, and
+                cancelled(), which returns True once cancel() was called, so long
+                loops can stop early.
+
+        Raises:
+            JobQueueFull: If max_pending jobs are already queued or running.
+            ValueError: If kind is unknown, or with_progress is used with a process job.
+        """
+        if kind not in (THREAD, PROCESS):
+            raise ValueError(f"kind must be {THREAD!r} or {PROCESS!r}.")
+        if with_progress and kind == PROCESS:
+            raise ValueError("with_progress is only supported for thread jobs.")
+        with self._lock:
+            if len(self._jobs) >= self.max_pending:
+                raise JobQueueFull(f"{len(self._jobs)} jobs are already pending.")
+            job_id = self._next_id
+            self._next_id += 1
+            if kind == THREAD:
+                job = self._jobs[job_id] = _ThreadJob(self, job_id, fn, args, kwargs, with_progress)
+            else:
+                job = self._jobs[job_id] = self._process_executor().submit(fn, *args, **kwargs)
+
+        if kind == THREAD:
+            self.thread_pool.start(job)
+        else:
+            job.add_done_callback(lambda future: self._process_done(job_id, future))
+        return job_id
+
+    def _process_executor(self):
+        if self._executor is None:
+            # "spawn" avoids forking a process that has Qt threads running
+            self._executor = ProcessPoolExecutor(self.max_processes,
+                                                 mp_context=multiprocessing.get_context("spawn"))
+        return self._executor
+
+    def _process_done(self, job_id, future):
+        try:
+            value = future.result()
+        except CancelledError:
+            self._finish(job_id, cancelled=True)
+        except Exception as e:
+            self._finish(job_id, error="".join(traceback.format_exception(type(e), e, e.__traceback__)))
+        else:
+            self._finish(job_id, value=value)
+
+    def _finish(self, job_id, value=None, error=None, cancelled=False):
+        with self._lock:
+            self._jobs.pop(job_id, None)
+        if cancelled:
+            self.cancelled.emit(job_id)
+        elif error is not None:
+            self.error.emit(job_id, error)
+        else:
+            self.result.emit(job_id, value)
+        self.finished.emit(job_id)
+
+    def cancel(self, job_id):
+        """
+        Cancel a job.
+
+        Queued jobs never run. A running thread job keeps running until it
+        returns (or notices cancelled() if submitted with_progress), and its
+        result is discarded. A process job that already started cannot be
+        stopped and finishes normally.
+
+        Returns:
+            bool: True if the job will be reported as cancelled.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            return False
+        if isinstance(job, _ThreadJob):
+            job.cancel_requested.set()
+            if self.thread_pool.tryTake(job):  # still queued: report it now
+                self._finish(job_id, cancelled=True)
+            return True
+        return job.cancel()  # the done callback reports the cancellation
+
+    def cancel_all(self):
+        """Cancel every pending job."""
+        with self._lock:
+            job_ids = list(self._jobs)
+        for job_id in job_ids:
+            self.cancel(job_id)
+
+    def wait(self, msecs=-1):
+        """
+        Block until all thread jobs are done (or msecs pass) and all process jobs are done.
+
+        Meant for shutdown and tests; in the GUI, connect to finished instead.
+        Signals emitted meanwhile are delivered once the event loop runs again.
+        """
+        done = self.thread_pool.waitForDone(msecs)
+        with self._lock:
+            futures = [job for job in self._jobs.values() if not isinstance(job, _ThreadJob)]
+        for future in futures:
+            try:
+                future.exception()
+            except CancelledError:
+                pass
+        return done
+
+    def shutdown(self, cancel_pending=True):
+        """Stop the pool, optionally cancelling queued jobs, and wait for running ones."""
+        if cancel_pending:
+            self.cancel_all()
+        self.thread_pool.waitForDone()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
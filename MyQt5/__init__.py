@@ -1,2 +1,35 @@
-from .MyLabel import ClickableLabel
-from .MyButton import MyButton
+"""
+Custom PyQt5 widgets.
+
+The widgets are imported on first use (PEP 562), so `import MyQt5` does not
+load PyQt5 until a widget is actually needed:
+
+    from MyQt5 import ClickableLabel   # PyQt5 is imported here
+"""
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY = {
+    "ClickableLabel": "MyLabel",
+    "MyButton": "MyButton",
+    "ClickableGrid": "MyGrid",
+    "ClickableGridModel": "MyGrid",
+    "ClickableCellDelegate": "MyGrid",
+    "WorkerPool": "MyWorker",
+    "JobQueueFull": "MyWorker",
+}
+
+__all__ = sorted(_LAZY)
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value  # later lookups no longer reach __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
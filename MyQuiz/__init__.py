@@ -0,0 +1,45 @@
+"""
+Multiple-choice quizzes: questions, quiz runners, grading and analysis.
+
+Names are resolved lazily (PEP 562): `from MyQuiz import MCQ` loads only
+the framework, not the server, question banks or grading code.
+"""
+import importlib
+
+_LAZY = {
+    "MCQ": "framework",
+    "quiz": "mcq_template",
+    "quiz_async": "mcq_template",
+    "ask_questions": "mcq_template",
+    "show_score": "mcq_template",
+    "QuizServer": "server",
+    "JsonlQuestionBank": "question_bank",
+    "SqliteQuestionBank": "question_bank",
+    "BatchGrader": "grading",
+    "answer_key": "grading",
+    "ItemAnalysis": "analytics",
+    "adaptive_quiz": "adaptive",
+    "VariantGenerator": "variants",
+    "SessionJournal": "journal",
+    "journaled_quiz": "journal",
+}
+
+_SUBMODULES = {"framework", "mcq_template", "server", "question_bank", "grading",
+               "analytics", "adaptive", "variants", "journal"}
+
+__all__ = sorted(_LAZY)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | _SUBMODULES)
@@ -0,0 +1,192 @@
+import math
+from array import array
+from bisect import bisect_left
+from typing import Callable, Optional, Sequence, Tuple
+from MyQuiz.framework import MCQ
+from MyQuiz.mcq_template import show_score
+
+
+def difficulty_from_p(p_value: float, floor: float = 0.01) -> float:
+    """
+    Convert a proportion-correct (p-value) into a difficulty on the logit scale.
+
+    Args:
+        p_value (float): Proportion of students answering correctly.
+        floor (float): p-values are clamped to [floor, 1 - floor] to keep the result finite.
+
+    Returns:
+        float: 0.0 for p = 0.5, positive for harder questions, negative for easier ones.
+    """
+    p = min(max(p_value, floor), 1 - floor)
+    return math.log((1 - p) / p)
+
+
+class DifficultyIndex:
+    """
+    Questions sorted by difficulty, with O(log n) lookup of the nearest unused one.
+
+    Difficulties are kept in a sorted array('d') and searched with bisect.
+    Used questions are skipped with two "next unused" pointer arrays (one
+    per direction) that are path-compressed as they are followed, so
+    skipping over long runs of used questions costs amortized near O(1).
+
+    Attributes:
+        difficulties (array): The difficulties in ascending order.
+        order (array): order[i] is the original position of the i-th easiest question.
+    """
+
+    def __init__(self, difficulties: Sequence[float]) -> None:
+        """
+        Build the index.
+
+        Args:
+            difficulties: One difficulty per question (e.g. from `difficulty_from_p`).
+
+        Raises:
+            ValueError: If there are no difficulties.
+        """
+        if len(difficulties) == 0:  # also works for NumPy arrays
+            raise ValueError("Difficulties list cannot be empty.")
+        order = sorted(range(len(difficulties)), key=difficulties.__getitem__)
+        self.order = array("l", order)
+        self.difficulties = array("d", (difficulties[i] for i in order))
+        n = len(order)
+        self._up = array("l", range(n + 1))       # next unused at or above; n = none
+        self._down = array("l", range(n + 1))     # (next unused at or below) + 1; 0 = none
+        self.remaining = n
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    @staticmethod
+    def _find(links, i):
+        while links[i] != i:
+            links[i] = links[links[i]]
+            i = links[i]
+        return i
+
+    def take_nearest(self, target: float) -> Optional[int]:
+        """
+        Mark the unused question closest in difficulty to target as used.
+
+        Returns:
+            int or None: Its original position, or None if every question is used.
+        """
+        if not self.remaining:
+            return None
+        pos = bisect_left(self.difficulties, target)
+        above = self._find(self._up, min(pos, len(self.order)))
+        below = self._find(self._down, pos) - 1   # largest unused index < pos
+        if above == len(self.order) or (
+                below >= 0 and target - self.difficulties[below] <= self.difficulties[above] - target):
+            chosen = below
+        else:
+            chosen = above
+        self._up[chosen] = chosen + 1
+        self._down[chosen + 1] = chosen
+        self.remaining -= 1
+        return self.order[chosen]
+
+
+class AdaptiveSelector:
+    """
+    Chooses questions to match a running ability estimate (computerized adaptive testing).
+
+    Uses the one-parameter logistic (Rasch) model: a student of ability
+    theta answers a question of difficulty b correctly with probability
+    1 / (1 + exp(b - theta)). After each answer theta moves towards the
+    observed result by a step that shrinks as more questions are answered,
+    and the test information is accumulated to give a standard error. Both
+    updates are O(1); choosing the next question is O(log n).
+
+    Attributes:
+        ability (float): The current ability estimate, on the difficulty scale.
+        answered (int): Number of answers recorded.
+        score (int): Number of correct answers.
+    """
+
+    def __init__(self, difficulties: Sequence[float], start_ability: float = 0.0,
+                 step: float = 1.0) -> None:
+        """
+        Args:
+            difficulties: One difficulty per question, on the logit scale.
+            start_ability (float): Initial ability estimate. Defaults to 0.0 (average).
+            step (float): Size of the first ability update. Defaults to 1.0.
+        """
+        self.index = DifficultyIndex(difficulties)
+        self._difficulties = difficulties
+        self.ability = start_ability
+        self.step = step
+        self.answered = 0
+        self.score = 0
+        self._information = 0.0
+        self._current: Optional[int] = None
+
+    @property
+    def standard_error(self) -> float:
+        """Standard error of the ability estimate (infinite before the first answer)."""
+        return 1 / math.sqrt(self._information) if self._information else math.inf
+
+    def next_item(self) -> Optional[int]:
+        """Return the position of the next question to ask, or None when none are left."""
+        self._current = self.index.take_nearest(self.ability)
+        return self._current
+
+    def record(self, correct: bool) -> float:
+        """
+        Update the ability estimate with the answer to the last question.
+
+        Returns:
+            float: The new ability estimate.
+
+        Raises:
+            RuntimeError: If no question is pending.
+        """
+        if self._current is None:
+            raise RuntimeError("No question is awaiting an answer; call next_item() first.")
+        b = self._difficulties[self._current]
+        expected = 1 / (1 + math.exp(b - self.ability))
+        self.answered += 1
+        self.score += bool(correct)
+        self.ability += self.step / math.sqrt(self.answered) * (correct - expected)
+        self._information += expected * (1 - expected)
+        self._current = None
+        return self.ability
+
+
+def adaptive_quiz(questions: Sequence[MCQ], difficulties: Sequence[float],
+                  max_questions: int = 10, target_error: Optional[float] = None,
+                  show_result: bool = True,
+                  ask: Callable[[MCQ], bool] = MCQ.ask_question) -> Optional[Tuple[int, int, float]]:
+    """
+    Run a quiz that picks each question to suit the student's running ability estimate.
+
+    Args:
+        questions (list): The question bank.
+        difficulties (list): One difficulty per question on the logit scale,
+                             e.g. `difficulty_from_p` of item-analysis p-values.
+        max_questions (int): Stop after this many questions. Defaults to 10.
+        target_error (float, optional): Stop early once the ability's standard error
+                                        falls below this. Defaults to None.
+        show_result (bool): If True, displays the score at the end like `quiz`.
+        ask (callable): Asks one question and returns whether it was answered
+                        correctly. Defaults to `MCQ.ask_question`.
+
+    Returns:
+        None if show_result is True, otherwise (score, total_questions, ability).
+    """
+    if len(questions) != len(difficulties):
+        raise ValueError("Need exactly one difficulty per question.")
+    selector = AdaptiveSelector(difficulties)
+    while selector.answered < max_questions:
+        if target_error is not None and selector.standard_error < target_error:
+            break
+        position = selector.next_item()
+        if position is None:
+            break
+        selector.record(ask(questions[position]))
+
+    if show_result:
+        show_score(selector.score, selector.answered)
+    else:
+        return selector.score, selector.answered, selector.ability
@@ -0,0 +1,268 @@
+import json
+import math
+from typing import Dict, Hashable, Iterable, Mapping, NamedTuple, Optional, Tuple
+from MyQuiz.framework import MCQ
+
+
+class RunningStats:
+    """
+    Welford's online mean and variance.
+
+    Values are added one at a time in O(1) without storing them, and two
+    accumulators can be merged exactly (Chan et al.), so partial results from
+    parallel workers combine into the same answer as a single pass.
+
+    Attributes:
+        n (int): Number of values added.
+        mean (float): Their mean.
+    """
+
+    __slots__ = ("n", "mean", "_m2")
+
+    def __init__(self) -> None:
+        self.n = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, value: float) -> None:
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self._m2 += delta * (value - self.mean)
+
+    def merge(self, other: "RunningStats") -> None:
+        """Fold another accumulator into this one."""
+        if not other.n:
+            return
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self._m2 += other._m2 + delta * delta * self.n * other.n / n
+        self.mean += delta * other.n / n
+        self.n = n
+
+    @property
+    def variance(self) -> float:
+        """Population variance (0.0 for fewer than two values)."""
+        return self._m2 / self.n if self.n > 1 else 0.0
+
+    def copy(self) -> "RunningStats":
+        clone = RunningStats()
+        clone.n, clone.mean, clone._m2 = self.n, self.mean, self._m2
+        return clone
+
+
+class ItemStats(NamedTuple):
+    """
+    Item-analysis statistics for one question.
+
+    Attributes:
+        qid: The question's id.
+        responses (int): Number of students who saw the question.
+        difficulty (float): Proportion answering correctly (the p-value); higher is easier.
+        discrimination (float or None): Point-biserial correlation between answering
+            correctly and the total score; None until both groups have members and
+            the scores vary.
+        distractors (dict): How often each option was chosen, by option number
+            (0 for unanswered).
+    """
+    qid: Hashable
+    responses: int
+    difficulty: float
+    discrimination: Optional[float]
+    distractors: Dict[int, int]
+
+
+class _ItemAccumulator:
+    __slots__ = ("correct_answer", "right", "wrong", "choices", "cached")
+
+    def __init__(self, correct_answer: int) -> None:
+        self.correct_answer = correct_answer
+        self.right = RunningStats()  # total scores of students who got it right
+        self.wrong = RunningStats()  # ... and of those who got it wrong
+        self.choices: Dict[int, int] = {}
+        self.cached: Optional[ItemStats] = None
+
+    def stats(self, qid) -> ItemStats:
+        if self.cached is None:
+            right, wrong = self.right, self.wrong
+            n = right.n + wrong.n
+            p = right.n / n if n else 0.0
+            discrimination = None
+            if right.n and wrong.n:
+                combined = right.copy()
+                combined.merge(wrong)
+                if combined.variance > 0:
+                    discrimination = ((right.mean - wrong.mean) / math.sqrt(combined.variance)
+                                      * math.sqrt(p * (1 - p)))
+            self.cached = ItemStats(qid, n, p, discrimination, dict(self.choices))
+        return self.cached
+
+
+class ItemAnalysis:
+    """
+    Incremental item analysis over a growing log of quiz submissions.
+
+    Every submission updates per-question accumulators in O(questions
+    answered): option counts, plus Welford mean/variance of the total score
+    for the students who got the question right and for those who got it
+    wrong. Difficulty, point-biserial discrimination and distractor counts
+    follow from these without revisiting old submissions. `snapshot()` only
+    recomputes questions touched since the last call.
+
+    Discrimination uses the uncorrected total score (the question itself is
+    included in the total).
+
+    Example:
+        >>> analysis = ItemAnalysis.from_questions(questions)
+        >>> analysis.record({0: 2, 1: 4, 2: 1})   # question id -> option chosen
+        >>> analysis.snapshot()[0].difficulty
+    """
+
+    def __init__(self, key: Mapping[Hashable, int]) -> None:
+        """
+        Start an empty analysis.
+
+        Args:
+            key: The correct option number of every question, by question id.
+        """
+        self._items: Dict[Hashable, _ItemAccumulator] = {
+            qid: _ItemAccumulator(answer) for qid, answer in key.items()}
+        self._dirty = set(self._items)
+        self._snapshot: Dict[Hashable, ItemStats] = {}
+        self.submissions = 0
+        self.log_offsets: Dict[str, int] = {}
+
+    @classmethod
+    def from_questions(cls, questions: Iterable[MCQ]) -> "ItemAnalysis":
+        """
+        Build an analysis from MCQ objects.
+
+        Questions with a `qid` attribute (e.g. from a question bank) use it as
+        their id; others use their position in the list.
+        """
+        return cls({getattr(q, "qid", idx): q.correct_answer for idx, q in enumerate(questions)})
+
+    def record(self, answers: Mapping[Hashable, int]) -> int:
+        """
+        Add one student's submission.
+
+        Args:
+            answers: Option chosen per question id; 0 or None means unanswered.
+                     Questions the student did not see can be left out.
+
+        Returns:
+            int: The submission's total score.
+
+        Raises:
+            KeyError: If a question id is not in the key.
+        """
+        items = self._items
+        graded = [(items[qid], option or 0) for qid, option in answers.items()]
+        score = sum(1 for item, option in graded if option == item.correct_answer)
+        for item, option in graded:
+            if option == item.correct_answer:
+                item.right.add(score)
+            else:
+                item.wrong.add(score)
+            item.choices[option] = item.choices.get(option, 0) + 1
+            item.cached = None
+        self._dirty.update(answers)
+        self.submissions += 1
+        return score
+
+    def record_many(self, submissions: Iterable[Mapping[Hashable, int]]) -> int:
+        """Add several submissions; returns how many were added."""
+        count = 0
+        for answers in submissions:
+            self.record(answers)
+            count += 1
+        return count
+
+    def consume_log(self, path: str) -> int:
+        """
+        Add the submissions appended to a JSONL log since the last call.
+
+        Each line is {"answers": {"<question id>": option, ...}} (other keys are
+        ignored). Ids are converted back to int when they look like one. The
+        read position is remembered per path in `log_offsets`, so each call
+        only reads new lines; a trailing partial line is left for the next call.
+        The position only moves past a line once it was recorded, so a line
+        that raises is read again on the next call instead of being lost.
+
+        Returns:
+            int: Number of submissions added.
+
+        Raises:
+            KeyError: If a line names a question id that is not in the key.
+        """
+        count = 0
+        offset = self.log_offsets.get(path, 0)
+        with open(path, "rb") as file:
+            file.seek(offset)
+            for line in file:
+                if not line.endswith(b"\n"):
+                    break
+                if line.strip():
+                    answers = json.loads(line)["answers"]
+                    self.record({int(qid) if qid.lstrip("-").isdigit() else qid: option
+                                 for qid, option in answers.items()})
+                    count += 1
+                offset += len(line)
+                self.log_offsets[path] = offset
+        return count
+
+    def merge(self, other: "ItemAnalysis") -> None:
+        """
+        Fold in the results of another analysis with the same key, e.g. from a worker
+        that processed a different part of the log.
+
+        Raises:
+            ValueError: If a question's correct answer differs between the two.
+        """
+        for qid, theirs in other._items.items():
+            mine = self._items.get(qid)
+            if mine is None:
+                mine = self._items[qid] = _ItemAccumulator(theirs.correct_answer)
+            elif mine.correct_answer != theirs.correct_answer:
+                raise ValueError(f"Question {qid!r} has different correct answers.")
+            mine.right.merge(theirs.right)
+            mine.wrong.merge(theirs.wrong)
+            for option, count in theirs.choices.items():
+                mine.choices[option] = mine.choices.get(option, 0) + count
+            mine.cached = None
+            self._dirty.add(qid)
+        self.submissions += other.submissions
+
+    def item(self, qid: Hashable) -> ItemStats:
+        """Return the current statistics for one question."""
+        return self._items[qid].stats(qid)
+
+    def snapshot(self) -> Dict[Hashable, ItemStats]:
+        """
+        Return the current statistics for every question.
+
+        Only questions changed since the previous snapshot are recomputed, so
+        calling this after every submission is cheap. The returned dict is a
+        new object; ItemStats are immutable.
+        """
+        for qid in self._dirty:
+            self._snapshot[qid] = self._items[qid].stats(qid)
+        self._dirty.clear()
+        return dict(self._snapshot)
+
+    def flagged(self, min_responses: int = 30, min_discrimination: float = 0.2,
+                difficulty_range: Tuple[float, float] = (0.2, 0.9)) -> Dict[Hashable, ItemStats]:
+        """
+        Return questions that look too easy, too hard or poorly discriminating.
+
+        Args:
+            min_responses (int): Ignore questions with fewer responses. Defaults to 30.
+            min_discrimination (float): Flag point-biserials below this. Defaults to 0.2.
+            difficulty_range (tuple): Flag p-values outside (low, high). Defaults to (0.2, 0.9).
+        """
+        low, high = difficulty_range
+        return {qid: stats for qid, stats in self.snapshot().items()
+                if stats.responses >= min_responses
+                and (not low <= stats.difficulty <= high
+                     or stats.discrimination is None
+                     or stats.discrimination < min_discrimination)}
@@ -1,6 +1,8 @@
 import random
-from MyLibrary.input_validators import validate_number
-from typing import Dict
+from time import perf_counter
+from MyLibrary import instrumentation
+from MyLibrary.input_validators import validate_number, validate_number_async
+from typing import Dict, Tuple
 
 
 class MCQ:
@@ -53,15 +55,49 @@ class MCQ:
         Returns:
             bool: True if the answer is correct, False otherwise.
         """
-        option_keys = list(self.options.keys())
-        random.shuffle(option_keys)  # Shuffle the keys instead of values
-        shuffled_options = {idx + 1: self.options[k] for idx, k in enumerate(option_keys)}
-        correct_option_index = list(shuffled_options.keys())[option_keys.index(self.correct_answer)]
+        shuffled_options, correct_option_index = self._shuffle_options()
         print(f"\n{self.question}")
         for idx, opt in shuffled_options.items():
             print(f"{idx}: {opt}")
         return self.check_answer(correct_option_index)
 
+    def _shuffle_options(self, rng: random.Random = random) -> Tuple[Dict[int, str], int]:
+        """
+        Shuffle the options for display.
+
+        Args:
+            rng: Source of randomness with a `shuffle` method. Defaults to the `random` module;
+                 pass a seeded random.Random for reproducible order.
+
+        Returns:
+            tuple: The shuffled options numbered from 1, and the number of the correct one.
+        """
+        option_keys = list(self.options)
+        rng.shuffle(option_keys)  # Shuffle the keys instead of values
+        shuffled_options = {}
+        correct_option_index = 0
+        for idx, key in enumerate(option_keys, 1):
+            shuffled_options[idx] = self.options[key]
+            if key == self.correct_answer:
+                correct_option_index = idx
+        return shuffled_options, correct_option_index
+
+    async def ask_question_async(self, io) -> bool:
+        """
+        Async variant of `ask_question` that talks to an async I/O backend.
+
+        Args:
+            io: An object with `ask(prompt)` and `say(text)` coroutines, such as
+                `MyLibrary.async_io.StreamSession`.
+
+        Returns:
+            bool: True if the answer is correct, False otherwise.
+        """
+        shuffled_options, correct_option_index = self._shuffle_options()
+        lines = [f"\n{self.question}"] + [f"{idx}: {opt}" for idx, opt in shuffled_options.items()]
+        await io.say("\n".join(lines))
+        return await self.check_answer_async(io, correct_option_index)
+
     def check_answer(self, correct_option_index: int) -> bool:
         """
         Check the user's answer against the correct answer.
@@ -72,10 +108,49 @@ class MCQ:
         Returns:
             bool: True if the user's answer is correct, False otherwise.
         """
-        user_answer = validate_number("\nWhat is the correct answer?: ", 1, self.limit)
+        metrics = instrumentation.metrics
+        if metrics is None:
+            user_answer = validate_number("\nWhat is the correct answer?: ", 1, self.limit)
+        else:
+            label = self.metric_id()
+            start = perf_counter()
+            with metrics.prompt_id(f"question:{label}"):
+                user_answer = validate_number("\nWhat is the correct answer?: ", 1, self.limit)
+            metrics.observe("question_answer_seconds", perf_counter() - start, question=label)
+            metrics.inc("question_answers_total", question=label,
+                        result="correct" if user_answer == correct_option_index else "wrong")
         if user_answer == correct_option_index:
             print("Correct answer!")
             return True
         else:
             print(f"Wrong answer. The correct answer was: {self.options[self.correct_answer]}")
             return False
+
+    def metric_id(self) -> str:
+        """
+        Identify the question in instrumentation metrics.
+
+        Returns:
+            str: The question's `qid` when it has one (e.g. from a question bank), otherwise its text.
+        """
+        qid = getattr(self, "qid", None)
+        return str(qid) if qid is not None else self.question
+
+    async def check_answer_async(self, io, correct_option_index: int) -> bool:
+        """
+        Async variant of `check_answer` that talks to an async I/O backend.
+
+        Args:
+            io: An object with `ask(prompt)` and `say(text)` coroutines.
+            correct_option_index (int): The index of the correct answer option.
+
+        Returns:
+            bool: True if the user's answer is correct, False otherwise.
+        """
+        user_answer = await validate_number_async(io, "\nWhat is the correct answer?: ", 1, self.limit)
+        if user_answer == correct_option_index:
+            await io.say("Correct answer!")
+            return True
+        else:
+            await io.say(f"Wrong answer. The correct answer was: {self.options[self.correct_answer]}")
+            return False
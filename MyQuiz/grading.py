@@ -0,0 +1,258 @@
+from array import array
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from MyMath.streaming import is_ndarray, load_numpy
+from MyQuiz.framework import MCQ
+
+# Answer sheets graded per chunk. Bounds memory to a few MB for any file size
+# while keeping NumPy's per-call overhead negligible.
+CHUNK_ROWS = 8192
+
+# Response value recorded for a question the student left blank. Negative,
+# so it never collides with an option key (keys may start at 0).
+UNANSWERED = -1
+
+
+def answer_key(questions: Iterable[MCQ]) -> array:
+    """
+    Build an answer key from a list of MCQ objects.
+
+    Args:
+        questions (iterable): The MCQ objects, in the column order of the answer sheets.
+
+    Returns:
+        array: The `correct_answer` of every question, as array('l').
+    """
+    return array("l", (q.correct_answer for q in questions))
+
+
+class GradeReport:
+    """
+    Results of grading a batch of answer sheets.
+
+    Attributes:
+        students (int): Number of answer sheets graded.
+        scores: Correct answers per student, in input order. A NumPy int array
+                when NumPy is installed, otherwise array('l').
+        correct_counts (list): Number of students who answered each question correctly.
+        answered_counts (list): Number of students who answered each question at all.
+        ids (list or None): Student ids, when the response file has an id column.
+    """
+
+    __slots__ = ("students", "scores", "correct_counts", "answered_counts", "ids")
+
+    def __init__(self, questions: int) -> None:
+        self.students = 0
+        self.scores = array("l")
+        self.correct_counts = [0] * questions
+        self.answered_counts = [0] * questions
+        self.ids: Optional[List[str]] = None
+
+    @property
+    def total_questions(self) -> int:
+        return len(self.correct_counts)
+
+    def percent_correct(self) -> List[float]:
+        """Return the percentage of all students who answered each question correctly."""
+        if not self.students:
+            return [0.0] * self.total_questions
+        return [100 * count / self.students for count in self.correct_counts]
+
+    def mean_score(self) -> float:
+        """Return the average score, or 0.0 if no sheets were graded."""
+        return sum(self.correct_counts) / self.students if self.students else 0.0
+
+    def __repr__(self) -> str:
+        return (f"GradeReport(students={self.students}, questions={self.total_questions}, "
+                f"mean_score={self.mean_score():.2f})")
+
+
+class BatchGrader:
+    """
+    Grades recorded answer sheets offline, many at a time.
+
+    Each answer sheet is one row of option numbers, one per question, in the
+    same order as the answer key; UNANSWERED (-1) means blank. Rows are graded a chunk
+    at a time: with NumPy each chunk is compared against the key in a single
+    vectorized operation, otherwise a pure-Python loop is used. Either way
+    only one chunk is held in memory, so response files of any size work.
+
+    Example:
+        >>> grader = BatchGrader(answer_key(questions))
+        >>> report = grader.grade_file("responses.csv")
+        >>> report.scores[:3], report.percent_correct()
+    """
+
+    def __init__(self, key: Union[Sequence[int], Iterable[MCQ]], chunk_rows: int = CHUNK_ROWS) -> None:
+        """
+        Set up the grader.
+
+        Args:
+            key: The correct option number of every question, or the MCQ objects themselves.
+            chunk_rows (int): Answer sheets graded per chunk. Defaults to CHUNK_ROWS.
+
+        Raises:
+            ValueError: If the key is empty or contains UNANSWERED, or chunk_rows is less than 1.
+        """
+        key = list(key)
+        if key and isinstance(key[0], MCQ):
+            key = answer_key(key)
+        if not key:
+            raise ValueError("Answer key cannot be empty.")
+        if UNANSWERED in key:
+            raise ValueError(f"Answer key cannot contain UNANSWERED ({UNANSWERED}).")
+        if chunk_rows < 1:
+            raise ValueError("chunk_rows must be at least 1.")
+        self.key = array("l", key)
+        self.chunk_rows = chunk_rows
+        np = load_numpy()
+        self._np_key = np.asarray(self.key, dtype=np.int64) if np is not None else None
+
+    def __len__(self) -> int:
+        return len(self.key)
+
+    def grade_chunk(self, rows) -> Tuple[Sequence[int], List[int], List[int]]:
+        """
+        Grade one chunk of answer sheets.
+
+        Args:
+            rows: A 2-D NumPy array or a sequence of equal-length rows.
+
+        Returns:
+            tuple: (scores per student, correct count per question, answered count per question).
+
+        Raises:
+            ValueError: If a row does not have one response per question.
+        """
+        if self._np_key is not None:
+            return self._grade_numpy(rows)
+        return self._grade_python(rows)
+
+    def _grade_numpy(self, rows):
+        np = load_numpy()
+        responses = np.asarray(rows, dtype=np.int64)
+        if responses.size == 0:
+            responses = responses.reshape(0, len(self.key))
+        if responses.ndim != 2 or responses.shape[1] != len(self.key):
+            raise ValueError(f"Each answer sheet must have {len(self.key)} responses.")
+        correct = responses == self._np_key
+        answered = responses != UNANSWERED
+        return (correct.sum(axis=1),
+                correct.sum(axis=0).tolist(),
+                answered.sum(axis=0).tolist())
+
+    def _grade_python(self, rows):
+        key = self.key
+        questions = len(key)
+        scores = array("l")
+        correct_counts = [0] * questions
+        answered_counts = [0] * questions
+        for row in rows:
+            if len(row) != questions:
+                raise ValueError(f"Each answer sheet must have {questions} responses.")
+            score = 0
+            for idx, (response, answer) in enumerate(zip(row, key)):
+                if response == answer:
+                    correct_counts[idx] += 1
+                    score += 1
+                if response != UNANSWERED:
+                    answered_counts[idx] += 1
+            scores.append(score)
+        return scores, correct_counts, answered_counts
+
+    def _row_chunks(self, responses) -> Iterator:
+        if is_ndarray(responses):
+            for start in range(0, responses.shape[0], self.chunk_rows):
+                yield responses[start:start + self.chunk_rows]
+            return
+        iterator = iter(responses)
+        while True:
+            chunk = list(islice(iterator, self.chunk_rows))
+            if not chunk:
+                return
+            yield chunk
+
+    def grade_chunks(self, chunks: Iterable) -> GradeReport:
+        """
+        Grade answer sheets that arrive already split into chunks.
+
+        Args:
+            chunks (iterable): Chunks accepted by `grade_chunk`.
+
+        Returns:
+            GradeReport: The combined results.
+        """
+        report = GradeReport(len(self.key))
+        score_parts = []
+        for chunk in chunks:
+            scores, correct_counts, answered_counts = self.grade_chunk(chunk)
+            score_parts.append(scores)
+            report.students += len(scores)
+            for idx, count in enumerate(correct_counts):
+                report.correct_counts[idx] += count
+            for idx, count in enumerate(answered_counts):
+                report.answered_counts[idx] += count
+        if self._np_key is not None:
+            np = load_numpy()
+            report.scores = np.concatenate(score_parts) if score_parts else np.zeros(0, dtype=np.int64)
+        else:
+            for scores in score_parts:
+                report.scores.extend(scores)
+        return report
+
+    def grade(self, responses) -> GradeReport:
+        """
+        Grade a matrix of answer sheets.
+
+        Args:
+            responses: A 2-D NumPy array (students x questions), or any iterable of rows,
+                       including a generator.
+
+        Returns:
+            GradeReport: Scores per student and correctness per question.
+        """
+        return self.grade_chunks(self._row_chunks(responses))
+
+    def grade_file(self, path: str, delimiter: str = ",", header: bool = False,
+                   id_column: bool = False) -> GradeReport:
+        """
+        Grade a delimited text file with one answer sheet per line.
+
+        The file is read `chunk_rows` lines at a time. Empty fields count as
+        unanswered.
+
+        Args:
+            path (str): Path to the response file.
+            delimiter (str): Field separator. Defaults to ",".
+            header (bool): Skip the first line. Defaults to False.
+            id_column (bool): The first field of each line is a student id,
+                              kept in `GradeReport.ids`. Defaults to False.
+
+        Returns:
+            GradeReport: Scores per student and correctness per question.
+
+        Raises:
+            ValueError: If a field is not a whole number or a line has the wrong length.
+        """
+        ids: Optional[List[str]] = [] if id_column else None
+
+        def chunks():
+            with open(path, encoding="utf-8") as file:
+                if header:
+                    next(file, None)
+                for line_chunk in self._row_chunks(line for line in file if line.strip()):
+                    yield [self._parse_line(line, delimiter, ids) for line in line_chunk]
+
+        report = self.grade_chunks(chunks())
+        report.ids = ids
+        return report
+
+    @staticmethod
+    def _parse_line(line: str, delimiter: str, ids: Optional[List[str]]) -> List[int]:
+        fields = line.rstrip("\r\n").split(delimiter)
+        if ids is not None:
+            ids.append(fields.pop(0).strip())
+        try:
+            return [int(field) if field.strip() else UNANSWERED for field in fields]
+        except ValueError:
+            raise ValueError(f"Invalid response in line: {line.strip()!r}") from None
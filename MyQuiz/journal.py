@@ -0,0 +1,244 @@
+import json
+import os
+import time
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from MyQuiz.framework import MCQ
+from MyQuiz.mcq_template import show_score
+
+
+class SessionState:
+    """
+    What the journal knows about one quiz session.
+
+    Attributes:
+        score (int): Correct answers so far.
+        total_questions (int): Questions answered so far.
+        answered (list): Positions of the answered questions, in answer order.
+        finished (bool): Whether the session reached its end.
+    """
+
+    __slots__ = ("score", "total_questions", "answered", "finished")
+
+    def __init__(self) -> None:
+        self.score = 0
+        self.total_questions = 0
+        self.answered: List[int] = []
+        self.finished = False
+
+    def apply(self, event: dict) -> None:
+        kind = event.get("e")
+        if kind is None:
+            self.answered.append(event["q"])
+            self.total_questions += 1
+            self.score += event["c"]
+        elif kind == "end":
+            self.finished = True
+        elif kind == "start":
+            self.finished = False
+
+    def result(self) -> Tuple[int, int]:
+        """Return (score, total_questions), as `quiz` does."""
+        return self.score, self.total_questions
+
+    def __repr__(self) -> str:
+        return (f"SessionState(score={self.score}, total_questions={self.total_questions}, "
+                f"finished={self.finished})")
+
+
+def read_events(path: str) -> Iterator[dict]:
+    """
+    Yield the events in a journal file.
+
+    A torn last line (left by a crash in the middle of a write) is skipped.
+    """
+    try:
+        file = open(path, "rb")
+    except FileNotFoundError:
+        return
+    with file:
+        for line in file:
+            if not line.endswith(b"\n"):
+                break
+            if line.strip():
+                yield json.loads(line)
+
+
+def replay(path: str) -> Dict[str, SessionState]:
+    """
+    Rebuild the state of every session recorded in a journal.
+
+    Args:
+        path (str): Path to the journal file.
+
+    Returns:
+        dict: SessionState by session id; `state.result()` gives (score, total_questions).
+    """
+    sessions: Dict[str, SessionState] = {}
+    for event in read_events(path):
+        state = sessions.get(event["s"])
+        if state is None:
+            state = sessions[event["s"]] = SessionState()
+        state.apply(event)
+    return sessions
+
+
+class SessionJournal:
+    """
+    Append-only log of quiz answers that survives a crash.
+
+    Every answer is appended as one compact JSON line. Lines are buffered
+    and written with a single write and fsync per batch (group commit), so
+    bulk or server writers appending many events in quick succession do not
+    pay for an fsync on every answer. A batch is committed when it reaches
+    `batch_size` events, when an event arrives `max_delay` seconds or more
+    after the batch's first one, when a session ends, and on
+    `flush()`/`close()`. Events still buffered are lost in a crash.
+
+    `max_delay` is not a timer: nothing is written while no events arrive.
+    Interactive writers, which wait for a person between events, should
+    call `flush()` after each one (as `journaled_quiz` does) or use
+    batch_size=1.
+
+    Opening a journal replays the existing file, so interrupted sessions
+    can be resumed (see `journaled_quiz`).
+
+    Example:
+        >>> with SessionJournal("answers.jsonl") as journal:
+        ...     journaled_quiz(questions, journal, session_id="alice")
+    """
+
+    def __init__(self, path: str, batch_size: int = 64, max_delay: float = 0.05,
+                 fsync: bool = True) -> None:
+        """
+        Open (or create) a journal.
+
+        Args:
+            path (str): Path to the journal file.
+            batch_size (int): Events per group commit. Defaults to 64.
+            max_delay (float): Commit when an event is added and the oldest buffered
+                               event is at least this many seconds old. It is only
+                               checked on `record`/`start`, so it bounds latency for
+                               busy writers only. Defaults to 0.05.
+            fsync (bool): Force each batch to disk with os.fsync. Defaults to True.
+
+        Raises:
+            ValueError: If batch_size is less than 1.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+        self.path = path
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.fsync = fsync
+        self.sessions = replay(path)
+        self._truncate_torn_line()
+        self._file = open(path, "ab")
+        self._buffer: List[bytes] = []
+        self._oldest = 0.0
+        self.commits = 0
+
+    def _truncate_torn_line(self) -> None:
+        """Cut off a partial last line so new events start on a fresh line."""
+        try:
+            file = open(self.path, "rb+")
+        except FileNotFoundError:
+            return
+        with file:
+            size = end = file.seek(0, os.SEEK_END)
+            while end > 0:
+                start = max(0, end - 4096)
+                file.seek(start)
+                newline = file.read(end - start).rfind(b"\n")
+                if newline >= 0:
+                    end = start + newline + 1
+                    break
+                end = start
+            if end != size:
+                file.truncate(end)
+
+    def state(self, session_id: str) -> SessionState:
+        """Return a session's state, creating an empty one for new sessions."""
+        state = self.sessions.get(session_id)
+        if state is None:
+            state = self.sessions[session_id] = SessionState()
+        return state
+
+    def _append(self, event: dict) -> None:
+        self.state(event["s"]).apply(event)
+        if not self._buffer:
+            self._oldest = time.monotonic()
+        self._buffer.append(json.dumps(event, separators=(",", ":")).encode() + b"\n")
+        if len(self._buffer) >= self.batch_size or time.monotonic() - self._oldest >= self.max_delay:
+            self.flush()
+
+    def start(self, session_id: str, total: int) -> None:
+        """Record that a session started (or resumed) with `total` questions."""
+        self._append({"s": session_id, "e": "start", "n": total})
+
+    def record(self, session_id: str, question: int, correct: bool) -> None:
+        """Record one answer: the question's position and whether it was correct."""
+        self._append({"s": session_id, "q": question, "c": int(correct)})
+
+    def end(self, session_id: str) -> None:
+        """Record that a session finished, and commit."""
+        self._append({"s": session_id, "e": "end"})
+        self.flush()
+
+    def flush(self) -> None:
+        """Write buffered events and, if enabled, fsync them in one go."""
+        if not self._buffer:
+            return
+        self._file.write(b"".join(self._buffer))
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._buffer.clear()
+        self.commits += 1
+
+    def close(self) -> None:
+        self.flush()
+        self._file.close()
+
+    def __enter__(self) -> "SessionJournal":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def journaled_quiz(questions: Sequence[MCQ], journal: SessionJournal, session_id: str,
+                   show_result: bool = True) -> Optional[Tuple[int, int]]:
+    """
+    Run a quiz that records every answer and resumes an interrupted session.
+
+    Questions the session already answered (according to the journal) are
+    skipped, and their results count towards the final score. A session
+    that already finished is not asked again. Each answer is committed as
+    soon as it is given, so a crash loses at most the question on screen.
+
+    Args:
+        questions (list): A list of MCQ objects representing the quiz questions.
+        journal (SessionJournal): The journal to record answers in.
+        session_id (str): Identifies the student/session across restarts.
+        show_result (bool): If True, displays the score at the end like `quiz`.
+
+    Returns:
+        None if show_result is True, otherwise (score, total_questions).
+    """
+    state = journal.state(session_id)
+    if not state.finished:
+        if state.answered:
+            print(f"\nResuming: {state.total_questions} of {len(questions)} questions already answered.")
+        journal.start(session_id, len(questions))
+        done = set(state.answered)
+        for position, question in enumerate(questions):
+            if position not in done:
+                journal.record(session_id, position, question.ask_question())
+                # Commit now: the next event only comes after the user answers again
+                journal.flush()
+        journal.end(session_id)
+
+    if show_result:
+        show_score(*state.result())
+    else:
+        return state.result()
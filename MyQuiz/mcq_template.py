@@ -54,3 +54,41 @@ def quiz(questions: list, show_result: bool = True):
     else:
         return score, total_questions
 
+
+async def ask_questions_async(io, questions):
+    """
+    Async variant of `ask_questions` that talks to an async I/O backend.
+
+    Args:
+        io: An object with `ask(prompt)` and `say(text)` coroutines.
+        questions (list): A list of MCQ objects representing the quiz questions.
+
+    Returns:
+        tuple: (score, total_questions), as for `ask_questions`.
+    """
+    score, total_questions = 0, 0
+    for q in questions:
+        if await q.ask_question_async(io):
+            score += 1
+        total_questions += 1
+    return score, total_questions
+
+
+async def quiz_async(io, questions: list, show_result: bool = True):
+    """
+    Async variant of `quiz` that talks to an async I/O backend.
+
+    Args:
+        io: An object with `ask(prompt)` and `say(text)` coroutines.
+        questions (list): A list of MCQ objects representing the quiz questions.
+        show_result (bool): If True, sends the score to the user at the end.
+
+    Returns:
+        tuple: (score, total_questions). Unlike `quiz`, the score is always
+        returned so that servers can record it.
+    """
+    score, total_questions = await ask_questions_async(io, questions)
+
+    if show_result:
+        await io.say(f"\nYour score: {score} / {total_questions}")
+    return score, total_questions
@@ -0,0 +1,359 @@
+import json
+import random
+import sqlite3
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from MyQuiz.framework import MCQ
+
+
+class BankQuestion(MCQ):
+    """
+    An MCQ loaded from a question bank, with its id, topic and tags.
+
+    Attributes:
+        qid (int): The question's id within its bank.
+        topic (str or None): The topic the question belongs to.
+        tags (tuple): Free-form tags.
+    """
+
+    __slots__ = ("qid", "topic", "tags")
+
+    def __init__(self, qid: int, question: str, options: Dict[int, str], correct_answer: int,
+                 topic: Optional[str] = None, tags: Sequence[str] = ()):
+        super().__init__(question, options, correct_answer)
+        self.qid = qid
+        self.topic = topic
+        self.tags = tuple(tags)
+
+    def __repr__(self) -> str:
+        return f"BankQuestion(qid={self.qid}, topic={self.topic!r}, question={self.question!r})"
+
+
+def question_to_record(question: MCQ, topic: Optional[str] = None, tags: Sequence[str] = ()) -> dict:
+    """
+    Convert an MCQ into the JSON-friendly dict stored in question banks.
+
+    Args:
+        question (MCQ): The question to store.
+        topic (str, optional): Its topic. Defaults to the question's own topic, if any.
+        tags (sequence): Its tags. Defaults to the question's own tags, if any.
+
+    Returns:
+        dict: {"question", "options", "answer", "topic", "tags"}.
+    """
+    return {
+        "question": question.question,
+        "options": {str(key): text for key, text in question.options.items()},
+        "answer": question.correct_answer,
+        "topic": topic if topic is not None else getattr(question, "topic", None),
+        "tags": list(tags or getattr(question, "tags", ())),
+    }
+
+
+def _options_from_json(options) -> Dict[int, str]:
+    if isinstance(options, list):
+        return {idx: text for idx, text in enumerate(options, 1)}
+    return {int(key): text for key, text in options.items()}
+
+
+def _choose(ids: Sequence[int], n: int, rng) -> List[int]:
+    if n > len(ids):
+        raise ValueError(f"Cannot sample {n} questions; only {len(ids)} match.")
+    return rng.sample(ids, n)
+
+
+class JsonlQuestionBank:
+    """
+    A read-only question bank stored as one JSON object per line.
+
+    Opening the bank scans the file once and keeps only a compact index:
+    the byte offset of every line (array('q')) plus the positions of each
+    topic and tag. Questions are parsed from disk only when requested, so a
+    bank with hundreds of thousands of questions costs a few bytes each.
+
+    Each line looks like:
+        {"question": "2+2?", "options": {"1": "3", "2": "4"}, "answer": 2,
+         "topic": "maths", "tags": ["easy"]}
+    "options" may also be a list (numbered from 1). Question ids are the
+    0-based line positions among the non-blank lines.
+
+    Example:
+        >>> with JsonlQuestionBank("questions.jsonl") as bank:
+        ...     quiz(bank.sample(10, topic="maths"))
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Open the bank and build its index.
+
+        Args:
+            path (str): Path to the JSONL file.
+
+        Raises:
+            ValueError: If a line is not valid JSON.
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        self._offsets = array("q")
+        self._by_topic: Dict[str, array] = {}
+        self._by_tag: Dict[str, array] = {}
+        self._build_index()
+
+    def _build_index(self) -> None:
+        offset = 0
+        for line in self._file:
+            if line.strip():
+                position = len(self._offsets)
+                try:
+                    record = json.loads(line)
+                except ValueError as e:
+                    raise ValueError(f"Invalid JSON on line {position + 1}: {e}") from None
+                self._offsets.append(offset)
+                topic = record.get("topic")
+                if topic is not None:
+                    self._by_topic.setdefault(topic, array("l")).append(position)
+                for tag in record.get("tags", ()):
+                    self._by_tag.setdefault(tag, array("l")).append(position)
+            offset += len(line)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def topics(self) -> List[str]:
+        """Return every topic in the bank."""
+        return list(self._by_topic)
+
+    def tags(self) -> List[str]:
+        """Return every tag in the bank."""
+        return list(self._by_tag)
+
+    def get(self, qid: int) -> BankQuestion:
+        """
+        Load one question by id.
+
+        Raises:
+            IndexError: If there is no question with that id.
+        """
+        self._file.seek(self._offsets[qid])
+        record = json.loads(self._file.readline())
+        return BankQuestion(qid, record["question"], _options_from_json(record["options"]),
+                            record["answer"], record.get("topic"), record.get("tags", ()))
+
+    def ids(self, topic: Optional[str] = None, tag: Optional[str] = None) -> Sequence[int]:
+        """Return the ids of questions with the given topic and/or tag (all if neither)."""
+        if topic is None and tag is None:
+            return range(len(self))
+        if topic is not None and tag is not None:
+            tagged = set(self._by_tag.get(tag, ()))
+            return [qid for qid in self._by_topic.get(topic, ()) if qid in tagged]
+        index = self._by_topic if topic is not None else self._by_tag
+        return index.get(topic if topic is not None else tag, array("l"))
+
+    def sample(self, n: int, topic: Optional[str] = None, tag: Optional[str] = None,
+               rng: Optional[random.Random] = None) -> List[BankQuestion]:
+        """
+        Load n random questions, optionally limited to a topic and/or tag.
+
+        Only the chosen questions are read from disk.
+
+        Args:
+            n (int): Number of questions.
+            topic (str, optional): Only sample questions with this topic.
+            tag (str, optional): Only sample questions with this tag.
+            rng (random.Random, optional): Random generator, for reproducible samples.
+
+        Returns:
+            list: n BankQuestion objects, ready for `mcq_template.quiz`.
+
+        Raises:
+            ValueError: If fewer than n questions match.
+        """
+        return [self.get(qid) for qid in _choose(self.ids(topic, tag), n, rng or random)]
+
+    def __iter__(self) -> Iterator[BankQuestion]:
+        for qid in range(len(self)):
+            yield self.get(qid)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "JsonlQuestionBank":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @staticmethod
+    def write(path: str, questions: Iterable, append: bool = False) -> int:
+        """
+        Write questions to a JSONL bank file.
+
+        Args:
+            path (str): Path to the JSONL file.
+            questions (iterable): MCQ objects, or (MCQ, topic, tags) tuples.
+            append (bool): Add to an existing file instead of replacing it.
+
+        Returns:
+            int: Number of questions written.
+        """
+        count = 0
+        with open(path, "a" if append else "w", encoding="utf-8") as file:
+            for item in questions:
+                record = question_to_record(*item) if isinstance(item, tuple) else question_to_record(item)
+                file.write(json.dumps(record, ensure_ascii=False) + "\n")
+                count += 1
+        return count
+
+
+class SqliteQuestionBank:
+    """
+    A question bank stored in an SQLite database.
+
+    Questions are fetched by primary key only when needed, and topic/tag
+    filters use indexes, so sampling never loads the whole bank.
+
+    Example:
+        >>> with SqliteQuestionBank("questions.db") as bank:
+        ...     bank.add(MCQ("2+2?", {1: "3", 2: "4"}, 2), topic="maths", tags=["easy"])
+        ...     questions = bank.sample(5, tag="easy")
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS questions (
+            id INTEGER PRIMARY KEY,
+            question TEXT NOT NULL,
+            options TEXT NOT NULL,
+            answer INTEGER NOT NULL,
+            topic TEXT
+        );
+        CREATE INDEX IF NOT EXISTS questions_topic ON questions (topic);
+        CREATE TABLE IF NOT EXISTS question_tags (
+            question_id INTEGER NOT NULL REFERENCES questions (id) ON DELETE CASCADE,
+            tag TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS question_tags_tag ON question_tags (tag, question_id);
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        """
+        Open (or create) the database.
+
+        Args:
+            path (str): Path to the database file. Defaults to an in-memory database.
+        """
+        self.path = path
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA foreign_keys = ON")  # off by default; needed for ON DELETE CASCADE
+        self._db.executescript(self._SCHEMA)
+
+    def add(self, question: MCQ, topic: Optional[str] = None, tags: Sequence[str] = ()) -> int:
+        """Store one question and return its id. Call commit() (or use `with`) to save."""
+        return self.add_many([(question, topic, tags)])[0]
+
+    def add_many(self, questions: Iterable) -> List[int]:
+        """
+        Store many questions in one transaction.
+
+        Args:
+            questions (iterable): MCQ objects, or (MCQ, topic, tags) tuples.
+
+        Returns:
+            list: The new question ids.
+        """
+        ids = []
+        with self._db:
+            for item in questions:
+                record = question_to_record(*item) if isinstance(item, tuple) else question_to_record(item)
+                cursor = self._db.execute(
+                    "INSERT INTO questions (question, options, answer, topic) VALUES (?, ?, ?, ?)",
+                    (record["question"], json.dumps(record["options"]), record["answer"], record["topic"]))
+                qid = cursor.lastrowid
+                self._db.executemany("INSERT INTO question_tags (question_id, tag) VALUES (?, ?)",
+                                     [(qid, tag) for tag in record["tags"]])
+                ids.append(qid)
+        return ids
+
+    def commit(self) -> None:
+        self._db.commit()
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM questions").fetchone()[0]
+
+    def topics(self) -> List[str]:
+        """Return every topic in the bank."""
+        rows = self._db.execute("SELECT DISTINCT topic FROM questions WHERE topic IS NOT NULL")
+        return [topic for (topic,) in rows]
+
+    def tags(self) -> List[str]:
+        """Return every tag in the bank."""
+        return [tag for (tag,) in self._db.execute("SELECT DISTINCT tag FROM question_tags")]
+
+    def _tags_for(self, qid: int) -> Tuple[str, ...]:
+        rows = self._db.execute("SELECT tag FROM question_tags WHERE question_id = ?", (qid,))
+        return tuple(tag for (tag,) in rows)
+
+    def get(self, qid: int) -> BankQuestion:
+        """
+        Load one question by id.
+
+        Raises:
+            KeyError: If there is no question with that id.
+        """
+        row = self._db.execute(
+            "SELECT question, options, answer, topic FROM questions WHERE id = ?", (qid,)).fetchone()
+        if row is None:
+            raise KeyError(qid)
+        question, options, answer, topic = row
+        return BankQuestion(qid, question, _options_from_json(json.loads(options)), answer,
+                            topic, self._tags_for(qid))
+
+    def ids(self, topic: Optional[str] = None, tag: Optional[str] = None) -> List[int]:
+        """Return the ids of questions with the given topic and/or tag (all if neither)."""
+        if tag is not None:
+            sql = "SELECT q.id FROM questions q JOIN question_tags t ON t.question_id = q.id WHERE t.tag = ?"
+            params = [tag]
+            if topic is not None:
+                sql += " AND q.topic = ?"
+                params.append(topic)
+        elif topic is not None:
+            sql, params = "SELECT id FROM questions WHERE topic = ?", [topic]
+        else:
+            sql, params = "SELECT id FROM questions", []
+        return [qid for (qid,) in self._db.execute(sql, params)]
+
+    def sample(self, n: int, topic: Optional[str] = None, tag: Optional[str] = None,
+               rng: Optional[random.Random] = None) -> List[BankQuestion]:
+        """
+        Load n random questions, optionally limited to a topic and/or tag.
+
+        Only the ids are read for the whole selection; full rows are fetched
+        for the n chosen questions.
+
+        Args:
+            n (int): Number of questions.
+            topic (str, optional): Only sample questions with this topic.
+            tag (str, optional): Only sample questions with this tag.
+            rng (random.Random, optional): Random generator, for reproducible samples.
+
+        Returns:
+            list: n BankQuestion objects, ready for `mcq_template.quiz`.
+
+        Raises:
+            ValueError: If fewer than n questions match.
+        """
+        return [self.get(qid) for qid in _choose(self.ids(topic, tag), n, rng or random)]
+
+    def __iter__(self) -> Iterator[BankQuestion]:
+        for qid in self.ids():
+            yield self.get(qid)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "SqliteQuestionBank":
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if exc_type is None:
+            self._db.commit()
+        self.close()
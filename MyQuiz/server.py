@@ -0,0 +1,108 @@
+import asyncio
+from typing import Callable, List, Optional, Sequence, Union
+from MyLibrary.async_io import StreamSession
+from MyQuiz.framework import MCQ
+from MyQuiz.mcq_template import quiz_async
+
+
+class QuizServer:
+    """
+    Runs one MCQ quiz per TCP connection, all in a single asyncio event loop.
+
+    The protocol is plain text lines, so any line-based client works
+    (`nc localhost 8888`, `telnet`, or asyncio.open_connection in tests).
+    Each connection gets the questions, answers them line by line and
+    receives its score before the server closes the connection.
+
+    Attributes:
+        max_sessions (int or None): Limit on simultaneous quizzes.
+        completed (list): (score, total_questions) for every finished session.
+        active_sessions (int): Number of sessions currently in progress.
+
+    Example:
+        >>> server = QuizServer(questions, port=8888)
+        >>> asyncio.run(server.serve_forever())
+    """
+
+    def __init__(
+        self,
+        questions: Union[Sequence[MCQ], Callable[[], Sequence[MCQ]]],
+        host: str = "127.0.0.1",
+        port: int = 8888,
+        max_sessions: Optional[int] = None,
+        show_result: bool = True,
+        backlog: int = 1024
+    ) -> None:
+        """
+        Configure the server.
+
+        Args:
+            questions: The questions for every session, or a function called once per
+                       session that returns them (e.g. a random sample).
+            host (str): The interface to listen on. Defaults to "127.0.0.1".
+            port (int): The TCP port. Use 0 to pick a free port. Defaults to 8888.
+            max_sessions (int, optional): Limit on simultaneous quizzes; further clients
+                                          wait for a free slot. Defaults to None (no limit).
+            show_result (bool): Whether to send the score at the end. Defaults to True.
+            backlog (int): Pending-connection queue size. asyncio's default of 100 makes
+                           bursts of new clients wait for TCP retries. Defaults to 1024.
+        """
+        self.questions = questions
+        self.host = host
+        self.port = port
+        self.show_result = show_result
+        self.backlog = backlog
+        self.max_sessions = max_sessions
+        self.completed: List[tuple] = []
+        self.active_sessions = 0
+        self._limit = None  # created in start(), inside the running event loop
+        self._server = None
+
+    def _session_questions(self) -> Sequence[MCQ]:
+        return self.questions() if callable(self.questions) else self.questions
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Run one quiz session on a connection."""
+        session = StreamSession(reader, writer)
+        if self._limit is not None:
+            await self._limit.acquire()
+        self.active_sessions += 1
+        try:
+            result = await quiz_async(session, self._session_questions(), self.show_result)
+            self.completed.append(result)
+        except (EOFError, ConnectionError):
+            pass  # the client left mid-quiz
+        finally:
+            self.active_sessions -= 1
+            if self._limit is not None:
+                self._limit.release()
+            await session.close()
+
+    async def start(self) -> int:
+        """
+        Start listening without blocking.
+
+        Returns:
+            int: The port actually bound (useful when port=0).
+        """
+        # Before Python 3.10, asyncio primitives bind to the loop that is
+        # current when they are created, so the semaphore is made here.
+        self._limit = asyncio.Semaphore(self.max_sessions) if self.max_sessions else None
+        self._server = await asyncio.start_server(
+            self.handle_client, self.host, self.port, backlog=self.backlog)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self.port
+
+    async def serve_forever(self) -> None:
+        """Start the server (if needed) and serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self) -> None:
+        """Stop accepting connections and wait for the listener to close."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
@@ -0,0 +1,302 @@
+import hashlib
+import random
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from MyQuiz.framework import MCQ
+from MyQuiz.mcq_template import show_score
+
+_MAGIC = b"MQVF"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBcII")   # magic, version, order typecode, questions, forms
+_ID_LENGTH = struct.Struct("<H")
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_little_endian(typecode: str, data: bytes) -> array:
+    values = array(typecode, data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def student_seed(exam_seed, student_id: str) -> int:
+    """
+    Derive a stable 64-bit seed for one student's form.
+
+    The seed comes from a BLAKE2 hash of the exam seed and the student id,
+    so it is the same on every machine and Python version (unlike hash()).
+    """
+    digest = hashlib.blake2b(f"{exam_seed}\x00{student_id}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class ExamForm:
+    """
+    One shuffled variant of an exam, stored as permutation arrays.
+
+    Attributes:
+        form_id (str): The student (or paper form) this variant belongs to.
+        question_order (array): question_order[i] is the original position of the
+            question shown i-th.
+        option_orders (array): For every original question, in original order, the
+            original option positions in the order they are shown, all in one array('B').
+        answer_key (array): For every original question, the shown number (from 1) of
+            the correct option, so grading a response is a single lookup.
+    """
+
+    __slots__ = ("form_id", "question_order", "option_orders", "answer_key", "_offsets")
+
+    def __init__(self, form_id: str, question_order: array, option_orders: array,
+                 answer_key: array, offsets: Sequence[int]) -> None:
+        self.form_id = form_id
+        self.question_order = question_order
+        self.option_orders = option_orders
+        self.answer_key = answer_key
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.question_order)
+
+    def __repr__(self) -> str:
+        return f"ExamForm(form_id={self.form_id!r}, questions={len(self)})"
+
+    def option_order(self, question: int) -> array:
+        """Return the shown order of one question's options, as original option positions."""
+        return self.option_orders[self._offsets[question]:self._offsets[question + 1]]
+
+    def present(self, questions: Sequence[MCQ], shown: int) -> Tuple[MCQ, Dict[int, str], int]:
+        """
+        Lay out the shown-th question of this form.
+
+        Args:
+            questions (list): The exam's MCQ objects, in their original order.
+            shown (int): Position on the form, from 0.
+
+        Returns:
+            tuple: (the MCQ, its options numbered from 1 in form order, number of the correct one).
+        """
+        original = self.question_order[shown]
+        question = questions[original]
+        texts = list(question.options.values())
+        options = {idx: texts[pos] for idx, pos in enumerate(self.option_order(original), 1)}
+        return question, options, self.answer_key[original]
+
+    def grade(self, responses: Sequence[int]) -> int:
+        """
+        Score one answer sheet filled in on this form.
+
+        Args:
+            responses: The option number chosen for each question, in the order the
+                       questions appear on the form (0 for unanswered).
+
+        Returns:
+            int: Number of correct answers.
+        """
+        key, order = self.answer_key, self.question_order
+        return sum(1 for shown, response in enumerate(responses) if response == key[order[shown]])
+
+    def to_original(self, questions: Sequence[MCQ], responses: Sequence[int],
+                    unanswered: int = 0) -> List[int]:
+        """
+        Translate a form's responses into original question order and option keys,
+        so answer sheets from every form can go through one `grading.BatchGrader`
+        or `analytics.ItemAnalysis` key.
+
+        Args:
+            questions (list): The exam's MCQ objects, in their original order.
+            responses: Shown option numbers in form order (0 or None for unanswered).
+            unanswered (int): Value written for unanswered questions. Defaults to 0,
+                as ItemAnalysis expects; pass grading.UNANSWERED for BatchGrader.
+
+        Returns:
+            list: The chosen option key per original question.
+
+        Raises:
+            ValueError: If there are more responses than questions, or a response is
+                        not the number of one of the shown options.
+        """
+        if len(responses) > len(self.question_order):
+            raise ValueError(f"Form {self.form_id!r} has {len(self.question_order)} questions, "
+                             f"got {len(responses)} responses.")
+        result = [unanswered] * len(self.question_order)
+        for shown, response in enumerate(responses):
+            if response:
+                original = self.question_order[shown]
+                start, end = self._offsets[original], self._offsets[original + 1]
+                if not 1 <= response <= end - start:
+                    raise ValueError(f"Response {response!r} to question {shown + 1} on form "
+                                     f"{self.form_id!r} ({questions[original].question!r}) must be "
+                                     f"between 1 and {end - start}.")
+                position = self.option_orders[start + response - 1]
+                result[original] = list(questions[original].options)[position]
+        return result
+
+
+class VariantGenerator:
+    """
+    Generates reproducible shuffled variants of an exam in bulk.
+
+    Each form is derived from the exam seed and a student id, so the same
+    student always gets the same form and any form can be rebuilt or
+    regraded later. Forms can also be saved to a compact binary file (a few
+    bytes per question) with `save`, which keeps them exact even if the
+    questions or the random module change.
+
+    Example:
+        >>> generator = VariantGenerator(questions, exam_seed="midterm-2024")
+        >>> forms = generator.generate(student_ids)
+        >>> VariantGenerator.save("midterm.forms", forms)
+        >>> forms = VariantGenerator.load("midterm.forms")
+        >>> forms[0].grade([2, 1, 4, 3])
+    """
+
+    def __init__(self, questions: Sequence[MCQ], exam_seed="", shuffle_questions: bool = True,
+                 shuffle_options: bool = True) -> None:
+        """
+        Args:
+            questions (list): The exam's MCQ objects, in their original order.
+            exam_seed: Any str or int that identifies this exam sitting.
+            shuffle_questions (bool): Shuffle question order. Defaults to True.
+            shuffle_options (bool): Shuffle options within each question. Defaults to True.
+
+        Raises:
+            ValueError: If there are no questions or a question has more than 255 options.
+        """
+        if not questions:
+            raise ValueError("Questions list cannot be empty.")
+        self.questions = questions
+        self.exam_seed = exam_seed
+        self.shuffle_questions = shuffle_questions
+        self.shuffle_options = shuffle_options
+        counts = [len(q.options) for q in questions]
+        if max(counts) > 255:
+            raise ValueError("Questions can have at most 255 options.")
+        self._counts = counts
+        self._offsets = [0]
+        for count in counts:
+            self._offsets.append(self._offsets[-1] + count)
+        self._correct_positions = [list(q.options).index(q.correct_answer) for q in questions]
+        self._order_code = "H" if len(questions) <= 0xFFFF else "I"
+
+    def form(self, student_id) -> ExamForm:
+        """Build the form for one student."""
+        rng = random.Random(student_seed(self.exam_seed, student_id))
+        order = list(range(len(self.questions)))
+        if self.shuffle_questions:
+            rng.shuffle(order)
+
+        option_orders = array("B")
+        answer_key = array("B")
+        for count, correct in zip(self._counts, self._correct_positions):
+            positions = list(range(count))
+            if self.shuffle_options:
+                rng.shuffle(positions)
+            option_orders.extend(positions)
+            answer_key.append(positions.index(correct) + 1)
+        return ExamForm(str(student_id), array(self._order_code, order), option_orders,
+                        answer_key, self._offsets)
+
+    def generate(self, student_ids: Iterable) -> List[ExamForm]:
+        """Build the forms for many students."""
+        return [self.form(student_id) for student_id in student_ids]
+
+    @staticmethod
+    def save(path: str, forms: Sequence[ExamForm]) -> None:
+        """
+        Write forms to a compact binary file.
+
+        Each form takes its id plus 2 bytes per question for the order (4 for
+        exams over 65535 questions), one byte per option and one byte per
+        question for the answer key.
+
+        Raises:
+            ValueError: If forms is empty or the forms belong to different exams.
+        """
+        if not forms:
+            raise ValueError("Forms list cannot be empty.")
+        first = forms[0]
+        offsets = first._offsets
+        # Check everything before opening the file, so an error leaves no partial file behind
+        if any(len(form) != len(first) or form._offsets != offsets for form in forms):
+            raise ValueError("All forms must come from the same exam.")
+        with open(path, "wb") as file:
+            file.write(_HEADER.pack(_MAGIC, _VERSION, first.question_order.typecode.encode(),
+                                    len(first), len(forms)))
+            file.write(bytes(offsets[i + 1] - offsets[i] for i in range(len(first))))
+            for form in forms:
+                form_id = form.form_id.encode("utf-8")
+                file.write(_ID_LENGTH.pack(len(form_id)) + form_id)
+                file.write(_little_endian(form.question_order))
+                file.write(form.option_orders.tobytes())
+                file.write(form.answer_key.tobytes())
+
+    @staticmethod
+    def load(path: str) -> List[ExamForm]:
+        """
+        Read forms written by `save`.
+
+        Raises:
+            ValueError: If the file is not a forms file or is truncated.
+        """
+        with open(path, "rb") as file:
+            return list(_read_forms(file))
+
+
+def _read_exact(file: BinaryIO, size: int) -> bytes:
+    data = file.read(size)
+    if len(data) != size:
+        raise ValueError("Forms file is truncated.")
+    return data
+
+
+def _read_forms(file: BinaryIO) -> Iterator[ExamForm]:
+    magic, version, typecode, questions, count = _HEADER.unpack(_read_exact(file, _HEADER.size))
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError("Not a forms file, or written by an unsupported version.")
+    typecode = typecode.decode()
+    offsets = [0]
+    for options in _read_exact(file, questions):
+        offsets.append(offsets[-1] + options)
+    order_size = questions * array(typecode).itemsize
+    for _ in range(count):
+        (id_length,) = _ID_LENGTH.unpack(_read_exact(file, _ID_LENGTH.size))
+        form_id = _read_exact(file, id_length).decode("utf-8")
+        order = _from_little_endian(typecode, _read_exact(file, order_size))
+        option_orders = array("B", _read_exact(file, offsets[-1]))
+        answer_key = array("B", _read_exact(file, questions))
+        yield ExamForm(form_id, order, option_orders, answer_key, offsets)
+
+
+def quiz_form(questions: Sequence[MCQ], form: ExamForm, show_result: bool = True) -> Optional[Tuple[int, int]]:
+    """
+    Run a quiz in the question and option order of one form.
+
+    Args:
+        questions (list): The exam's MCQ objects, in their original order.
+        form (ExamForm): The student's form.
+        show_result (bool): If True, displays the score at the end like `quiz`.
+
+    Returns:
+        None if show_result is True, otherwise (score, total_questions).
+    """
+    score = 0
+    for shown in range(len(form)):
+        question, options, correct = form.present(questions, shown)
+        print(f"\n{question.question}")
+        for idx, opt in options.items():
+            print(f"{idx}: {opt}")
+        if question.check_answer(correct):
+            score += 1
+
+    if show_result:
+        show_score(score, len(form))
+    else:
+        return score, len(form)
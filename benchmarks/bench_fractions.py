@@ -0,0 +1,101 @@
+"""
+Compare MyMath.fractions.Rational with the standard library fractions.Fraction.
+
+Run from the repository root:
+    python -m benchmarks.bench_fractions
+    python -m benchmarks.bench_fractions --terms 5000 --repeat 5
+"""
+import argparse
+import fractions
+import random
+import time
+from MyMath.fractions import Rational
+
+
+def best_time(func, repeat=3):
+    """Return the fastest of `repeat` runs of func(), in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def make_pairs(terms, seed=0):
+    rng = random.Random(seed)
+    return [(rng.randint(-1000, 1000), rng.randint(1, 1000)) for _ in range(terms)]
+
+
+def add_loop(cls, pairs):
+    total = cls(0)
+    for num, den in pairs:
+        total = total + cls(num, den)
+    return total
+
+
+def mul_loop(cls, pairs):
+    total = cls(1)
+    for num, den in pairs:
+        total = total * cls(num or 1, den)
+    return total
+
+
+def same_denominator_loop(cls, pairs):
+    total = cls(0, 100)
+    for num, _ in pairs:
+        total = total + cls(num, 100)
+    return total
+
+
+def dot_loop(cls, pairs):
+    total = cls(0)
+    for (a, b), (c, d) in zip(pairs, reversed(pairs)):
+        total = total + cls(a, b) * cls(c, d)
+    return total
+
+
+WORKLOADS = {
+    "add": add_loop,
+    "mul": mul_loop,
+    "add_same_den": same_denominator_loop,
+    "dot": dot_loop,
+}
+
+
+def run(terms, repeat=3):
+    """
+    Time each workload with both fraction types.
+
+    Returns:
+        list: One dict per workload with the timings in seconds.
+    """
+    pairs = make_pairs(terms)
+    rows = []
+    for name, workload in WORKLOADS.items():
+        expected = workload(fractions.Fraction, pairs)
+        result = workload(Rational, pairs)
+        if result != expected:
+            raise AssertionError(f"{name}: Rational gave {result}, Fraction gave {expected}")
+        rows.append({
+            "workload": name,
+            "Fraction": best_time(lambda: workload(fractions.Fraction, pairs), repeat),
+            "Rational": best_time(lambda: workload(Rational, pairs), repeat),
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--terms", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'workload':>14} {'Fraction':>12} {'Rational':>12} {'speedup':>9}")
+    for row in run(args.terms, args.repeat):
+        print(f"{row['workload']:>14} {row['Fraction'] * 1000:>10.2f}ms "
+              f"{row['Rational'] * 1000:>10.2f}ms {row['Fraction'] / row['Rational']:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Measure the cold-start import cost of each package and module with -X importtime.
+
+Run from the repository root:
+    python -m benchmarks.bench_import
+    python -m benchmarks.bench_import --output imports.json
+    python -m benchmarks.suite compare imports_baseline.json imports.json
+
+Results use the suite's JSON format (size 0, seconds per import), so
+`benchmarks.suite compare` flags imports that got slower. Each import runs
+in a fresh interpreter; the best of --repeat runs is kept.
+
+The run fails (exit status 1) if any import takes longer than --max-ms, or
+if importing a module loads one of the optional heavy dependencies in
+LAZY_DEPENDENCIES, which must only be imported on first real use.
+"""
+import argparse
+import json
+import subprocess
+import sys
+from typing import List, Optional, Sequence, Set, Tuple
+from benchmarks.suite import make_report
+
+DEFAULT_MODULES = [
+    "MyLibrary",
+    "MyMath",
+    "MyQuiz",
+    "MyQt5",
+    "MyLibrary.input_validators",
+    "MyLibrary.menu",
+    "MyMath.calculate",
+    "MyMath.decimal",
+    "MyMath.fractions",
+    "MyMath.HCF_LCM",
+    "MyMath.streaming",
+    "MyQuiz.framework",
+    "MyQuiz.grading",
+    "MyQuiz.mcq_template",
+]
+
+# Per-module budget for the cumulative import time. A module that starts
+# importing NumPy at module scope costs about 100 ms and fails this.
+DEFAULT_MAX_MS = 40.0
+
+# Optional dependencies that no module may import until they are used
+LAZY_DEPENDENCIES = ("numpy", "PyQt5")
+
+
+def profile_import(module: str) -> Tuple[int, Set[str]]:
+    """
+    Import a module in a fresh interpreter with -X importtime.
+
+    Returns:
+        tuple: (microseconds spent importing the module and everything it imported,
+                names of all modules that the import loaded).
+
+    Raises:
+        RuntimeError: If the import fails.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            capture_output=True, text=True)
+    if result.returncode:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+    cumulative, loaded = None, set()
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        name = parts[2].strip()
+        loaded.add(name)
+        if name == module:
+            cumulative = int(parts[1])
+    if cumulative is None:
+        raise RuntimeError(f"No import time reported for {module}.")
+    return cumulative, loaded
+
+
+def import_time(module: str) -> int:
+    """Import a module in a fresh interpreter and return its cumulative import time in microseconds."""
+    return profile_import(module)[0]
+
+
+def eager_dependencies(loaded: Set[str]) -> List[str]:
+    """Return the LAZY_DEPENDENCIES found among the loaded module names."""
+    return sorted({name.split(".")[0] for name in loaded} & set(LAZY_DEPENDENCIES))
+
+
+def run(modules: Sequence[str] = DEFAULT_MODULES, repeat: int = 5) -> dict:
+    """
+    Return a suite-format report with the best import time of every module.
+
+    Each result also lists, under "eager", the LAZY_DEPENDENCIES that the
+    import loaded (normally none).
+    """
+    results = []
+    for module in modules:
+        timings, eager = [], set()
+        for _ in range(repeat):
+            microseconds, loaded = profile_import(module)
+            timings.append(microseconds / 1e6)
+            eager.update(eager_dependencies(loaded))
+        timings.sort()
+        results.append({"name": f"import.{module}", "size": 0, "items": 1, "best": timings[0],
+                        "median": timings[len(timings) // 2], "loops": 1, "repeat": repeat,
+                        "eager": sorted(eager)})
+    return make_report(results, repeat=repeat)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", "-o", help="write results as JSON for `suite compare`")
+    parser.add_argument("--max-ms", type=float, default=DEFAULT_MAX_MS,
+                        help=f"exit with status 1 if any import takes longer than this "
+                             f"(default {DEFAULT_MAX_MS:g}; 0 disables the check)")
+    args = parser.parse_args(argv)
+
+    report = run(args.modules, args.repeat)
+    for row in report["results"]:
+        eager = f"  loads {', '.join(row['eager'])}" if row["eager"] else ""
+        print(f"{row['name']:<36} {row['best'] * 1000:>8.2f}ms{eager}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(json.dumps(report, indent=2) + "\n")
+
+    status = 0
+    if args.max_ms:
+        slow = [row["name"] for row in report["results"] if row["best"] * 1000 > args.max_ms]
+        if slow:
+            print(f"\nOver {args.max_ms:g}ms: {', '.join(slow)}")
+            status = 1
+    eager = [f"{row['name']} ({', '.join(row['eager'])})" for row in report["results"] if row["eager"]]
+    if eager:
+        print(f"\nImported optional dependencies eagerly: {', '.join(eager)}")
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
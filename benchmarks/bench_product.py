@@ -0,0 +1,67 @@
+"""
+Compare the linear `list_product` loop with the balanced `tree_product`.
+
+Run from the repository root:
+    python -m benchmarks.bench_product
+    python -m benchmarks.bench_product --processes 4 --sizes 1000 10000 100000
+"""
+import argparse
+import os
+import time
+from MyMath.calculate import list_product, tree_product
+
+DEFAULT_SIZES = [100, 1000, 5000, 20000, 50000]
+
+
+def best_time(func, repeat=3):
+    """Return the fastest of `repeat` runs of func(), in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(sizes, processes=None, repeat=3):
+    """
+    Time factorial-like products (1 * 2 * ... * n) for each input size.
+
+    Returns:
+        list: One dict per size with the timings in seconds.
+    """
+    rows = []
+    for n in sizes:
+        numbers = list(range(1, n + 1))
+        row = {
+            "size": n,
+            "linear": best_time(lambda: list_product(numbers), repeat),
+            "tree": best_time(lambda: tree_product(numbers), repeat),
+        }
+        if processes:
+            row["tree_parallel"] = best_time(lambda: tree_product(numbers, processes), repeat)
+        rows.append(row)
+    return rows
+
+
+def print_table(rows):
+    columns = [key for key in rows[0] if key != "size"]
+    print(f"{'size':>8} " + " ".join(f"{col:>14}" for col in columns) + f" {'speedup':>9}")
+    for row in rows:
+        timings = " ".join(f"{row[col] * 1000:>12.2f}ms" for col in columns)
+        fastest = min(row[col] for col in columns if col != "linear")
+        print(f"{row['size']:>8} {timings} {row['linear'] / fastest:>8.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--processes", type=int, default=None,
+                        help=f"also time the process-pool tree (this machine has {os.cpu_count()} CPUs)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    print_table(run(args.sizes, args.processes, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+Run the benchmark suite and track regressions against a stored baseline.
+
+Run from the repository root:
+    python -m benchmarks.suite run --output baseline.json
+    python -m benchmarks.suite run --output current.json --only hcf_lcm fractions
+    python -m benchmarks.suite compare baseline.json current.json --threshold 0.15
+    python -m benchmarks.suite list
+
+`compare` exits with status 1 if any benchmark got slower than the
+threshold allows, so it can gate a CI job.
+"""
+import argparse
+import datetime
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+from benchmarks.workloads import WORKLOADS, Workload
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+QUICK_SIZES = [1000]
+FORMAT_VERSION = 1
+
+
+def measure(func, repeat: int = 5, min_time: float = 0.05) -> Dict[str, float]:
+    """
+    Time func() precisely, even when one call takes microseconds.
+
+    The number of calls per measurement is doubled until a measurement takes
+    at least min_time; the measurement is then repeated.
+
+    Returns:
+        dict: "best" and "median" seconds per call, "loops" per measurement and "repeat".
+    """
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops *= 2
+    timings = [elapsed / loops]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        timings.append((time.perf_counter() - start) / loops)
+    return {"best": min(timings), "median": statistics.median(timings), "loops": loops, "repeat": repeat}
+
+
+def select(only: Optional[Sequence[str]] = None) -> List[Workload]:
+    """Return the workloads whose name starts with any of the given prefixes (all if none)."""
+    if not only:
+        return list(WORKLOADS.values())
+    return [w for name, w in WORKLOADS.items() if any(name.startswith(prefix) for prefix in only)]
+
+
+def make_report(results: List[dict], **settings) -> dict:
+    """Wrap results with the file format version and details of the interpreter and machine."""
+    meta = {
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+    }
+    meta.update(settings)
+    return {"format": FORMAT_VERSION, "meta": meta, "results": results}
+
+
+def run(sizes: Sequence[int] = DEFAULT_SIZES, only: Optional[Sequence[str]] = None,
+        repeat: int = 5, min_time: float = 0.05, seed: int = 0, verbose: bool = True) -> dict:
+    """
+    Run the selected workloads at every size.
+
+    Returns:
+        dict: {"format", "meta", "results"} ready to be written as JSON. Each result
+        has the workload name, the nominal size, the item count actually used and
+        the timings from `measure`.
+    """
+    results = []
+    for workload in select(only):
+        for size in sizes:
+            items = max(1, int(size * workload.scale))
+            func = workload.build(items, random.Random(f"{seed}:{workload.name}:{items}"))
+            row = {"name": workload.name, "size": size, "items": items}
+            row.update(measure(func, repeat, min_time))
+            results.append(row)
+            if verbose:
+                print(f"{workload.name:<36} {size:>8} {row['best'] * 1000:>12.3f}ms", file=sys.stderr)
+    return make_report(results, seed=seed, repeat=repeat)
+
+
+def _index(report: dict) -> Dict[Tuple[str, int], dict]:
+    return {(row["name"], row["size"]): row for row in report["results"]}
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.2) -> List[dict]:
+    """
+    Compare two reports benchmark by benchmark.
+
+    Best times are compared, as they are the least affected by noise.
+
+    Args:
+        baseline (dict): The stored report.
+        current (dict): The new report.
+        threshold (float): Allowed slowdown, as a fraction (0.2 = 20% slower).
+
+    Returns:
+        list: One dict per benchmark found in both reports, with "name", "size",
+        "baseline", "current", "ratio" (current / baseline) and "status"
+        ("regression", "improvement" or "ok").
+    """
+    rows = []
+    old = _index(baseline)
+    for key, new_row in _index(current).items():
+        old_row = old.get(key)
+        if old_row is None:
+            continue
+        ratio = new_row["best"] / old_row["best"] if old_row["best"] else float("inf")
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 / (1 + threshold):
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append({"name": key[0], "size": key[1], "baseline": old_row["best"],
+                     "current": new_row["best"], "ratio": ratio, "status": status})
+    return rows
+
+
+def print_comparison(rows: List[dict]) -> None:
+    print(f"{'benchmark':<36} {'size':>8} {'baseline':>12} {'current':>12} {'change':>8}")
+    for row in rows:
+        change = f"{(row['ratio'] - 1) * 100:+.1f}%"
+        flag = {"regression": "  SLOWER", "improvement": "  faster"}.get(row["status"], "")
+        print(f"{row['name']:<36} {row['size']:>8} {row['baseline'] * 1000:>10.3f}ms "
+              f"{row['current'] * 1000:>10.3f}ms {change:>8}{flag}")
+
+
+def _load(path: str) -> dict:
+    with open(path, encoding="utf-8") as file:
+        report = json.load(file)
+    if report.get("format") != FORMAT_VERSION:
+        raise SystemExit(f"{path}: unsupported benchmark file format.")
+    return report
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run benchmarks and write JSON results")
+    run_parser.add_argument("--output", "-o", help="results file (default: print to stdout)")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=None)
+    run_parser.add_argument("--quick", action="store_true", help=f"only run size {QUICK_SIZES}")
+    run_parser.add_argument("--only", nargs="+", metavar="PREFIX",
+                            help="only run workloads whose name starts with PREFIX")
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--min-time", type=float, default=0.05)
+    run_parser.add_argument("--seed", type=int, default=0)
+
+    compare_parser = commands.add_parser("compare", help="flag regressions against a baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.2,
+                                help="allowed slowdown as a fraction (default: 0.2)")
+
+    commands.add_parser("list", help="list the available workloads")
+
+    args = parser.parse_args(argv)
+    if args.command == "list":
+        for name, workload in WORKLOADS.items():
+            print(f"{name:<36} x{workload.scale:g}")
+        return 0
+
+    if args.command == "run":
+        sizes = args.sizes or (QUICK_SIZES if args.quick else DEFAULT_SIZES)
+        report = run(sizes, args.only, args.repeat, args.min_time, args.seed)
+        text = json.dumps(report, indent=2)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as file:
+                file.write(text + "\n")
+        else:
+            print(text)
+        return 0
+
+    rows = compare(_load(args.baseline), _load(args.current), args.threshold)
+    print_comparison(rows)
+    regressions = [row for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""
+Reproducible workloads for the benchmark suite (see benchmarks/suite.py).
+
+Every workload is built from a size and a seeded random.Random, so the
+same size always produces the same input data. Building the input is not
+timed; only the returned zero-argument callable is.
+"""
+import builtins
+import io
+import random
+import sys
+from contextlib import contextmanager
+from typing import Callable, Dict, List, NamedTuple
+from MyLibrary.input_validators import NumberValidator, validate_number
+from MyMath.calculate import list_divide, list_product, list_subtraction, list_sum, tree_product
+from MyMath.fractions import fraction_sum, simplify_fraction
+from MyMath.HCF_LCM import gcd, gcd_many, lcm_many
+from MyQuiz.framework import MCQ
+from MyQuiz.grading import UNANSWERED, BatchGrader
+
+
+class Workload(NamedTuple):
+    """
+    One benchmark.
+
+    Attributes:
+        name (str): Dotted name, "<module>.<operation>".
+        build (callable): build(n, rng) returns the callable to time.
+        scale (float): The workload runs on int(size * scale) items, for
+                       operations that are much slower per item than the rest.
+    """
+    name: str
+    build: Callable[[int, random.Random], Callable[[], object]]
+    scale: float = 1.0
+
+
+@contextmanager
+def scripted_input(lines: List[str]):
+    """Answer input() from lines, in order, and discard printed output."""
+    answers = iter(lines)
+    original_input, original_stdout = builtins.input, sys.stdout
+
+    def fake_input(prompt=""):
+        return next(answers)
+
+    builtins.input, sys.stdout = fake_input, io.StringIO()
+    try:
+        yield
+    finally:
+        builtins.input, sys.stdout = original_input, original_stdout
+
+
+def _numbers(n, rng):
+    return [rng.uniform(1, 1000) for _ in range(n)]
+
+
+def _build_list_sum(n, rng):
+    values = _numbers(n, rng)
+    return lambda: list_sum(values)
+
+
+def _build_list_subtraction(n, rng):
+    values = _numbers(n, rng)
+    return lambda: list_subtraction(values)
+
+
+def _build_list_divide(n, rng):
+    values = [rng.uniform(0.5, 2.0) for _ in range(n)]
+    return lambda: list_divide(values)
+
+
+def _build_list_product(n, rng):
+    values = [rng.randint(1, 1000) for _ in range(n)]
+    return lambda: list_product(values)
+
+
+def _build_tree_product(n, rng):
+    values = [rng.randint(1, 1000) for _ in range(n)]
+    return lambda: tree_product(values)
+
+
+def _build_gcd_pairs(n, rng):
+    pairs = [(rng.getrandbits(64), rng.getrandbits(64)) for _ in range(n)]
+    return lambda: [gcd(a, b) for a, b in pairs]
+
+
+def _build_gcd_many(n, rng):
+    factor = rng.getrandbits(32) | 1
+    values = [factor * rng.randint(1, 10 ** 6) for _ in range(n)]
+    return lambda: gcd_many(values)
+
+
+def _build_lcm_many(n, rng):
+    values = [rng.randint(1, 100) for _ in range(n)]
+    return lambda: lcm_many(values)
+
+
+def _build_simplify_fraction(n, rng):
+    pairs = [(rng.randint(-10 ** 6, 10 ** 6), rng.randint(1, 10 ** 6)) for _ in range(n)]
+    return lambda: [simplify_fraction(num, den) for num, den in pairs]
+
+
+def _build_fraction_sum(n, rng):
+    pairs = [(rng.randint(-1000, 1000), rng.randint(1, 1000)) for _ in range(n)]
+    return lambda: fraction_sum(pairs)
+
+
+def _validator_script(n, rng):
+    """n answers to "Enter 1-100", with roughly one invalid attempt before every fourth."""
+    lines = []
+    for _ in range(n):
+        if rng.random() < 0.25:
+            lines.append(rng.choice(["abc", "500", "4.5", ""]))
+        lines.append(str(rng.randint(1, 100)))
+    return lines
+
+
+def _build_validate_number(n, rng):
+    lines = _validator_script(n, rng)
+
+    def run():
+        with scripted_input(lines):
+            for _ in range(n):
+                validate_number("Enter a number: ", 1, 100, int)
+    return run
+
+
+def _build_validate_many(n, rng):
+    lines = _validator_script(n, rng)
+    validator = NumberValidator(1, 100, int)
+    return lambda: validator.validate_many(lines)
+
+
+def _make_questions(count, rng):
+    return [MCQ(f"Question {i}?", {key: f"Option {key}" for key in range(1, 5)}, rng.randint(1, 4))
+            for i in range(count)]
+
+
+def _build_check_answer(n, rng):
+    questions = _make_questions(n, rng)
+    lines = [str(rng.randint(1, 4)) for _ in range(n)]
+
+    def run():
+        with scripted_input(lines):
+            for question in questions:
+                question.check_answer(1)
+    return run
+
+
+def _build_batch_grade(n, rng):
+    grader = BatchGrader(_make_questions(40, rng))
+    sheets = [[rng.randint(0, 4) or UNANSWERED for _ in range(40)] for _ in range(n)]
+    return lambda: grader.grade(sheets)
+
+
+WORKLOADS: Dict[str, Workload] = {workload.name: workload for workload in [
+    Workload("calculate.list_sum", _build_list_sum),
+    Workload("calculate.list_subtraction", _build_list_subtraction),
+    Workload("calculate.list_divide", _build_list_divide),
+    Workload("calculate.list_product", _build_list_product, 0.1),
+    Workload("calculate.tree_product", _build_tree_product, 0.1),
+    Workload("hcf_lcm.gcd", _build_gcd_pairs),
+    Workload("hcf_lcm.gcd_many", _build_gcd_many),
+    Workload("hcf_lcm.lcm_many", _build_lcm_many),
+    Workload("fractions.simplify_fraction", _build_simplify_fraction),
+    Workload("fractions.fraction_sum", _build_fraction_sum, 0.1),
+    Workload("input_validators.validate_number", _build_validate_number, 0.1),
+    Workload("input_validators.validate_many", _build_validate_many),
+    Workload("framework.check_answer", _build_check_answer, 0.1),
+    Workload("grading.batch_grade", _build_batch_grade, 0.1),
+]}
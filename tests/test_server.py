@@ -0,0 +1,121 @@
+import asyncio
+import re
+import unittest
+from MyQuiz.framework import MCQ
+from MyQuiz.server import QuizServer
+
+PROMPT = b"What is the correct answer?: "
+OPTION_LINE = re.compile(r"^(\d+): (.*)$", re.MULTILINE)
+
+
+def make_questions():
+    return [
+        MCQ("What is 2+2?", {1: "3", 2: "4", 3: "5"}, 2),
+        MCQ("Which planet is known as the Red Planet?", {1: "Earth", 2: "Mars", 3: "Venus"}, 2),
+        MCQ("What is the capital of France?", {1: "Paris", 2: "Rome"}, 1),
+    ]
+
+
+async def play(port, answer_texts, before_answer=()):
+    """
+    Run one session as a loopback client.
+
+    Options are shuffled per session, so each answer is given by its text and
+    looked up in the option lines the server sent. `before_answer` holds
+    invalid inputs sent ahead of the first real answer.
+
+    Returns:
+        str: Everything the server sent.
+    """
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    received = []
+    try:
+        for number, text in enumerate(answer_texts):
+            screen = (await reader.readuntil(PROMPT)).decode()
+            received.append(screen)
+            if number == 0:
+                for line in before_answer:
+                    writer.write(line.encode() + b"\n")
+                    received.append((await reader.readuntil(PROMPT)).decode())
+            options = {option: key for key, option in OPTION_LINE.findall(screen)}
+            writer.write(options[text].encode() + b"\n")
+            await writer.drain()
+        received.append((await reader.read()).decode())
+    finally:
+        writer.close()
+    return "".join(received)
+
+
+class QuizServerTest(unittest.TestCase):
+
+    def run_async(self, coroutine):
+        return asyncio.run(asyncio.wait_for(coroutine, timeout=10))
+
+    def test_full_session(self):
+        async def scenario():
+            server = QuizServer(make_questions(), port=0)
+            port = await server.start()
+            try:
+                transcript = await play(port, ["4", "Earth", "Paris"], before_answer=["abc", "9"])
+            finally:
+                await server.stop()
+            return server, transcript
+
+        server, transcript = self.run_async(scenario())
+        self.assertEqual(server.completed, [(2, 3)])
+        self.assertEqual(server.active_sessions, 0)
+        self.assertIn("What is 2+2?", transcript)
+        self.assertIn("Correct answer!", transcript)
+        self.assertIn("Wrong answer. The correct answer was: Mars", transcript)
+        self.assertIn("Your score: 2 / 3", transcript)
+
+    def test_concurrent_sessions_with_limit(self):
+        async def scenario():
+            server = QuizServer(make_questions, port=0, max_sessions=2)
+            port = await server.start()
+            try:
+                await asyncio.gather(*(play(port, ["4", "Mars", "Paris"]) for _ in range(10)))
+            finally:
+                await server.stop()
+            return server
+
+        server = self.run_async(scenario())
+        self.assertEqual(server.completed, [(3, 3)] * 10)
+
+    def test_client_leaving_early(self):
+        async def scenario():
+            server = QuizServer(make_questions(), port=0)
+            port = await server.start()
+            try:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                await reader.readuntil(PROMPT)
+                writer.close()
+                for _ in range(100):
+                    if not server.active_sessions:
+                        break
+                    await asyncio.sleep(0.01)
+            finally:
+                await server.stop()
+            return server
+
+        server = self.run_async(scenario())
+        self.assertEqual(server.completed, [])
+        self.assertEqual(server.active_sessions, 0)
+
+    def test_server_can_restart_in_a_new_event_loop(self):
+        server = QuizServer(make_questions(), port=0, max_sessions=1)
+
+        async def one_session():
+            port = await server.start()
+            try:
+                await play(port, ["4", "Mars", "Rome"])
+            finally:
+                await server.stop()
+
+        self.run_async(one_session())
+        self.run_async(one_session())
+        self.assertEqual(server.completed, [(2, 3), (2, 3)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import os
+import threading
+import time
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    from PyQt5.QtCore import QCoreApplication
+except ImportError:  # PyQt5 is optional for the rest of the package
+    QCoreApplication = None
+
+from MyMath.HCF_LCM import lcm_many
+
+
+def count_up(n, progress, cancelled):
+    for i in range(n):
+        if cancelled():
+            return "stopped"
+        time.sleep(0.005)
+        progress(i)
+    return n
+
+
+def fail(message):
+    raise ValueError(message)
+
+
+def wait_until(condition, timeout=20.0):
+    """Run the Qt event loop until condition() is true, so queued signals get delivered."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Timed out waiting for the worker pool.")
+        QCoreApplication.processEvents()
+        time.sleep(0.002)
+
+
+@unittest.skipIf(QCoreApplication is None, "PyQt5 is not installed")
+class WorkerPoolTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        from MyQt5.MyWorker import JobQueueFull, WorkerPool
+
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+        cls.WorkerPool, cls.JobQueueFull = WorkerPool, JobQueueFull
+
+    def setUp(self):
+        self.pool = self.WorkerPool(max_threads=1, max_processes=1, max_pending=4)
+        self.events = []
+        for name in ("started", "progress", "result", "error", "cancelled", "finished"):
+            getattr(self.pool, name).connect(
+                lambda *args, name=name: self.events.append((name,) + args))
+
+    def tearDown(self):
+        self.pool.shutdown()
+        QCoreApplication.processEvents()
+
+    def outcome(self, job):
+        """Return the (signal, *args) tuples for a job, progress left out."""
+        return [event for event in self.events if event[1] == job and event[0] != "progress"]
+
+    def finished(self, *jobs):
+        return all(("finished", job) in self.events for job in jobs)
+
+    def test_thread_job_result_and_progress(self):
+        job = self.pool.submit(count_up, 5, with_progress=True)
+        wait_until(lambda: self.finished(job))
+        self.assertEqual(self.outcome(job), [("started", job), ("result", job, 5), ("finished", job)])
+        self.assertEqual([event[2] for event in self.events if event[0] == "progress"], [0, 1, 2, 3, 4])
+        self.assertEqual(self.pool.pending(), 0)
+
+    def test_thread_job_error(self):
+        job = self.pool.submit(fail, "bad input")
+        wait_until(lambda: self.finished(job))
+        (_, _), (name, _, message), (_, _) = self.outcome(job)
+        self.assertEqual(name, "error")
+        self.assertIn("ValueError: bad input", message)
+
+    def test_process_job_result_and_error(self):
+        good = self.pool.submit(lcm_many, list(range(1, 21)), kind="process")
+        bad = self.pool.submit(fail, "in a worker process", kind="process")
+        wait_until(lambda: self.finished(good, bad))
+        self.assertEqual(self.outcome(good), [("result", good, 232792560), ("finished", good)])
+        name, _, message = self.outcome(bad)[0]
+        self.assertEqual(name, "error")
+        self.assertIn("ValueError: in a worker process", message)
+
+    def test_cancel_running_thread_job(self):
+        job = self.pool.submit(count_up, 10000, with_progress=True)
+        wait_until(lambda: ("started", job) in self.events)
+        self.assertTrue(self.pool.cancel(job))
+        wait_until(lambda: self.finished(job))
+        self.assertEqual(self.outcome(job), [("started", job), ("cancelled", job), ("finished", job)])
+
+    def test_cancel_queued_thread_job(self):
+        release = threading.Event()
+        blocker = self.pool.submit(release.wait)
+        queued = self.pool.submit(count_up, 3, with_progress=True)
+        self.assertTrue(self.pool.cancel(queued))
+        release.set()
+        wait_until(lambda: self.finished(blocker, queued))
+        self.assertEqual(self.outcome(queued), [("cancelled", queued), ("finished", queued)])
+        self.assertEqual(self.pool.pending(), 0)
+
+    def test_job_queue_full(self):
+        release = threading.Event()
+        jobs = [self.pool.submit(release.wait) for _ in range(4)]
+        with self.assertRaises(self.JobQueueFull):
+            self.pool.submit(release.wait)
+        release.set()
+        wait_until(lambda: self.finished(*jobs))
+        self.pool.submit(release.wait)  # slots are free again
+
+    def test_invalid_submissions(self):
+        with self.assertRaises(ValueError):
+            self.pool.submit(count_up, 1, kind="fibre")
+        with self.assertRaises(ValueError):
+            self.pool.submit(count_up, 1, kind="process", with_progress=True)
+
+
+if __name__ == "__main__":
+    unittest.main()